@@ -0,0 +1,196 @@
+"""Time each pipeline stage on synthetic orders and flag regressions.
+
+Usage:
+    python -m benchmarks.bench_pipeline [--orders N] [--seed S] [--repeat R]
+        [--output results.json] [--compare baseline.json] [--threshold T]
+        [--no-memory]
+
+Save the results of one commit with --output and pass that file to
+--compare on another; the run exits with status 1 if any stage became
+slower or used more memory than the threshold allows.
+"""
+import argparse
+import io
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from order_pipeline import Analyzer, Exporter, Pipeline, Reader, Transformer, Validator
+from order_pipeline.metrics import peak_memory_bytes
+
+from .bench_serializer import best_of
+from .generate import write_orders
+
+FORMAT_VERSION = 1
+
+
+def run_stages(input_path: Path, output_dir: Path) -> Dict[str, Callable[[], Any]]:
+    """
+    Build one callable per stage, each fed the previous stage's output.
+    
+    The inputs are computed once up front, so timing a stage never
+    includes the work of the stages before it.
+    """
+    raw = Reader(input_path).read()
+    valid = Validator().validate(raw)
+    transformed = Transformer().transform(valid)
+    stats = Analyzer().analyze(transformed)
+    
+    def pipeline() -> None:
+        with redirect_stdout(io.StringIO()):
+            Pipeline(str(input_path), str(output_dir / 'streamed.json'), streaming=True).run()
+    
+    return {
+        'read': lambda: Reader(input_path).read(),
+        'validate': lambda: Validator().validate(raw),
+        'transform': lambda: Transformer().transform(valid),
+        'analyze': lambda: Analyzer().analyze(transformed),
+        'export': lambda: Exporter(str(output_dir / 'exported.json')).export(transformed, stats),
+        'pipeline': pipeline,
+    }
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    """Run func once and return the peak bytes it allocated."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def current_commit() -> Optional[str]:
+    """Get the checked-out git commit, if any."""
+    try:
+        result = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                                capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def benchmark(orders: int, seed: int = 0, repeat: int = 3, memory: bool = True) -> Dict[str, Any]:
+    """
+    Benchmark every stage on a generated input file.
+    
+    Args:
+        orders: Number of synthetic orders
+        seed: Generator seed
+        repeat: Timed runs per stage; the fastest is kept
+        memory: Also measure each stage's peak allocations with
+            tracemalloc, in a separate untimed run
+        
+    Returns:
+        Results in the format written by --output
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        directory = Path(directory)
+        input_path = write_orders(directory / 'orders.json', orders, seed=seed)
+        stages = {}
+        for name, func in run_stages(input_path, directory).items():
+            seconds = best_of(repeat, func)
+            stages[name] = {
+                'seconds': seconds,
+                'orders_per_second': orders / seconds if seconds else None,
+                'peak_memory_bytes': peak_memory(func) if memory else None
+            }
+    
+    return {
+        'format_version': FORMAT_VERSION,
+        'commit': current_commit(),
+        'python': platform.python_version(),
+        'orders': orders,
+        'seed': seed,
+        'repeat': repeat,
+        'stages': stages,
+        'max_rss_bytes': peak_memory_bytes()
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any],
+            threshold: float) -> List[str]:
+    """
+    Compare results against a baseline run.
+    
+    Args:
+        results: Results of this run
+        baseline: Results of an earlier run, e.g. on the main branch
+        threshold: Allowed relative slowdown or memory growth (0.1 = 10%)
+        
+    Returns:
+        Descriptions of the regressions found
+    """
+    if baseline.get('orders') != results['orders']:
+        print(f"Warning: baseline used {baseline.get('orders')} orders, "
+              f"this run {results['orders']}")
+    
+    regressions = []
+    print(f"{'stage':<12}{'baseline':>10}{'current':>10}{'change':>9}"
+          f"{'memory':>10}")
+    for name, current in results['stages'].items():
+        previous = baseline.get('stages', {}).get(name)
+        if previous is None:
+            continue
+        time_change = current['seconds'] / previous['seconds'] - 1
+        memory_change = None
+        if current['peak_memory_bytes'] and previous.get('peak_memory_bytes'):
+            memory_change = current['peak_memory_bytes'] / previous['peak_memory_bytes'] - 1
+        
+        memory_text = f"{memory_change:+.0%}" if memory_change is not None else '-'
+        print(f"{name:<12}{previous['seconds']:>10.3f}{current['seconds']:>10.3f}"
+              f"{time_change:>+9.0%}{memory_text:>10}")
+        if time_change > threshold:
+            regressions.append(f"{name} is {time_change:.0%} slower")
+        if memory_change is not None and memory_change > threshold:
+            regressions.append(f"{name} uses {memory_change:.0%} more memory")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--orders', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--output', help="write results as JSON to this file")
+    parser.add_argument('--compare', help="results file of an earlier run")
+    parser.add_argument('--threshold', type=float, default=0.10)
+    parser.add_argument('--no-memory', action='store_true',
+                        help="skip the tracemalloc runs")
+    args = parser.parse_args()
+    
+    results = benchmark(args.orders, args.seed, args.repeat, memory=not args.no_memory)
+    
+    print(f"{args.orders} orders, best of {args.repeat} (commit {results['commit']})")
+    print(f"{'stage':<12}{'seconds':>10}{'orders/s':>12}{'peak MiB':>10}")
+    for name, stage in results['stages'].items():
+        peak = stage['peak_memory_bytes']
+        peak_text = f"{peak / 2 ** 20:.1f}" if peak is not None else '-'
+        print(f"{name:<12}{stage['seconds']:>10.3f}{stage['orders_per_second']:>12,.0f}"
+              f"{peak_text:>10}")
+    if results['max_rss_bytes'] is not None:
+        print(f"max RSS: {results['max_rss_bytes'] / 2 ** 20:.1f} MiB")
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        print(f"\nCompared with {args.compare} (commit {baseline.get('commit')}):")
+        regressions = compare(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
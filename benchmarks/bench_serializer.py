@@ -0,0 +1,73 @@
+"""Compare JSON backends for reading and writing order files.
+
+Usage:
+    python -m benchmarks.bench_serializer [--orders N] [--repeat R]
+"""
+import argparse
+import json
+import time
+
+from order_pipeline.serializer import BACKENDS, get_backend
+
+
+def make_orders(count: int) -> list:
+    """Build transformed-looking orders for serialization."""
+    statuses = ['paid', 'pending', 'refunded']
+    return [
+        {
+            'order_id': f'ORD{i:07d}',
+            'timestamp': '2025-10-19T08:00:00Z',
+            'item': f'Item {i % 500}',
+            'quantity': float(i % 7 + 1),
+            'price': round(1.5 + (i % 1000) * 0.37, 2),
+            'payment_status': statuses[i % 3],
+            'total': round((i % 7 + 1) * (1.5 + (i % 1000) * 0.37), 2)
+        }
+        for i in range(count)
+    ]
+
+
+def best_of(repeat: int, func) -> float:
+    """Run func repeat times and return the fastest wall time."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--orders', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    document = {'orders': make_orders(args.orders)}
+    text = json.dumps(document)
+    
+    # What Exporter and Reader did before backends; rows are compared to these
+    dump_baseline = best_of(args.repeat,
+                            lambda: json.dumps(document, indent=2, ensure_ascii=False))
+    load_baseline = best_of(args.repeat, lambda: json.loads(text))
+    print(f"{args.orders} orders, best of {args.repeat}")
+    print(f"{'backend':<10}{'operation':<16}{'seconds':>10}{'speedup':>10}")
+    
+    for name, (_, module) in BACKENDS.items():
+        if module is None:
+            continue
+        backend = get_backend(name)
+        rows = [
+            ('dumps pretty', lambda: backend.dumps(document, True)),
+            ('dumps compact', lambda: backend.dumps(document, False)),
+            ('loads', lambda: backend.loads(text)),
+        ]
+        for operation, func in rows:
+            elapsed = best_of(args.repeat, func)
+            baseline = dump_baseline if operation.startswith('dumps') else load_baseline
+            speedup = baseline / elapsed
+            print(f"{name:<10}{operation:<16}{elapsed:>10.3f}{speedup:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
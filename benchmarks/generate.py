@@ -0,0 +1,175 @@
+"""Generate deterministic synthetic order files for benchmarks.
+
+Usage:
+    python -m benchmarks.generate OUTPUT [--orders N] [--seed S]
+        [--invalid-rate R] [--dirty-rate R]
+
+OUTPUT ending in .jsonl writes JSON Lines, anything else a JSON array;
+both are written one order at a time, so 10M orders need little memory.
+"""
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+ITEMS = ['Widget', 'Gadget', 'Gizmo', 'Doohickey', 'Thingamajig', 'Sprocket',
+         'Bolt', 'Cable', 'Adapter', 'Charger']
+STATUSES = ['paid', 'pending', 'refunded']
+
+# Price spellings seen in storefront exports
+PRICE_FORMATS = [
+    lambda price: price,
+    lambda price: f'${price:.2f}',
+    lambda price: f'N{price:.0f}',
+    lambda price: f'{price:.2f}',
+    lambda price: f' ${price:,.2f} ',
+]
+
+# Ways a row can fail validation, one per Validator rule
+INVALID_KINDS = ['missing', 'zero_quantity', 'bad_quantity', 'negative_price',
+                 'bad_price', 'bad_total']
+
+
+def generate_orders(count: int, seed: int = 0, invalid_rate: float = 0.05,
+                    dirty_rate: float = 0.3) -> Iterator[Dict[str, Any]]:
+    """
+    Generate raw orders like those the pipeline reads.
+    
+    The same arguments always produce the same orders, so results from
+    different commits are measured on identical input.
+    
+    Args:
+        count: Number of orders
+        seed: Random seed
+        invalid_rate: Share of orders that fail validation
+        dirty_rate: Share of valid orders with string quantities, padded
+            item names or inconsistently cased payment statuses
+        
+    Yields:
+        Order dictionaries
+    
+    Raises:
+        ValueError: If a rate is not between 0 and 1
+    """
+    _check_rate('invalid_rate', invalid_rate)
+    _check_rate('dirty_rate', dirty_rate)
+    rng = random.Random(seed)
+    
+    for i in range(count):
+        quantity = rng.randint(1, 10)
+        price = round(rng.uniform(1, 5000), 2)
+        order = {
+            'order_id': f'ORD{i:08d}',
+            'timestamp': f'2025-10-{rng.randint(1, 31):02d}T{rng.randint(0, 23):02d}:'
+                         f'{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}Z',
+            'item': rng.choice(ITEMS),
+            'quantity': quantity,
+            'price': rng.choice(PRICE_FORMATS)(price),
+            'payment_status': rng.choice(STATUSES),
+            'total': round(quantity * price, 2)
+        }
+        
+        if rng.random() < dirty_rate:
+            order['quantity'] = rng.choice([str(quantity), f' {quantity} ', f'{quantity} pcs'])
+            order['item'] = f"  {order['item'].lower()}   {rng.choice(['', 'XL', 'pro'])} "
+            order['payment_status'] = rng.choice([
+                order['payment_status'].upper(),
+                f" {order['payment_status'].title()} ",
+                'unknown'
+            ])
+        
+        if rng.random() < invalid_rate:
+            _make_invalid(order, rng.choice(INVALID_KINDS))
+        
+        yield order
+
+
+def write_orders(path: str, count: int, **options: Any) -> Path:
+    """
+    Write generated orders to a JSON or JSON Lines file.
+    
+    Args:
+        path: Output file; .jsonl or .ndjson for JSON Lines
+        count: Number of orders
+        **options: Passed on to generate_orders()
+        
+    Returns:
+        Path of the written file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    json_lines = path.suffix.lower() in ('.jsonl', '.ndjson')
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        if not json_lines:
+            f.write('[')
+        for i, order in enumerate(generate_orders(count, **options)):
+            if json_lines:
+                f.write(json.dumps(order) + '\n')
+            else:
+                f.write((',\n' if i else '\n') + json.dumps(order))
+        if not json_lines:
+            f.write('\n]\n')
+    return path
+
+
+def _check_rate(name: str, rate: float) -> None:
+    """Check that a rate is a share between 0 and 1."""
+    # Written so that NaN fails too
+    if not 0 <= rate <= 1:
+        raise ValueError(f"{name} must be between 0 and 1, got {rate}")
+
+
+def _rate(text: str) -> float:
+    """Parse a rate command-line argument."""
+    rate = float(text)
+    try:
+        _check_rate('rate', rate)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    return rate
+
+
+class _Once(argparse.Action):
+    """Store an option's value, rejecting it if given more than once."""
+    
+    def __call__(self, parser, namespace, values, option_string=None):
+        if self.dest in getattr(namespace, '_seen', set()):
+            parser.error(f"{option_string} given more than once")
+        namespace._seen = getattr(namespace, '_seen', set()) | {self.dest}
+        setattr(namespace, self.dest, values)
+
+
+def _make_invalid(order: Dict[str, Any], kind: str) -> None:
+    """Break an order in the given way."""
+    if kind == 'missing':
+        del order['item']
+    elif kind == 'zero_quantity':
+        order['quantity'] = 0
+    elif kind == 'bad_quantity':
+        order['quantity'] = 'several'
+    elif kind == 'negative_price':
+        order['price'] = -abs(order['total'])
+    elif kind == 'bad_price':
+        order['price'] = 'call for price'
+    else:
+        order['total'] = 'n/a'
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('output')
+    parser.add_argument('--orders', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--invalid-rate', type=_rate, default=0.05, action=_Once)
+    parser.add_argument('--dirty-rate', type=_rate, default=0.3, action=_Once)
+    args = parser.parse_args(argv)
+    
+    path = write_orders(args.output, args.orders, seed=args.seed,
+                        invalid_rate=args.invalid_rate, dirty_rate=args.dirty_rate)
+    print(f"Wrote {args.orders} orders to {path}")
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -2,18 +2,42 @@
 
 __version__ = "1.0.0"
 
+from .order import Order
 from .reader import Reader
+from .multi_reader import MultiReader
 from .validator import Validator
 from .transformer import Transformer
-from .analyzer import Analyzer
+from .analyzer import Analyzer, AnalyzerAccumulator, GroupAccumulator, DistributionAccumulator
 from .exporter import Exporter
+from .deduplicator import Deduplicator
+from .validate_transform import ValidateTransform
+from .columnar import ColumnarEngine, OrderColumns
+from .metrics import MetricsHook, MetricsRecorder, JsonEmitter, PrometheusEmitter, LoggingHook
+from .result_cache import ResultCache
 from .pipeline import Pipeline
+from .async_pipeline import AsyncPipeline
 
 __all__ = [
+    'Order',
     'Reader',
+    'MultiReader',
     'Validator',
     'Transformer',
     'Analyzer',
+    'AnalyzerAccumulator',
+    'GroupAccumulator',
+    'DistributionAccumulator',
     'Exporter',
-    'Pipeline'
+    'Deduplicator',
+    'ValidateTransform',
+    'ColumnarEngine',
+    'OrderColumns',
+    'MetricsHook',
+    'MetricsRecorder',
+    'JsonEmitter',
+    'PrometheusEmitter',
+    'LoggingHook',
+    'ResultCache',
+    'Pipeline',
+    'AsyncPipeline'
 ]
\ No newline at end of file
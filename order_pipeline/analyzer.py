@@ -1,51 +1,795 @@
-from typing import List, Dict, Any
+import json
+import math
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence
 
+from .sketches import KLLSketch, SpaceSaving
+from .timestamps import BUCKETS, TimestampParser
 
-class Analyzer:
-    """Analyzes order data and computes statistics."""
+# Bucket for orders whose timestamp is missing or cannot be parsed
+UNKNOWN_BUCKET = 'unknown'
+
+
+class AnalyzerAccumulator:
+    """Mergeable running statistics for a set of orders."""
     
-    def analyze(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def __init__(self, time_bucket: Optional[str] = None,
+                 groups: Optional['GroupAccumulator'] = None,
+                 distribution: Optional['DistributionAccumulator'] = None):
         """
-        Analyze order data.
+        Initialize an empty accumulator.
         
         Args:
-            data: List of transformed orders
+            time_bucket: Also keep revenue and payment status counts per
+                'hour' or 'day' of the order timestamps
+            groups: Empty group-by to feed every order to as well
+            distribution: Empty distribution to add every order total to
+        """
+        self.total_orders = 0
+        self.payment_counts = _empty_status_counts()
+        # Non-overlapping partial sums whose exact total is the revenue
+        self._partials: List[float] = []
+        # Infinities and NaNs cannot be tracked exactly, so add them last
+        self._non_finite = 0.0
+        self.time_bucket = time_bucket
+        # One accumulator per hour or day seen, so memory grows with the
+        # number of buckets rather than the number of orders
+        self.buckets: Dict[str, 'AnalyzerAccumulator'] = {}
+        self._timestamps = TimestampParser() if time_bucket is not None else None
+        self.groups = groups
+        self.distribution = distribution
+    
+    @property
+    def total_revenue(self) -> float:
+        """Revenue seen so far, before rounding to cents."""
+        return math.fsum(self._partials) + self._non_finite
+    
+    def update(self, order: Dict[str, Any]) -> 'AnalyzerAccumulator':
+        """
+        Add a single transformed order.
+        
+        Args:
+            order: Transformed order with a numeric total
+            
+        Returns:
+            The accumulator, for chaining
+        """
+        self.total_orders += 1
+        self._add_revenue(order['total'])
+        _add_payment_status(self.payment_counts, order)
+        if self.time_bucket is not None:
+            self._bucket(self.bucket_key(order.get('timestamp'))).update(order)
+        if self.groups is not None:
+            self.groups.update(order)
+        if self.distribution is not None:
+            self.distribution.update(order['total'])
+        return self
+    
+    def remove(self, order: Dict[str, Any]) -> 'AnalyzerAccumulator':
+        """
+        Take back a previously added order, for example one that changed.
+        
+        Sums are exact, so removing an order leaves the same state as never
+        having added it.
+        
+        Args:
+            order: Transformed order that was passed to update()
+            
+        Returns:
+            The accumulator, for chaining
+            
+        Raises:
+            ValueError: If a distribution or approximate groups are kept,
+                which cannot be undone
+        """
+        # Check before changing anything, so a refused removal leaves no trace
+        if self.distribution is not None:
+            raise ValueError("Orders cannot be removed from a distribution")
+        if self.groups is not None and self.groups.approximate:
+            raise ValueError("Orders cannot be removed from approximate groups")
+        
+        self.total_orders -= 1
+        self._add_revenue(-order['total'])
+        counts = _empty_status_counts()
+        _add_payment_status(counts, order)
+        for status, count in counts.items():
+            self.payment_counts[status] -= count
+        if self.time_bucket is not None:
+            key = self.bucket_key(order.get('timestamp'))
+            bucket = self._bucket(key).remove(order)
+            if not bucket.total_orders:
+                del self.buckets[key]
+        if self.groups is not None:
+            self.groups.remove(order)
+        return self
+    
+    def add_totals(self, count: int, revenue: float, payment_counts: Dict[str, int],
+                   bucket: Optional[str] = None) -> 'AnalyzerAccumulator':
+        """
+        Add pre-aggregated totals for a batch of orders.
+        
+        Groups and the distribution are not updated; add to them directly.
+        
+        Args:
+            count: Number of orders in the batch
+            revenue: Sum of the batch's totals
+            payment_counts: Orders per payment status in the batch
+            bucket: Time bucket every order of the batch falls in, when the
+                accumulator keeps time buckets
+            
+        Returns:
+            The accumulator, for chaining
+        """
+        self.total_orders += count
+        self._add_revenue(revenue)
+        for status, status_count in payment_counts.items():
+            self.payment_counts[status] = self.payment_counts.get(status, 0) + status_count
+        if self.time_bucket is not None:
+            self._bucket(bucket or UNKNOWN_BUCKET).add_totals(count, revenue, payment_counts)
+        return self
+    
+    def bucket_key(self, timestamp: Any) -> str:
+        """
+        Get the time bucket a timestamp falls in.
+        
+        Args:
+            timestamp: An order's raw timestamp value
+            
+        Returns:
+            The bucket's key, or UNKNOWN_BUCKET if the timestamp is missing
+            or cannot be parsed
+        """
+        key = self._timestamps.bucket(timestamp, self.time_bucket)
+        return UNKNOWN_BUCKET if key is None else key
+    
+    def merge(self, other: 'AnalyzerAccumulator') -> 'AnalyzerAccumulator':
+        """
+        Fold in the statistics of another accumulator.
+        
+        Sums are kept exactly, so merging partial results from any split of
+        the input gives the same final statistics as a single pass.
+        
+        Args:
+            other: Accumulator for a different set of orders
             
+        Returns:
+            The accumulator, for chaining
+        """
+        self.total_orders += other.total_orders
+        for value in other._partials:
+            self._add_revenue(value)
+        self._non_finite += other._non_finite
+        for status, count in other.payment_counts.items():
+            self.payment_counts[status] = self.payment_counts.get(status, 0) + count
+        if self.time_bucket is not None:
+            for key, bucket in other.buckets.items():
+                self._bucket(key).merge(bucket)
+        if self.groups is not None and other.groups is not None:
+            self.groups.merge(other.groups)
+        if self.distribution is not None and other.distribution is not None:
+            self.distribution.merge(other.distribution)
+        return self
+    
+    def finalize(self) -> Dict[str, Any]:
+        """
+        Round the running totals into the statistics returned by Analyzer.
+        
         Returns:
             Dictionary with analysis results
         """
-        if not data:
-            return {
+        if not self.total_orders:
+            stats = {
                 'total_orders': 0,
                 'total_revenue': 0.0,
                 'average_revenue': 0.0,
-                'payment_status_counts': {
-                    'paid': 0,
-                    'pending': 0,
-                    'refunded': 0
-                }
+                'payment_status_counts': dict(self.payment_counts)
+            }
+        else:
+            total_revenue = self.total_revenue
+            stats = {
+                'total_orders': self.total_orders,
+                'total_revenue': round(total_revenue, 2),
+                'average_revenue': round(total_revenue / self.total_orders, 2),
+                'payment_status_counts': dict(self.payment_counts)
+            }
+        
+        if self.time_bucket is not None:
+            stats['time_buckets'] = {
+                key: self.buckets[key].finalize() for key in sorted(self.buckets)
+            }
+        if self.groups is not None:
+            stats['groups'] = self.groups.finalize()
+        if self.distribution is not None:
+            stats['total_distribution'] = self.distribution.finalize()
+        return stats
+    
+    def to_state(self) -> Dict[str, Any]:
+        """Get the exact running state as JSON-serializable data."""
+        state = {
+            'total_orders': self.total_orders,
+            'partials': list(self._partials),
+            'non_finite': self._non_finite,
+            'payment_counts': dict(self.payment_counts)
+        }
+        if self.time_bucket is not None:
+            state['time_bucket'] = self.time_bucket
+            state['buckets'] = {key: bucket.to_state() for key, bucket in self.buckets.items()}
+        if self.groups is not None:
+            state['groups'] = self.groups.to_state()
+        if self.distribution is not None:
+            state['distribution'] = self.distribution.to_state()
+        return state
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'AnalyzerAccumulator':
+        """Rebuild an accumulator saved with to_state()."""
+        groups = state.get('groups')
+        distribution = state.get('distribution')
+        accumulator = cls(
+            state.get('time_bucket'),
+            GroupAccumulator.from_state(groups) if groups is not None else None,
+            DistributionAccumulator.from_state(distribution) if distribution is not None else None
+        )
+        accumulator.total_orders = state['total_orders']
+        accumulator._partials = list(state['partials'])
+        accumulator._non_finite = state['non_finite']
+        accumulator.payment_counts = dict(state['payment_counts'])
+        accumulator.buckets = {key: cls.from_state(bucket)
+                               for key, bucket in state.get('buckets', {}).items()}
+        return accumulator
+    
+    def _bucket(self, key: str) -> 'AnalyzerAccumulator':
+        """Get the accumulator of a time bucket, creating it if needed."""
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = AnalyzerAccumulator()
+        return bucket
+    
+    def _add_revenue(self, value: float) -> None:
+        """Add a value to the exact partial sums (Shewchuk's algorithm)."""
+        x = float(value)
+        if not math.isfinite(x):
+            self._non_finite += x
+            return
+        
+        _add_exact(self._partials, x)
+
+
+class GroupAccumulator:
+    """One-pass hash aggregation of orders, quantity and revenue per key."""
+    
+    RANKINGS = ('revenue', 'quantity', 'orders')
+    
+    def __init__(self, field: str, top_n: Optional[int] = None, rank_by: str = 'revenue',
+                 max_groups: Optional[int] = None):
+        """
+        Initialize an empty group-by.
+        
+        Args:
+            field: Order field to group by, e.g. 'item' or 'payment_status'
+            top_n: Report only the top_n groups
+            rank_by: 'revenue', 'quantity' or 'orders', used to rank groups
+            max_groups: Track at most this many keys with the Space-Saving
+                algorithm instead of every key; the rank_by weight of each
+                reported group is then an estimate with an error bound
+            
+        Raises:
+            ValueError: If rank_by is not supported
+        """
+        if rank_by not in self.RANKINGS:
+            raise ValueError(f"Unsupported ranking: {rank_by}")
+        
+        self.field = field
+        self.top_n = top_n
+        self.rank_by = rank_by
+        self.max_groups = max_groups
+        # Key -> [orders, quantity, revenue] for exact grouping
+        self.groups: Dict[Any, List[Any]] = {}
+        self.sketch = SpaceSaving(max_groups) if max_groups is not None else None
+    
+    @property
+    def approximate(self) -> bool:
+        """Whether groups are tracked with a bounded Space-Saving sketch."""
+        return self.sketch is not None
+    
+    def update(self, order: Dict[str, Any]) -> 'GroupAccumulator':
+        """
+        Add a single transformed order to its group.
+        
+        Args:
+            order: Transformed order with numeric quantity and total
+            
+        Returns:
+            The accumulator, for chaining
+        """
+        return self.add_totals(_group_key(order.get(self.field)), 1,
+                               order['quantity'], order['total'])
+    
+    def remove(self, order: Dict[str, Any]) -> 'GroupAccumulator':
+        """
+        Take back a previously added order.
+        
+        Args:
+            order: Transformed order that was passed to update()
+            
+        Returns:
+            The accumulator, for chaining
+            
+        Raises:
+            ValueError: If groups are approximate, which cannot be undone
+        """
+        if self.approximate:
+            raise ValueError("Orders cannot be removed from approximate groups")
+        
+        key = _group_key(order.get(self.field))
+        group = self._group(key)
+        group[0] -= 1
+        group[1].add(-order['quantity'])
+        group[2].add(-order['total'])
+        if not group[0]:
+            del self.groups[key]
+        return self
+    
+    def add_totals(self, key: Any, count: int, quantity: float,
+                   revenue: float) -> 'GroupAccumulator':
+        """
+        Add pre-aggregated totals for orders sharing a key.
+        
+        Args:
+            key: Group key
+            count: Number of orders
+            quantity: Sum of their quantities
+            revenue: Sum of their totals
+            
+        Returns:
+            The accumulator, for chaining
+        """
+        if self.sketch is not None:
+            weights = {'revenue': revenue, 'quantity': quantity, 'orders': count}
+            self.sketch.update(key, float(weights[self.rank_by]))
+            return self
+        
+        group = self._group(key)
+        group[0] += count
+        group[1].add(quantity)
+        group[2].add(revenue)
+        return self
+    
+    def merge(self, other: 'GroupAccumulator') -> 'GroupAccumulator':
+        """
+        Fold in the groups of another accumulator.
+        
+        Args:
+            other: Accumulator for a different set of orders
+            
+        Returns:
+            The accumulator, for chaining
+        """
+        if self.sketch is not None:
+            self.sketch.merge(other.sketch)
+            return self
+        
+        for key, (count, quantity, revenue) in other.groups.items():
+            group = self._group(key)
+            group[0] += count
+            group[1].merge(quantity)
+            group[2].merge(revenue)
+        return self
+    
+    def finalize(self) -> Dict[str, Any]:
+        """
+        Rank the groups.
+        
+        Returns:
+            Dictionary with the field, ranking and the groups, heaviest first
+        """
+        result = {'field': self.field, 'rank_by': self.rank_by}
+        
+        if self.sketch is not None:
+            result['approximate'] = True
+            result['groups'] = [
+                {'key': key, self.rank_by: round(weight, 2), 'error': round(error, 2)}
+                for key, weight, error in self.sketch.top(self.top_n)
+            ]
+            return result
+        
+        rows = [
+            {'key': key, 'orders': count, 'quantity': round(quantity.value, 2),
+             'revenue': round(revenue.value, 2)}
+            for key, (count, quantity, revenue) in self.groups.items()
+        ]
+        rows.sort(key=lambda row: (-row[self.rank_by], str(row['key'])))
+        result['distinct_keys'] = len(rows)
+        result['groups'] = rows[:self.top_n]
+        return result
+    
+    def to_state(self) -> Dict[str, Any]:
+        """Get the exact running state as JSON-serializable data."""
+        state = {
+            'field': self.field,
+            'top_n': self.top_n,
+            'rank_by': self.rank_by,
+            'max_groups': self.max_groups
+        }
+        if self.sketch is not None:
+            state['sketch'] = self.sketch.to_state()
+        else:
+            state['groups'] = [[key, count, quantity.to_state(), revenue.to_state()]
+                               for key, (count, quantity, revenue) in self.groups.items()]
+        return state
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'GroupAccumulator':
+        """Rebuild an accumulator saved with to_state()."""
+        groups = cls(state['field'], state['top_n'], state['rank_by'], state['max_groups'])
+        if 'sketch' in state:
+            groups.sketch = SpaceSaving.from_state(state['sketch'])
+        else:
+            groups.groups = {
+                key: [count, _ExactSum.from_state(quantity), _ExactSum.from_state(revenue)]
+                for key, count, quantity, revenue in state['groups']
             }
+        return groups
+    
+    def _group(self, key: Any) -> List[Any]:
+        """Get the totals of a group, creating them if needed."""
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = [0, _ExactSum(), _ExactSum()]
+        return group
+
+
+class DistributionAccumulator:
+    """Mergeable min, max, variance and quantile estimates of order totals."""
+    
+    QUANTILES = (0.5, 0.9, 0.99)
+    
+    def __init__(self, sketch_size: int = 200):
+        """
+        Initialize an empty distribution.
+        
+        Min, max, mean and variance (Welford's algorithm) are exact; the
+        quantiles come from a KLL sketch.
+        
+        Args:
+            sketch_size: KLL sketch k; larger is more accurate but uses more
+                memory
+        """
+        self.count = 0
+        self.mean = 0.0
+        # Sum of squared differences from the mean
+        self.m2 = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.sketch = KLLSketch(sketch_size)
+    
+    def update(self, value: float) -> 'DistributionAccumulator':
+        """
+        Add a single value.
+        
+        Args:
+            value: Order total
+            
+        Returns:
+            The accumulator, for chaining
+        """
+        x = float(value)
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        if self.min is None or x < self.min:
+            self.min = x
+        if self.max is None or x > self.max:
+            self.max = x
+        self.sketch.update(x)
+        return self
+    
+    def update_many(self, values: Sequence[float], mean: float,
+                    m2: float) -> 'DistributionAccumulator':
+        """
+        Add a batch of values whose moments were computed in bulk, e.g. by numpy.
+        
+        The moments are combined as merge() does; the values go to the sketch
+        in order, so its estimates are the same as update() on each value.
+        
+        Args:
+            values: The batch's values, in input order
+            mean: Mean of the batch
+            m2: Sum of squared differences of the batch from its mean
+            
+        Returns:
+            The accumulator, for chaining
+        """
+        if not len(values):
+            return self
+        self._merge_moments(len(values), mean, m2, min(values), max(values))
+        self.sketch.update_many(values)
+        return self
+    
+    def merge(self, other: 'DistributionAccumulator') -> 'DistributionAccumulator':
+        """
+        Fold in the distribution of another set of values.
         
-        total_revenue = sum(order['total'] for order in data)
-        payment_counts = self._count_payment_statuses(data)
+        Args:
+            other: Accumulator for different values
+            
+        Returns:
+            The accumulator, for chaining
+        """
+        if not other.count:
+            return self
+        
+        self._merge_moments(other.count, other.mean, other.m2, other.min, other.max)
+        self.sketch.merge(other.sketch)
+        return self
+    
+    def finalize(self) -> Dict[str, Any]:
+        """
+        Summarize the distribution.
         
+        Returns:
+            Dictionary with min, max, mean, sample variance and standard
+            deviation, and p50, p90 and p99 estimates
+        """
+        variance = self.m2 / (self.count - 1) if self.count > 1 else 0.0
+        stats = {
+            'min': round(self.min, 2) if self.count else 0.0,
+            'max': round(self.max, 2) if self.count else 0.0,
+            'mean': round(self.mean, 2),
+            'variance': round(variance, 2),
+            'stddev': round(math.sqrt(variance), 2)
+        }
+        for q in self.QUANTILES:
+            estimate = self.sketch.quantile(q)
+            stats[f"p{round(q * 100):d}"] = round(estimate, 2) if estimate is not None else 0.0
+        return stats
+    
+    def to_state(self) -> Dict[str, Any]:
+        """Get the running state as JSON-serializable data."""
         return {
-            'total_orders': len(data),
-            'total_revenue': round(total_revenue, 2),
-            'average_revenue': round(total_revenue / len(data), 2),
-            'payment_status_counts': payment_counts
+            'count': self.count,
+            'mean': self.mean,
+            'm2': self.m2,
+            'min': self.min,
+            'max': self.max,
+            'sketch': self.sketch.to_state()
         }
     
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'DistributionAccumulator':
+        """Rebuild an accumulator saved with to_state()."""
+        distribution = cls()
+        distribution.count = state['count']
+        distribution.mean = state['mean']
+        distribution.m2 = state['m2']
+        distribution.min = state['min']
+        distribution.max = state['max']
+        distribution.sketch = KLLSketch.from_state(state['sketch'])
+        return distribution
+    
+    def _merge_moments(self, count: int, mean: float, m2: float,
+                       minimum: float, maximum: float) -> None:
+        """Combine count, mean, m2, min and max with another set's (Chan et al.)."""
+        total = self.count + count
+        delta = mean - self.mean
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.mean += delta * count / total
+        self.count = total
+        self.min = minimum if self.min is None else min(self.min, minimum)
+        self.max = maximum if self.max is None else max(self.max, maximum)
+
+
+class _ExactSum:
+    """Running sum kept as exact partials, like AnalyzerAccumulator's revenue."""
+    
+    __slots__ = ('partials', 'non_finite')
+    
+    def __init__(self):
+        self.partials: List[float] = []
+        self.non_finite = 0.0
+    
+    @property
+    def value(self) -> float:
+        """Sum so far."""
+        return math.fsum(self.partials) + self.non_finite
+    
+    def add(self, value: float) -> None:
+        """Add a value."""
+        x = float(value)
+        if math.isfinite(x):
+            _add_exact(self.partials, x)
+        else:
+            self.non_finite += x
+    
+    def merge(self, other: '_ExactSum') -> None:
+        """Add another sum's partials."""
+        for value in other.partials:
+            _add_exact(self.partials, value)
+        self.non_finite += other.non_finite
+    
+    def to_state(self) -> List[Any]:
+        """Get the partials and non-finite part as JSON-serializable data."""
+        return [list(self.partials), self.non_finite]
+    
+    @classmethod
+    def from_state(cls, state: List[Any]) -> '_ExactSum':
+        """Rebuild a sum saved with to_state()."""
+        total = cls()
+        total.partials = list(state[0])
+        total.non_finite = state[1]
+        return total
+
+
+class Analyzer:
+    """Analyzes order data and computes statistics."""
+    
+    def __init__(self, time_bucket: Optional[str] = None, group_by: Optional[str] = None,
+                 top_n: Optional[int] = None, rank_by: str = 'revenue',
+                 max_groups: Optional[int] = None, distribution: bool = False,
+                 sketch_size: int = 200):
+        """
+        Initialize analyzer.
+        
+        Args:
+            time_bucket: 'hour' or 'day' to add per-bucket revenue and
+                payment status counts to the statistics as time_buckets
+            group_by: Order field whose per-value orders, quantity and
+                revenue are added to the statistics as groups
+            top_n: Report only the top_n groups
+            rank_by: 'revenue', 'quantity' or 'orders', used to rank groups
+            max_groups: Bound the memory of group_by to this many keys with
+                an approximate Space-Saving top-K
+            distribution: Add min, max, variance and p50/p90/p99 of the
+                order totals to the statistics as total_distribution
+            sketch_size: KLL sketch k for the percentiles, trading memory
+                for accuracy
+            
+        Raises:
+            ValueError: If time_bucket is not 'hour' or 'day', or rank_by
+                is not supported
+        """
+        if time_bucket is not None and time_bucket not in BUCKETS:
+            raise ValueError(f"Unsupported time bucket: {time_bucket}")
+        if rank_by not in GroupAccumulator.RANKINGS:
+            raise ValueError(f"Unsupported ranking: {rank_by}")
+        
+        self.time_bucket = time_bucket
+        self.group_by_field = group_by
+        self.top_n = top_n
+        self.rank_by = rank_by
+        self.max_groups = max_groups
+        self.distribution = distribution
+        self.sketch_size = sketch_size
+        self.accumulator = self.new_accumulator()
+    
+    def analyze(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Analyze order data.
+        
+        Args:
+            data: List of transformed orders
+            
+        Returns:
+            Dictionary with analysis results
+        """
+        accumulator = self.new_accumulator()
+        
+        for order in data:
+            accumulator.update(order)
+        
+        return accumulator.finalize()
+    
+    def group_by(self, data: Iterable[Dict[str, Any]], field: str,
+                 top_n: Optional[int] = None, rank_by: str = 'revenue',
+                 max_groups: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Aggregate orders, quantity and revenue per value of a field.
+        
+        Args:
+            data: Iterable of transformed orders
+            field: Field to group by, e.g. 'item' or 'payment_status'
+            top_n: Return only the top_n groups
+            rank_by: 'revenue', 'quantity' or 'orders', used to rank groups
+            max_groups: Track at most this many keys (approximate top-K)
+            
+        Returns:
+            Dictionary with the groups, heaviest first
+        """
+        groups = GroupAccumulator(field, top_n, rank_by, max_groups)
+        
+        for order in data:
+            groups.update(order)
+        
+        return groups.finalize()
+    
+    def new_accumulator(self) -> AnalyzerAccumulator:
+        """
+        Create an empty accumulator for chunked or distributed analysis.
+        
+        Feed each chunk's orders to its own accumulator with update(),
+        combine the results with merge() and call finalize() once at the end.
+        
+        Returns:
+            Empty accumulator
+        """
+        groups = (GroupAccumulator(self.group_by_field, self.top_n, self.rank_by, self.max_groups)
+                  if self.group_by_field is not None else None)
+        distribution = (DistributionAccumulator(self.sketch_size)
+                        if self.distribution else None)
+        return AnalyzerAccumulator(self.time_bucket, groups, distribution)
+    
+    def reset(self) -> None:
+        """Start a fresh running accumulator."""
+        self.accumulator = self.new_accumulator()
+    
+    def track(self, data: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Pass orders through unchanged while accumulating statistics.
+        
+        Lets the analyzer sit inside a streaming chain; call get_stats()
+        once the iterator has been exhausted.
+        
+        Args:
+            data: Iterable of transformed orders
+            
+        Yields:
+            The same orders, in order
+        """
+        self.reset()
+        accumulator = self.accumulator
+        
+        for order in data:
+            accumulator.update(order)
+            yield order
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get statistics from the running accumulator."""
+        return self.accumulator.finalize()
+    
     def _count_payment_statuses(self, data: List[Dict[str, Any]]) -> Dict[str, int]:
         """Count orders by payment status."""
-        counts = {'paid': 0, 'pending': 0, 'refunded': 0}
+        counts = _empty_status_counts()
         
         for order in data:
-            status = order.get('payment_status', '').lower()
-            if status in counts:
-                counts[status] += 1
-            else:
-                # Count unknown statuses as pending
-                counts['pending'] += 1
-        
-        return counts
\ No newline at end of file
+            _add_payment_status(counts, order)
+        
+        return counts
+
+
+def _add_exact(partials: List[float], x: float) -> None:
+    """Add a finite value to non-overlapping partial sums (Shewchuk's algorithm)."""
+    i = 0
+    for y in partials:
+        if abs(x) < abs(y):
+            x, y = y, x
+        high = x + y
+        low = y - (high - x)
+        if low:
+            partials[i] = low
+            i += 1
+        x = high
+    partials[i:] = [x]
+
+
+def _group_key(value: Any) -> Any:
+    """Use a field value as a group key, serializing unhashable values."""
+    try:
+        hash(value)
+    except TypeError:
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+
+def _empty_status_counts() -> Dict[str, int]:
+    """Get zeroed payment status counts."""
+    return {'paid': 0, 'pending': 0, 'refunded': 0}
+
+
+def _add_payment_status(counts: Dict[str, int], order: Dict[str, Any]) -> None:
+    """Add a single order to payment status counts."""
+    status = order.get('payment_status', '').lower()
+    if status in counts:
+        counts[status] += 1
+    else:
+        # Count unknown statuses as pending
+        counts['pending'] += 1
\ No newline at end of file
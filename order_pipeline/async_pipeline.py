@@ -0,0 +1,168 @@
+import asyncio
+import queue
+from collections.abc import Mapping
+from concurrent.futures import Executor
+from itertools import islice
+from pathlib import Path
+from typing import List, Dict, Any, AsyncIterable, Iterable, Iterator, Optional, Union
+
+from .validator import Validator
+from .analyzer import Analyzer
+from .exporter import Exporter
+from .pipeline import open_reader, _process_chunk
+
+# Marks the end of the orders handed to the exporter thread
+_DONE = object()
+
+
+class AsyncPipeline:
+    """Pipeline orchestrator for use inside an asyncio event loop."""
+    
+    def __init__(self, source: Union[str, Path, AsyncIterable[Dict[str, Any]]],
+                 output_path: str, chunk_size: int = 10000,
+                 executor: Optional[Executor] = None, pretty: bool = True,
+                 json_backend: Optional[str] = None,
+                 compression_level: Optional[int] = None):
+        """
+        Initialize pipeline.
+        
+        Args:
+            source: Input file, directory or glob as accepted by Pipeline,
+                or an async iterator of order dictionaries
+            output_path: Path for output JSON or JSON Lines file
+            chunk_size: Number of orders validated and transformed per batch;
+                the event loop is free between batches
+            executor: Executor for the CPU-bound batches, e.g. a
+                ProcessPoolExecutor to use several cores; the loop's default
+                thread pool if omitted. File reads and writes always run in
+                the default thread pool.
+            pretty: Indent the JSON output; False writes compact JSON
+            json_backend: JSON library for reading and writing ('orjson',
+                'ujson' or 'json'); the standard library json if omitted
+            compression_level: Level used for compressed output
+        """
+        if isinstance(source, (str, Path)):
+            self.reader = open_reader(source, json_backend=json_backend)
+            self.source = None
+        else:
+            self.reader = None
+            self.source = source.__aiter__()
+        self.validator = Validator(Validator.STREAMING_MAX_INVALID_ROWS)
+        self.analyzer = Analyzer()
+        self.exporter = Exporter(output_path, pretty=pretty, json_backend=json_backend,
+                                 compression_level=compression_level)
+        self.chunk_size = chunk_size
+        self.executor = executor
+    
+    async def run(self) -> dict:
+        """
+        Run the complete pipeline without blocking the event loop.
+        
+        Reading the next batch, processing the current one and writing the
+        previous one overlap; output, validation summary and statistics are
+        the same as Pipeline.run().
+        
+        Returns:
+            Dictionary with pipeline results and statistics
+        """
+        loop = asyncio.get_running_loop()
+        self.analyzer.reset()
+        orders = self.reader.iter_orders() if self.reader is not None else None
+        
+        # A bounded queue keeps at most a couple of batches waiting to be written
+        batches = queue.Queue(maxsize=2)
+        export = loop.run_in_executor(None, self.exporter.export_stream,
+                                      _drain(batches), self.analyzer.get_stats)
+        next_chunk = asyncio.ensure_future(self._next_chunk(orders))
+        offset = 0
+        
+        try:
+            while True:
+                chunk = await next_chunk
+                if not chunk or export.done():
+                    # Finished, or the exporter failed and raises below
+                    break
+                next_chunk = asyncio.ensure_future(self._next_chunk(orders))
+                
+                transformed, summary, invalid_rows, accumulator = \
+                    await loop.run_in_executor(self.executor, _process_chunk, chunk)
+                self.validator.merge(summary, invalid_rows, offset)
+                self.analyzer.accumulator.merge(accumulator)
+                offset += len(chunk)
+                await _put(batches, transformed, export)
+        except BaseException as e:
+            await _discard(next_chunk, blocking=orders is not None)
+            # Make the exporter discard its temporary file, then re-raise
+            await _put(batches, e, export)
+            await asyncio.gather(export, return_exceptions=True)
+            raise
+        
+        await _discard(next_chunk, blocking=orders is not None)
+        await _put(batches, _DONE, export)
+        total_processed = await export
+        
+        return {
+            'validation_summary': self.validator.get_summary(),
+            'statistics': self.analyzer.get_stats(),
+            'total_processed': total_processed
+        }
+    
+    async def _next_chunk(self, orders: Optional[Iterator[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Fetch the next batch from the files or the async source."""
+        if orders is not None:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, _take, orders, self.chunk_size)
+        
+        chunk = []
+        while len(chunk) < self.chunk_size:
+            try:
+                order = await self.source.__anext__()
+            except StopAsyncIteration:
+                break
+            # Copy, as batches are transformed in place
+            chunk.append(dict(order) if isinstance(order, Mapping) else order)
+        return chunk
+
+
+def _take(orders: Iterator[Dict[str, Any]], size: int) -> List[Dict[str, Any]]:
+    """Read up to size orders from a blocking iterator."""
+    return list(islice(orders, size))
+
+
+async def _discard(next_chunk: asyncio.Future, blocking: bool) -> None:
+    """
+    Stop fetching a batch that is no longer needed.
+    
+    Cancelling cannot interrupt a _take() already running in a thread, so a
+    blocking read is waited for instead; otherwise it would keep reading the
+    input after run() returned.
+    
+    Args:
+        next_chunk: Pending _next_chunk() call
+        blocking: Whether the batch is read by _take() in a thread
+    """
+    if not blocking:
+        next_chunk.cancel()
+    await asyncio.gather(next_chunk, return_exceptions=True)
+
+
+async def _put(batches: queue.Queue, item: Any, export: asyncio.Future) -> None:
+    """Queue an item for the exporter without blocking the event loop."""
+    while not export.done():
+        try:
+            batches.put_nowait(item)
+            return
+        except queue.Full:
+            # Wait for the exporter to catch up, or to fail
+            await asyncio.wait([export], timeout=0.01)
+
+
+def _drain(batches: queue.Queue) -> Iterable[Dict[str, Any]]:
+    """Yield the orders of queued batches until the pipeline finishes."""
+    while True:
+        batch = batches.get()
+        if batch is _DONE:
+            return
+        if isinstance(batch, BaseException):
+            raise batch
+        yield from batch
\ No newline at end of file
@@ -0,0 +1,284 @@
+import math
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .analyzer import Analyzer, AnalyzerAccumulator, GroupAccumulator, _group_key
+from .transformer import Transformer
+
+
+class OrderColumns:
+    """A batch of transformed orders stored as columns."""
+    
+    def __init__(self, records: List[Dict[str, Any]], items: List[Optional[str]],
+                 quantity: 'np.ndarray', price: 'np.ndarray', total: 'np.ndarray',
+                 status_codes: 'np.ndarray', status_labels: List[str],
+                 timestamps: Optional[List[Any]] = None):
+        """
+        Initialize a batch.
+        
+        Args:
+            records: Original orders, used for field order and untouched fields
+            items: Cleaned item names (None where the order has no item)
+            quantity: Quantities as float64
+            price: Prices as float64
+            total: Recomputed totals as float64
+            status_codes: Index of each order's status in status_labels
+            status_labels: Distinct normalized payment statuses in the batch
+            timestamps: Normalized timestamps (None where the order has none)
+        """
+        self.records = records
+        self.items = items
+        self.quantity = quantity
+        self.price = price
+        self.total = total
+        self.status_codes = status_codes
+        self.status_labels = status_labels
+        self.timestamps = timestamps if timestamps is not None else [None] * len(records)
+    
+    def __len__(self) -> int:
+        return len(self.records)
+    
+    def to_orders(self) -> List[Dict[str, Any]]:
+        """
+        Convert the batch back to order dictionaries.
+        
+        Returns:
+            Orders identical to those produced by Transformer.transform()
+        """
+        orders = []
+        labels = self.status_labels
+        
+        for record, item, timestamp, quantity, price, total, code in zip(
+                self.records, self.items, self.timestamps, self.quantity.tolist(),
+                self.price.tolist(), self.total.tolist(), self.status_codes.tolist()):
+            order = record.copy()
+            order['quantity'] = quantity
+            order['price'] = price
+            order['total'] = total
+            order['payment_status'] = labels[code]
+            if 'item' in order:
+                order['item'] = item
+            if 'timestamp' in order:
+                order['timestamp'] = timestamp
+            orders.append(order)
+        
+        return orders
+
+
+class ColumnarEngine:
+    """Transforms and analyzes batches of orders with NumPy."""
+    
+    def __init__(self, transformer: Optional[Transformer] = None,
+                 analyzer: Optional[Analyzer] = None):
+        """
+        Initialize the engine.
+        
+        Args:
+            transformer: Transformer whose normalization rules are used
+            analyzer: Analyzer used to create accumulators
+            
+        Raises:
+            ImportError: If NumPy is not installed
+        """
+        if np is None:
+            raise ImportError("NumPy is required for the columnar engine")
+        
+        self.transformer = transformer or Transformer()
+        self.analyzer = analyzer or Analyzer()
+    
+    def transform(self, data: Iterable[Dict[str, Any]]) -> OrderColumns:
+        """
+        Transform a batch of valid orders.
+        
+        Args:
+            data: Iterable of valid orders
+            
+        Returns:
+            Columnar batch of transformed orders
+        """
+        to_numeric = self.transformer._to_numeric
+        return self.transform_parsed(
+            (order, (to_numeric(order['quantity']), to_numeric(order['price']),
+                     to_numeric(order['total'])))
+            for order in data
+        )
+    
+    def transform_parsed(self, data: Iterable[Tuple[Dict[str, Any],
+                                                    Tuple[float, float, float]]]
+                         ) -> OrderColumns:
+        """
+        Transform a batch of orders whose numbers were already parsed.
+        
+        Text fields are cleaned per order (with payment statuses normalized
+        once per distinct value); the total recomputation runs vectorized.
+        
+        Args:
+            data: Iterable of (order, (quantity, price, total)) tuples as
+                produced by Validator.iter_validate_parsed()
+            
+        Returns:
+            Columnar batch of transformed orders
+        """
+        records = []
+        numbers = []
+        for order, values in data:
+            records.append(order)
+            numbers.append(values)
+        
+        values = np.array(numbers, dtype=np.float64).reshape(-1, 3)
+        quantity = np.ascontiguousarray(values[:, 0])
+        price = np.ascontiguousarray(values[:, 1])
+        total = _round_cents(quantity * price)
+        
+        status_codes, status_labels = self._encode_statuses(records)
+        clean_text = self.transformer._clean_text
+        items = [clean_text(order['item']) if 'item' in order else None
+                 for order in records]
+        normalize_timestamp = self.transformer._normalize_timestamp
+        timestamps = [normalize_timestamp(order['timestamp']) if 'timestamp' in order else None
+                      for order in records]
+        
+        return OrderColumns(records, items, quantity, price, total,
+                            status_codes, status_labels, timestamps)
+    
+    def accumulate(self, batch: OrderColumns,
+                   accumulator: Optional[AnalyzerAccumulator] = None) -> AnalyzerAccumulator:
+        """
+        Add a batch's revenue and payment status counts to an accumulator.
+        
+        Args:
+            batch: Transformed batch
+            accumulator: Accumulator to update; a new one if omitted
+            
+        Returns:
+            The updated accumulator
+        """
+        if accumulator is None:
+            accumulator = self.analyzer.new_accumulator()
+        
+        if accumulator.time_bucket is None:
+            accumulator.add_totals(len(batch), math.fsum(batch.total),
+                                   self._payment_counts(batch, batch.status_codes))
+        elif len(batch):
+            keys = [accumulator.bucket_key(timestamp) for timestamp in batch.timestamps]
+            bucket_codes, bucket_labels = _encode(keys)
+            for segment in _segments(bucket_codes):
+                accumulator.add_totals(len(segment), math.fsum(batch.total[segment]),
+                                       self._payment_counts(batch, batch.status_codes[segment]),
+                                       bucket=bucket_labels[bucket_codes[segment[0]]])
+        
+        if accumulator.groups is not None:
+            self._accumulate_groups(batch, accumulator.groups)
+        if accumulator.distribution is not None and len(batch):
+            mean = float(batch.total.mean())
+            m2 = float(np.square(batch.total - mean).sum())
+            # In input order, so the quantile estimates match Analyzer's exactly
+            accumulator.distribution.update_many(batch.total.tolist(), mean, m2)
+        return accumulator
+    
+    def analyze(self, batch: OrderColumns) -> Dict[str, Any]:
+        """
+        Analyze a batch.
+        
+        Args:
+            batch: Transformed batch
+            
+        Returns:
+            Dictionary with analysis results, as Analyzer.analyze() returns
+        """
+        return self.accumulate(batch).finalize()
+    
+    def _accumulate_groups(self, batch: OrderColumns, groups: GroupAccumulator) -> None:
+        """Sum each group key's orders, quantity and revenue with one sort."""
+        field = groups.field
+        if field in ('quantity', 'price', 'total'):
+            keys = getattr(batch, field).tolist()
+        elif field == 'payment_status':
+            keys = [batch.status_labels[code] for code in batch.status_codes.tolist()]
+        elif field in ('item', 'timestamp'):
+            column = batch.items if field == 'item' else batch.timestamps
+            keys = [value if field in record else None
+                    for record, value in zip(batch.records, column)]
+        else:
+            keys = [record.get(field) for record in batch.records]
+        
+        if not keys:
+            return
+        
+        codes, labels = _encode([_group_key(key) for key in keys])
+        for segment in _segments(codes):
+            groups.add_totals(labels[codes[segment[0]]], len(segment),
+                              math.fsum(batch.quantity[segment]),
+                              math.fsum(batch.total[segment]))
+    
+    def _payment_counts(self, batch: OrderColumns,
+                        status_codes: 'np.ndarray') -> Dict[str, int]:
+        """Count coded payment statuses, folding unknown ones into pending."""
+        label_counts = np.bincount(status_codes, minlength=len(batch.status_labels))
+        payment_counts = {'paid': 0, 'pending': 0, 'refunded': 0}
+        for label, count in zip(batch.status_labels, label_counts.tolist()):
+            # Count unknown statuses as pending, as Analyzer does
+            key = label if label in payment_counts else 'pending'
+            payment_counts[key] += count
+        return payment_counts
+    
+    def _encode_statuses(self, records: List[Dict[str, Any]]) -> Tuple['np.ndarray', List[str]]:
+        """Normalize payment statuses once per distinct value and code them."""
+        normalize = self.transformer._normalize_payment_status
+        raw_codes: Dict[Any, int] = {}
+        label_codes: Dict[str, int] = {}
+        labels: List[str] = []
+        codes = np.empty(len(records), dtype=np.intp)
+        
+        for idx, order in enumerate(records):
+            status = order['payment_status']
+            try:
+                code = raw_codes.get(status)
+            except TypeError:
+                status = str(status)
+                code = raw_codes.get(status)
+            if code is None:
+                label = normalize(status)
+                code = label_codes.setdefault(label, len(labels))
+                if code == len(labels):
+                    labels.append(label)
+                raw_codes[status] = code
+            codes[idx] = code
+        
+        return codes, labels
+
+
+def _encode(values: List[Any]) -> Tuple['np.ndarray', List[Any]]:
+    """Code each value by its index among the distinct values."""
+    value_codes: Dict[Any, int] = {}
+    codes = np.empty(len(values), dtype=np.intp)
+    for idx, value in enumerate(values):
+        codes[idx] = value_codes.setdefault(value, len(value_codes))
+    return codes, list(value_codes)
+
+
+def _segments(codes: 'np.ndarray') -> List['np.ndarray']:
+    """Split non-empty coded rows into the positions of each code, with one sort."""
+    positions = np.argsort(codes, kind='stable')
+    starts = np.flatnonzero(np.diff(codes[positions])) + 1
+    return np.split(positions, starts)
+
+
+def _round_cents(values: 'np.ndarray') -> 'np.ndarray':
+    """
+    Round to two decimals exactly as Python's round(value, 2) does.
+    
+    np.round scales by 100 first, which can disagree with Python on values
+    that are within floating point error of a half cent; those few values
+    are rounded again individually.
+    """
+    scaled = values * 100.0
+    rounded = np.round(scaled) / 100.0
+    fraction = np.abs(scaled - np.floor(scaled) - 0.5)
+    for idx in np.flatnonzero(fraction < 1e-6).tolist():
+        rounded[idx] = round(float(values[idx]), 2)
+    return rounded
\ No newline at end of file
@@ -0,0 +1,143 @@
+import bz2
+import gzip
+import io
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+
+# File suffix for each supported compression format
+SUFFIXES = {'.gz': 'gzip', '.bz2': 'bz2', '.zst': 'zstd'}
+
+# Levels that favour speed while still shrinking JSON several times over
+DEFAULT_LEVELS = {'gzip': 6, 'bz2': 9, 'zstd': 3}
+
+# What the decompressors raise for corrupt or truncated data
+_CORRUPTION_ERRORS = (OSError, EOFError, zlib.error) + ((zstandard.ZstdError,) if zstandard else ())
+
+
+def detect_compression(path: Path) -> Optional[str]:
+    """
+    Get the compression format implied by a file's suffix.
+    
+    Args:
+        path: File path such as orders.json.gz
+        
+    Returns:
+        'gzip', 'bz2' or 'zstd', or None for uncompressed files
+    """
+    return SUFFIXES.get(path.suffix.lower())
+
+
+def strip_compression(path: Path) -> Path:
+    """Get the path without its compression suffix (orders.json.gz -> orders.json)."""
+    if detect_compression(path) is None:
+        return path
+    return path.with_suffix('')
+
+
+def open_compressed(path: Path, compression: str) -> BinaryIO:
+    """
+    Open a compressed file for streaming decompression.
+    
+    Args:
+        path: Compressed file
+        compression: Format returned by detect_compression()
+        
+    Returns:
+        Binary file object yielding the decompressed bytes; reading it
+        raises ValueError naming the file if the data is corrupt or truncated
+        
+    Raises:
+        ImportError: If the format needs a library that is not installed
+    """
+    if compression == 'gzip':
+        stream = gzip.open(path, 'rb')
+    elif compression == 'bz2':
+        stream = bz2.open(path, 'rb')
+    else:
+        _require_zstandard()
+        f = open(path, 'rb')
+        try:
+            stream = zstandard.ZstdDecompressor().stream_reader(f, closefd=True)
+        except Exception:
+            f.close()
+            raise
+    return io.BufferedReader(_CheckedReader(stream, path, compression))
+
+
+def compress_stream(raw: BinaryIO, compression: str, level: Optional[int] = None,
+                    filename: str = '') -> BinaryIO:
+    """
+    Wrap a binary file so everything written to it is compressed.
+    
+    Closing the returned stream finishes the compressed data but leaves
+    raw open, so the caller can still flush and sync it.
+    
+    Args:
+        raw: Binary file opened for writing
+        compression: Format returned by detect_compression()
+        level: Compression level; a format-specific default if omitted
+        filename: Original file name recorded in gzip headers
+        
+    Returns:
+        Binary file object to write uncompressed bytes to
+        
+    Raises:
+        ImportError: If the format needs a library that is not installed
+    """
+    if level is None:
+        level = DEFAULT_LEVELS[compression]
+    
+    if compression == 'gzip':
+        return gzip.GzipFile(filename=filename, mode='wb', compresslevel=level, fileobj=raw)
+    if compression == 'bz2':
+        return bz2.BZ2File(raw, 'wb', compresslevel=level)
+    
+    _require_zstandard()
+    return zstandard.ZstdCompressor(level=level).stream_writer(raw, closefd=False)
+
+
+def _require_zstandard() -> None:
+    """Check that the optional zstandard library is installed."""
+    if zstandard is None:
+        raise ImportError("zstandard is not installed; install it to read or write .zst files")
+
+
+class _CheckedReader(io.RawIOBase):
+    """Decompressed stream that reports corrupt data as ValueError."""
+    
+    def __init__(self, stream: BinaryIO, path: Path, compression: str):
+        self._stream = stream
+        self.path = path
+        self.compression = compression
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer: memoryview) -> int:
+        try:
+            return self._stream.readinto(buffer)
+        except _CORRUPTION_ERRORS as e:
+            raise self._corrupt(e) from e
+    
+    def readall(self) -> bytes:
+        # One call into the decompressor rather than a loop of small reads
+        try:
+            return self._stream.read()
+        except _CORRUPTION_ERRORS as e:
+            raise self._corrupt(e) from e
+    
+    def close(self) -> None:
+        if not self.closed:
+            self._stream.close()
+        super().close()
+    
+    def _corrupt(self, error: Exception) -> ValueError:
+        """Describe a decompression failure with the file it happened in."""
+        return ValueError(f"Corrupt {self.compression} file {self.path}: {error}")
\ No newline at end of file
@@ -0,0 +1,224 @@
+import hashlib
+import json
+import math
+import shutil
+import sqlite3
+import tempfile
+from pathlib import Path
+from typing import Dict, Any, Iterable, Iterator, List, Optional
+
+
+class BloomFilter:
+    """Fixed-size probabilistic set: no false negatives, few false positives."""
+    
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        """
+        Initialize an empty filter.
+        
+        Args:
+            capacity: Number of keys the filter is sized for
+            error_rate: False positive rate at that capacity
+        """
+        bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.size = bits
+        self.hash_count = max(1, round(bits / capacity * math.log(2)))
+        self.bits = bytearray((bits + 7) // 8)
+    
+    def add(self, key: str) -> None:
+        """Add a key."""
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+    
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7))
+                   for position in self._positions(key))
+    
+    def _positions(self, key: str) -> Iterator[int]:
+        """Derive the key's bit positions from two hashes (Kirsch-Mitzenmacher)."""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+
+class KeyIndex:
+    """Map of order keys to positions that spills to disk past a memory limit."""
+    
+    def __init__(self, max_memory_keys: int = 1000000, expected_keys: int = 10000000,
+                 directory: Optional[str] = None):
+        """
+        Initialize an empty index.
+        
+        Args:
+            max_memory_keys: Keys held in a dictionary before they are moved
+                to an on-disk SQLite table
+            expected_keys: Total keys the Bloom filter in front of the disk
+                table is sized for; lookups of new keys rarely touch disk
+            directory: Where to put the temporary table (system default if
+                omitted)
+        """
+        self.max_memory_keys = max_memory_keys
+        self.expected_keys = expected_keys
+        self.directory = directory
+        self.memory: Dict[str, int] = {}
+        self.bloom: Optional[BloomFilter] = None
+        self.connection: Optional[sqlite3.Connection] = None
+        self._temp_dir: Optional[str] = None
+    
+    def get(self, key: str) -> Optional[int]:
+        """Get the position stored for a key, or None if it is new."""
+        value = self.memory.get(key)
+        if value is not None or self.bloom is None or key not in self.bloom:
+            return value
+        row = self.connection.execute(
+            'SELECT position FROM keys WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+    
+    def put(self, key: str, position: int) -> None:
+        """Store or replace the position for a key."""
+        self.memory[key] = position
+        if len(self.memory) >= self.max_memory_keys:
+            self._spill()
+    
+    def close(self) -> None:
+        """Drop the on-disk table, if one was created."""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+        if self._temp_dir is not None:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
+        self.memory = {}
+        self.bloom = None
+    
+    def _spill(self) -> None:
+        """Move the in-memory keys to the disk table."""
+        if self.connection is None:
+            self._temp_dir = tempfile.mkdtemp(prefix='order-dedup-', dir=self.directory)
+            self.connection = sqlite3.connect(str(Path(self._temp_dir) / 'keys.db'))
+            # Throwaway data: skip the journal and syncing
+            self.connection.executescript('''
+                PRAGMA journal_mode = OFF;
+                PRAGMA synchronous = OFF;
+                CREATE TABLE keys (key TEXT PRIMARY KEY, position INTEGER NOT NULL);
+            ''')
+            self.bloom = BloomFilter(self.expected_keys)
+        
+        for key in self.memory:
+            self.bloom.add(key)
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO keys (key, position) VALUES (?, ?)', self.memory.items())
+        self.memory = {}
+
+
+class Deduplicator:
+    """Drops repeated orders that share an order_id."""
+    
+    POLICIES = ('first', 'last')
+    
+    def __init__(self, policy: str = 'first', max_memory_keys: int = 1000000,
+                 expected_keys: int = 10000000, directory: Optional[str] = None):
+        """
+        Initialize Deduplicator.
+        
+        Args:
+            policy: 'first' keeps the first order seen for each order_id;
+                'last' keeps the latest, e.g. a corrected retry, which
+                needs a first pass over the input to find it
+            max_memory_keys: order_ids kept in memory before the index
+                spills to disk
+            expected_keys: Number of distinct order_ids the on-disk index's
+                Bloom filter is sized for
+            directory: Where the on-disk index is created
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unsupported dedup policy: {policy}")
+        self.policy = policy
+        self.max_memory_keys = max_memory_keys
+        self.expected_keys = expected_keys
+        self.directory = directory
+        self.duplicates = 0
+    
+    def dedup(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Remove duplicate orders from a list.
+        
+        Args:
+            data: List of orders
+            
+        Returns:
+            Orders with one per order_id, in input order
+        """
+        return list(self.iter_dedup(data, data))
+    
+    def iter_dedup(self, data: Iterable[Dict[str, Any]],
+                   first_pass: Optional[Iterable[Dict[str, Any]]] = None
+                   ) -> Iterator[Dict[str, Any]]:
+        """
+        Remove duplicate orders lazily.
+        
+        Orders without an order_id are passed through for Validator to
+        reject. duplicates holds the number of dropped orders once the
+        iterator is exhausted.
+        
+        Args:
+            data: Iterable of orders
+            first_pass: For the 'last' policy, a separate iterable over the
+                same orders used to find each order_id's last position;
+                data is read into memory when omitted
+            
+        Yields:
+            Orders with one per order_id, in input order
+        """
+        self.duplicates = 0
+        index = KeyIndex(self.max_memory_keys, self.expected_keys, self.directory)
+        try:
+            if self.policy == 'first':
+                yield from self._keep_first(data, index)
+            else:
+                if first_pass is None:
+                    data = list(data)
+                    first_pass = data
+                yield from self._keep_last(data, first_pass, index)
+        finally:
+            index.close()
+    
+    def _keep_first(self, data: Iterable[Dict[str, Any]], index: KeyIndex) -> Iterator[Dict[str, Any]]:
+        """Yield each order whose order_id has not been seen yet."""
+        for position, order in enumerate(data):
+            key = _order_key(order)
+            if key is None:
+                yield order
+            elif index.get(key) is None:
+                index.put(key, position)
+                yield order
+            else:
+                self.duplicates += 1
+    
+    def _keep_last(self, data: Iterable[Dict[str, Any]], first_pass: Iterable[Dict[str, Any]],
+                   index: KeyIndex) -> Iterator[Dict[str, Any]]:
+        """Yield each order that is the last one with its order_id."""
+        for position, order in enumerate(first_pass):
+            key = _order_key(order)
+            if key is not None:
+                index.put(key, position)
+        
+        for position, order in enumerate(data):
+            key = _order_key(order)
+            if key is None or index.get(key) == position:
+                yield order
+            else:
+                self.duplicates += 1
+
+
+def _order_key(order: Any) -> Optional[str]:
+    """Get the dedup key of an order, or None if it has no order_id."""
+    if not hasattr(order, 'get'):
+        return None
+    order_id = order.get('order_id')
+    if order_id is None or order_id == '':
+        return None
+    if isinstance(order_id, str):
+        return order_id
+    return json.dumps(order_id, sort_keys=True, default=str)
\ No newline at end of file
@@ -1,46 +1,400 @@
-import json
+import io
+import os
+import uuid
+from contextlib import contextmanager, suppress
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, BinaryIO, Iterable, Iterator, Callable, Optional, Set, Union, TextIO
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pq = None
+
+from .compression import compress_stream, detect_compression, strip_compression
+from .serializer import get_backend
 
 
 class Exporter:
-    """Exports cleaned data to JSON."""
+    """Exports cleaned data to JSON, JSON Lines or Parquet."""
     
-    def __init__(self, output_path: str):
+    FORMATS = ('json', 'jsonl', 'parquet')
+    JSON_LINES_SUFFIXES = ('.jsonl', '.ndjson')
+    BUFFER_SIZE = 1024 * 1024
+    ROW_GROUP_SIZE = 64 * 1024
+    # Parquet column holding, as a JSON object, fields that first appear
+    # after the columns were fixed by the first row group
+    EXTRA_COLUMN = 'extra_fields'
+    
+    def __init__(self, output_path: str, output_format: Optional[str] = None,
+                 pretty: bool = True, json_backend: Optional[str] = None,
+                 buffer_size: int = BUFFER_SIZE, fsync: bool = False,
+                 compression_level: Optional[int] = None,
+                 row_group_size: int = ROW_GROUP_SIZE):
         """
         Initialize Exporter.
         
         Args:
-            output_path: Path for output file
+            output_path: Path for output file; a .gz, .bz2 or .zst suffix
+                (e.g. orders.jsonl.gz) compresses it on the fly
+            output_format: 'json' for a single document, 'jsonl' for one
+                order per line or 'parquet' for typed columns (needs
+                pyarrow); detected from the file suffix if omitted
+            pretty: Indent JSON output for people; use False for compact
+                output aimed at machine consumers
+            json_backend: JSON library to use ('orjson', 'ujson' or 'json');
+                the standard library json if omitted
+            buffer_size: Bytes collected in memory before each write to disk
+            fsync: Force the data to disk before the finished file replaces
+                the old one, so it survives a power loss as well as a crash
+            compression_level: Level for compressed output; higher is
+                smaller but slower (a per-format default if omitted)
+            row_group_size: Orders per Parquet row group; each group is
+                written as soon as that many orders have arrived; fields first
+                seen after the first group go to the EXTRA_COLUMN column
         """
         self.output_path = Path(output_path)
+        self.pretty = pretty
+        self.serializer = get_backend(json_backend)
+        self.buffer_size = buffer_size
+        self.fsync = fsync
+        self.compression = detect_compression(self.output_path)
+        self.compression_level = compression_level
+        self.row_group_size = row_group_size
+        
+        if output_format is None:
+            suffix = strip_compression(self.output_path).suffix.lower()
+            if suffix in self.JSON_LINES_SUFFIXES:
+                output_format = 'jsonl'
+            elif suffix == '.parquet':
+                output_format = 'parquet'
+            else:
+                output_format = 'json'
+        if output_format not in self.FORMATS:
+            raise ValueError(f"Unsupported output format: {output_format}")
+        self.output_format = output_format
+        
+        if output_format == 'parquet':
+            if pq is None:
+                raise ImportError("pyarrow is not installed; install it to export Parquet files")
+            if self.compression is not None:
+                # Parquet compresses each column chunk itself
+                raise ValueError(f"Unsupported output format: {self.compression}-compressed Parquet")
+    
+    @property
+    def metadata_path(self) -> Path:
+        """Sidecar file holding metadata and statistics for JSON Lines output."""
+        return strip_compression(self.output_path).with_suffix('.meta.json')
     
-    def export(self, data: List[Dict[str, Any]], 
+    def export(self, data: List[Dict[str, Any]],
                stats: Dict[str, Any] = None) -> None:
         """
         Export data to JSON file.
         
+        The file is written under a temporary name and renamed into place
+        once complete, so readers never see a partial export. Orders are
+        serialized one at a time through export_stream(), so the document is
+        never held in memory as a single string.
+        
         Args:
             data: List of cleaned orders
             stats: Optional statistics to include
-            
+        
         Raises:
             IOError: If file cannot be written
         """
-        output = {
-            'orders': data,
-            'metadata': {
-                'total_orders': len(data)
-            }
-        }
+        self.export_stream(data, stats)
+    
+    def export_stream(self, data: Iterable[Dict[str, Any]],
+                      stats: Union[Dict[str, Any],
+                                   Callable[[], Optional[Dict[str, Any]]]] = None) -> int:
+        """
+        Export orders as they arrive.
         
-        if stats:
-            output['statistics'] = stats
+        Orders are written one at a time, so the full list is never held in
+        memory. JSON output is byte-for-byte the same as serializing the
+        whole document at once; JSON Lines output writes one order per line
+        and puts metadata and statistics in a sidecar file (see
+        metadata_path) so the data file can be split, appended to and read
+        back with Reader. Parquet output writes a row group every
+        row_group_size orders and stores metadata and statistics as JSON in
+        the file's key-value metadata. Like export(), each file
+        only replaces the previous one once it has been completely written.
         
-        try:
-            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        Args:
+            data: Iterable of cleaned orders
+            stats: Optional statistics to include, or a callable returning
+                them that is evaluated after the last order is written
+        
+        Returns:
+            Number of orders written
+        
+        Raises:
+            IOError: If file cannot be written
+        """
+        # Only wrap errors raised while writing; errors raised by upstream
+        # stages while producing orders propagate unchanged.
+        if self.output_format == 'parquet':
+            return self._write_parquet(data, stats)
+        
+        with self._open(self.output_path, self.compression) as f:
+            if self.output_format == 'jsonl':
+                count = self._write_json_lines(f, data)
+            else:
+                count = self._write_json_orders(f, data)
             
-            with open(self.output_path, 'w', encoding='utf-8') as f:
-                json.dump(output, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            raise IOError(f"Failed to write file: {e}")
\ No newline at end of file
+            if callable(stats):
+                stats = stats()
+            trailer = {'metadata': {'total_orders': count}}
+            if stats:
+                trailer['statistics'] = stats
+            
+            if self.output_format == 'json':
+                # Drop the opening brace; the trailer closes the document
+                trailer_text = self._dumps(trailer)
+                self._write(f, trailer_text[2:] if self.pretty else trailer_text[1:])
+        
+        if self.output_format == 'jsonl':
+            with self._open(self.metadata_path) as f:
+                self._write(f, self._dumps(trailer, pretty=True))
+        
+        return count
+    
+    def _write_parquet(self, data: Iterable[Dict[str, Any]],
+                       stats: Union[Dict[str, Any],
+                                    Callable[[], Optional[Dict[str, Any]]]]) -> int:
+        """Write orders as Parquet row groups, with statistics in the footer."""
+        data = iter(data)
+        count = 0
+        schema = None
+        writer = None
+        
+        with self._open_binary(self.output_path) as f:
+            try:
+                while True:
+                    batch = list(islice(data, self.row_group_size))
+                    if not batch and writer is not None:
+                        break
+                    if writer is None:
+                        # Columns are fixed by the first row group
+                        schema = self._arrow_schema(batch)
+                        writer = self._call_arrow(pq.ParquetWriter, f, schema)
+                    if not batch:
+                        break
+                    self._call_arrow(writer.write_batch, self._record_batch(batch, schema))
+                    count += len(batch)
+                
+                if callable(stats):
+                    stats = stats()
+                trailer = {'metadata': {'total_orders': count}}
+                if stats:
+                    trailer['statistics'] = stats
+                self._call_arrow(writer.add_key_value_metadata,
+                                 {key: self._dumps(value, pretty=False)
+                                  for key, value in trailer.items()})
+            except BaseException:
+                if writer is not None:
+                    with suppress(Exception):
+                        writer.close()
+                raise
+            self._call_arrow(writer.close)
+        
+        return count
+    
+    def _arrow_schema(self, batch: List[Dict[str, Any]]) -> 'pa.Schema':
+        """Build nullable Parquet columns for every order field plus those in a batch."""
+        fields = [pa.field(name, data_type) for name, data_type in _ARROW_TYPES.items()]
+        known = set(_ARROW_TYPES) | {self.EXTRA_COLUMN}
+        for order in batch:
+            for key in order.keys():
+                if key not in known:
+                    # Extra fields, such as MultiReader's source_file, as text
+                    fields.append(pa.field(key, pa.string()))
+                    known.add(key)
+        # Parquet cannot add columns later, so later fields share one column
+        fields.append(pa.field(self.EXTRA_COLUMN, pa.string()))
+        return pa.schema(fields)
+    
+    def _record_batch(self, batch: List[Dict[str, Any]], schema: 'pa.Schema') -> 'pa.RecordBatch':
+        """Convert a batch of orders to Arrow columns."""
+        names = set(schema.names)
+        columns = []
+        for field in schema:
+            if field.name == self.EXTRA_COLUMN:
+                values = [self._extra_fields(order, names) for order in batch]
+            else:
+                values = [order.get(field.name) for order in batch]
+            if pa.types.is_floating(field.type):
+                columns.append(self._call_arrow(pa.array, values, field.type))
+            else:
+                columns.append(self._call_arrow(pa.array, [self._to_text(value) for value in values],
+                                                field.type))
+        return pa.RecordBatch.from_arrays(columns, schema=schema)
+    
+    def _extra_fields(self, order: Dict[str, Any], names: Set[str]) -> Optional[str]:
+        """Serialize the fields of an order that have no column of their own."""
+        extra = {key: value for key, value in order.items() if key not in names}
+        return self._dumps(extra, pretty=False) if extra else None
+    
+    def _to_text(self, value: Any) -> Optional[str]:
+        """Represent a value in a text column, serializing non-strings."""
+        if value is None or isinstance(value, str):
+            return value
+        return self._dumps(value, pretty=False)
+    
+    def _call_arrow(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Call into pyarrow, reporting conversion and write errors as IOError."""
+        try:
+            return function(*args)
+        except (pa.ArrowException, TypeError, ValueError, OSError) as e:
+            raise IOError(f"Failed to write file: {e}")
+    
+    def _write_json_orders(self, f: TextIO, data: Iterable[Dict[str, Any]]) -> int:
+        """Write the opening of a JSON document and its orders array."""
+        if not self.pretty:
+            self._write(f, '{"orders":[')
+            count = 0
+            for order in data:
+                if count:
+                    self._write(f, ',')
+                self._write(f, self._dumps(order))
+                count += 1
+            self._write(f, '],')
+            return count
+        
+        self._write(f, '{\n  "orders": [')
+        count = 0
+        for order in data:
+            self._write(f, ',\n' if count else '\n')
+            self._write(f, self._indent(self._dumps(order)))
+            count += 1
+        self._write(f, '\n  ],\n' if count else '],\n')
+        return count
+    
+    def _write_json_lines(self, f: TextIO, data: Iterable[Dict[str, Any]]) -> int:
+        """Write one compact JSON record per line."""
+        count = 0
+        for order in data:
+            self._write(f, self._dumps(order, pretty=False) + '\n')
+            count += 1
+        return count
+    
+    @contextmanager
+    def _open_binary(self, path: Path) -> Iterator[BinaryIO]:
+        """
+        Open an output file for atomic, buffered writing.
+        
+        Writes go to a temporary file next to the target, which replaces the
+        target when the block exits normally and is deleted otherwise.
+        """
+        temp_path = path.with_name(f'.{path.name}.{uuid.uuid4().hex[:8]}.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            raw = open(temp_path, 'xb', buffering=self.buffer_size)
+        except OSError as e:
+            raise IOError(f"Failed to write file: {e}")
+        
+        try:
+            with raw:
+                yield raw
+                self._flush(raw)
+            # Rename only once closed, which Windows requires
+            self._replace(temp_path, path)
+        except BaseException:
+            try:
+                temp_path.unlink()
+            except OSError:
+                pass
+            raise
+    
+    @contextmanager
+    def _open(self, path: Path, compression: Optional[str] = None) -> Iterator[TextIO]:
+        """Open an output file for atomic UTF-8 text, compressing it if asked."""
+        with self._open_binary(path) as raw:
+            stream = raw
+            if compression is not None:
+                stream = compress_stream(raw, compression, self.compression_level,
+                                         strip_compression(path).name)
+            f = io.TextIOWrapper(stream, encoding='utf-8')
+            try:
+                yield f
+            except BaseException:
+                with suppress(Exception):
+                    self._close_text(f, stream is not raw)
+                raise
+            self._close_text(f, stream is not raw)
+    
+    def _close_text(self, f: TextIO, compressed: bool) -> None:
+        """Finish the text layer, leaving the temporary file itself open."""
+        try:
+            if compressed:
+                # Closing a compressor writes its trailer but not the file
+                f.close()
+            else:
+                f.flush()
+                f.detach()
+        except OSError as e:
+            raise IOError(f"Failed to write file: {e}")
+    
+    def _flush(self, f: BinaryIO) -> None:
+        """Push buffered output to the OS, and to disk if fsync is set."""
+        try:
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+        except OSError as e:
+            raise IOError(f"Failed to write file: {e}")
+    
+    def _replace(self, temp_path: Path, path: Path) -> None:
+        """Move a completed temporary file over the target."""
+        try:
+            os.replace(temp_path, path)
+            if self.fsync:
+                self._fsync_directory(path.parent)
+        except OSError as e:
+            raise IOError(f"Failed to write file: {e}")
+    
+    def _fsync_directory(self, directory: Path) -> None:
+        """Persist a rename by syncing the directory that holds the file."""
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            # Not supported on every platform (e.g. Windows)
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    def _dumps(self, obj: Any, pretty: Optional[bool] = None) -> str:
+        """Serialize an object the same way export() does."""
+        try:
+            return self.serializer.dumps(obj, self.pretty if pretty is None else pretty)
+        except (TypeError, ValueError) as e:
+            raise IOError(f"Failed to write file: {e}")
+    
+    def _write(self, f: TextIO, text: str) -> None:
+        """Write text to the output file."""
+        try:
+            f.write(text)
+        except OSError as e:
+            raise IOError(f"Failed to write file: {e}")
+    
+    def _indent(self, text: str) -> str:
+        """Indent serialized JSON to sit inside the orders array."""
+        return '    ' + text.replace('\n', '\n    ')
+
+
+# Parquet column types for the fields of a transformed order
+_ARROW_TYPES = {
+    'order_id': pa.string(),
+    'timestamp': pa.string(),
+    'item': pa.string(),
+    'quantity': pa.float64(),
+    'price': pa.float64(),
+    # Few distinct values, so store each once plus small integer codes
+    'payment_status': pa.dictionary(pa.int32(), pa.string()),
+    'total': pa.float64()
+} if pa is not None else {}
\ No newline at end of file
@@ -0,0 +1,330 @@
+import json
+import logging
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Union
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsHook:
+    """Receives stage events from Pipeline; override the ones you need."""
+    
+    def on_stage_start(self, stage: str) -> None:
+        """
+        Called when a stage starts work.
+        
+        Args:
+            stage: Stage name, e.g. 'read', 'validate' or 'export'
+        """
+    
+    def on_batch(self, stage: str, count: int) -> None:
+        """
+        Called each time a stage has handled another batch of orders.
+        
+        Args:
+            stage: Stage name
+            count: Orders in the batch
+        """
+    
+    def on_stage_end(self, stage: str, metrics: Dict[str, Any]) -> None:
+        """
+        Called when a stage has finished.
+        
+        Args:
+            stage: Stage name
+            metrics: 'orders' handled, 'seconds' spent in the stage itself,
+                'bytes_read' and 'bytes_written' where the stage does I/O
+                (otherwise 0) and 'peak_memory_bytes', the process's
+                resident memory high-water mark so far (None if unknown)
+        """
+    
+    def on_stage_error(self, stage: str, error: BaseException) -> None:
+        """
+        Called instead of on_stage_end when a stage raises.
+        
+        Args:
+            stage: Stage name
+            error: The exception, which propagates once hooks are notified
+        """
+
+
+class MetricsRecorder(MetricsHook):
+    """Keeps the metrics of every finished stage."""
+    
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, Any]] = {}
+    
+    def on_stage_end(self, stage: str, metrics: Dict[str, Any]) -> None:
+        """Record a finished stage."""
+        self.stages[stage] = dict(metrics)
+    
+    def to_json(self) -> str:
+        """Render recorded metrics as a JSON document."""
+        return json.dumps({'stages': self.stages}, indent=2)
+    
+    def to_prometheus(self, prefix: str = 'order_pipeline') -> str:
+        """
+        Render recorded metrics in the Prometheus text exposition format.
+        
+        Args:
+            prefix: Prefix of every metric name
+            
+        Returns:
+            Text suitable for the node exporter's textfile collector or a
+            Pushgateway
+        """
+        lines = []
+        for name, key, help_text in _PROMETHEUS_METRICS:
+            metric = f'{prefix}_{name}'
+            lines.append(f'# HELP {metric} {help_text}')
+            lines.append(f'# TYPE {metric} gauge')
+            for stage, metrics in self.stages.items():
+                value = metrics.get(key)
+                if value is not None:
+                    lines.append(f'{metric}{{stage="{stage}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+
+class JsonEmitter(MetricsRecorder):
+    """Writes all stage metrics to a JSON file when the run finishes."""
+    
+    def __init__(self, path: Union[str, Path]):
+        """
+        Initialize the emitter.
+        
+        Args:
+            path: File to write
+        """
+        super().__init__()
+        self.path = Path(path)
+    
+    def on_stage_end(self, stage: str, metrics: Dict[str, Any]) -> None:
+        """Record a stage, writing the file once the whole run is done."""
+        super().on_stage_end(stage, metrics)
+        if stage == RUN_STAGE:
+            _write_text(self.path, self.to_json())
+
+
+class PrometheusEmitter(MetricsRecorder):
+    """Writes all stage metrics as Prometheus text when the run finishes."""
+    
+    def __init__(self, path: Union[str, Path], prefix: str = 'order_pipeline'):
+        """
+        Initialize the emitter.
+        
+        Args:
+            path: File to write, e.g. in the node exporter's textfile
+                collector directory
+            prefix: Prefix of every metric name
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.prefix = prefix
+    
+    def on_stage_end(self, stage: str, metrics: Dict[str, Any]) -> None:
+        """Record a stage, writing the file once the whole run is done."""
+        super().on_stage_end(stage, metrics)
+        if stage == RUN_STAGE:
+            _write_text(self.path, self.to_prometheus(self.prefix))
+
+
+class LoggingHook(MetricsHook):
+    """Logs every finished stage as a structured record."""
+    
+    def on_stage_end(self, stage: str, metrics: Dict[str, Any]) -> None:
+        """Log a finished stage, with its metrics as record attributes."""
+        logger.info("Stage %s finished: %d orders in %.3fs", stage,
+                    metrics['orders'], metrics['seconds'],
+                    extra={'stage': stage, 'metrics': metrics})
+
+
+class StageMonitor:
+    """Times pipeline stages and reports them to hooks."""
+    
+    def __init__(self, hooks: Optional[List[MetricsHook]] = None, batch_size: int = 10000):
+        """
+        Initialize the monitor.
+        
+        Args:
+            hooks: Hooks to notify; without any, monitoring costs nothing
+            batch_size: Orders between on_batch calls for streamed stages
+        """
+        self.hooks = list(hooks or [])
+        self.batch_size = batch_size
+    
+    @contextmanager
+    def stage(self, name: str, exclude: Optional['_TrackedStage'] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Time a block of work as one stage.
+        
+        Yields a metrics dictionary the block fills in ('orders',
+        'bytes_read', 'bytes_written'); timing and memory are added here.
+        
+        Args:
+            name: Stage name
+            exclude: Streamed stage whose time, spent inside this block,
+                belongs to that stage rather than this one
+        """
+        metrics = _new_metrics()
+        if not self.hooks:
+            yield metrics
+            return
+        
+        self._start(name)
+        start = time.perf_counter()
+        try:
+            yield metrics
+        except BaseException as e:
+            self._error(name, e)
+            raise
+        seconds = time.perf_counter() - start
+        if exclude is not None:
+            seconds -= exclude.inclusive
+        self._end(name, metrics, seconds)
+    
+    def track(self, name: str, orders: Iterable[Any],
+              upstream: Optional['_TrackedStage'] = None,
+              **metrics: Any) -> Iterable[Any]:
+        """
+        Time a streamed stage as orders are pulled through it.
+        
+        Args:
+            name: Stage name
+            orders: The stage's output iterator
+            upstream: Tracked iterator this stage pulls from; its time is
+                subtracted so each stage reports only its own work
+            **metrics: Extra metrics reported at the end, e.g. bytes_read
+            
+        Returns:
+            The orders, unchanged, as a tracked iterator
+        """
+        if not self.hooks:
+            return orders
+        return _TrackedStage(self, name, orders, upstream, metrics)
+    
+    def _start(self, name: str) -> None:
+        """Notify hooks that a stage started."""
+        for hook in self.hooks:
+            hook.on_stage_start(name)
+    
+    def _batch(self, name: str, count: int) -> None:
+        """Notify hooks of a finished batch."""
+        for hook in self.hooks:
+            hook.on_batch(name, count)
+    
+    def _error(self, name: str, error: BaseException) -> None:
+        """Notify hooks that a stage failed."""
+        for hook in self.hooks:
+            hook.on_stage_error(name, error)
+    
+    def _end(self, name: str, metrics: Dict[str, Any], seconds: float) -> None:
+        """Complete a stage's metrics and notify hooks."""
+        metrics['seconds'] = max(seconds, 0.0)
+        metrics['peak_memory_bytes'] = peak_memory_bytes()
+        for hook in self.hooks:
+            hook.on_stage_end(name, metrics)
+
+
+class _TrackedStage:
+    """Iterator wrapper measuring the time spent producing each order."""
+    
+    def __init__(self, monitor: StageMonitor, name: str, orders: Iterable[Any],
+                 upstream: Optional['_TrackedStage'], metrics: Dict[str, Any]):
+        self.monitor = monitor
+        self.name = name
+        self.orders = iter(orders)
+        self.upstream = upstream
+        self.metrics = _new_metrics()
+        self.metrics.update(metrics)
+        # Time spent in next(), including upstream stages
+        self.inclusive = 0.0
+        self.started = False
+        self.finished = False
+        self.pending = 0
+    
+    def __iter__(self) -> '_TrackedStage':
+        return self
+    
+    def __next__(self) -> Any:
+        if not self.started:
+            self.started = True
+            self.monitor._start(self.name)
+        
+        start = time.perf_counter()
+        try:
+            order = next(self.orders)
+        except StopIteration:
+            self.inclusive += time.perf_counter() - start
+            self._finish()
+            raise
+        except BaseException as e:
+            if not self.finished:
+                self.finished = True
+                self.monitor._error(self.name, e)
+            raise
+        self.inclusive += time.perf_counter() - start
+        
+        self.metrics['orders'] += 1
+        self.pending += 1
+        if self.pending >= self.monitor.batch_size:
+            self.monitor._batch(self.name, self.pending)
+            self.pending = 0
+        return order
+    
+    def _finish(self) -> None:
+        """Report the stage once its input is exhausted."""
+        if self.finished:
+            return
+        self.finished = True
+        if self.pending:
+            self.monitor._batch(self.name, self.pending)
+            self.pending = 0
+        seconds = self.inclusive
+        if self.upstream is not None:
+            seconds -= self.upstream.inclusive
+        self.monitor._end(self.name, self.metrics, seconds)
+
+
+# Stage name under which a whole run is reported, after all other stages
+RUN_STAGE = 'pipeline'
+
+# (metric name, metrics key, help text) for the Prometheus emitter
+_PROMETHEUS_METRICS = [
+    ('stage_orders', 'orders', 'Orders handled by the stage.'),
+    ('stage_seconds', 'seconds', 'Time spent in the stage.'),
+    ('stage_bytes_read', 'bytes_read', 'Bytes read by the stage.'),
+    ('stage_bytes_written', 'bytes_written', 'Bytes written by the stage.'),
+    ('stage_peak_memory_bytes', 'peak_memory_bytes',
+     'Resident memory high-water mark of the process at the end of the stage.'),
+]
+
+
+def peak_memory_bytes() -> Optional[int]:
+    """Get the process's resident memory high-water mark, if available."""
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def _new_metrics() -> Dict[str, Any]:
+    """Get the metrics of a stage that has not done anything yet."""
+    return {'orders': 0, 'seconds': 0.0, 'bytes_read': 0, 'bytes_written': 0,
+            'peak_memory_bytes': None}
+
+
+def _write_text(path: Path, text: str) -> None:
+    """Write an emitter's file, replacing it atomically for scrapers."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(f'.{path.name}.tmp')
+    temp_path.write_text(text, encoding='utf-8')
+    temp_path.replace(path)
\ No newline at end of file
@@ -0,0 +1,166 @@
+import glob
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Dict, Any, Iterator, Optional, Union
+
+from .compression import strip_compression
+from .order import Order
+from .reader import Reader
+from .serializer import get_backend
+
+_GLOB_CHARS = re.compile(r'[*?[]')
+
+
+def is_multi_source(source: Union[str, Path]) -> bool:
+    """Check whether an input path names a directory or glob pattern."""
+    path = Path(source)
+    if path.exists():
+        # An existing file such as 'orders[2025].json' is not a pattern
+        return path.is_dir()
+    return bool(_GLOB_CHARS.search(str(source)))
+
+
+class MultiReader:
+    """Reads orders from a directory or glob of files as one stream."""
+    
+    SOURCE_FIELD = 'source_file'
+    
+    def __init__(self, source: Union[str, Path], json_backend: Optional[str] = None,
+                 prefetch: int = 4, source_field: Optional[str] = SOURCE_FIELD):
+        """
+        Initialize the MultiReader.
+        
+        Args:
+            source: Directory holding order files, or a glob pattern such as
+                'drops/2025-10-*/orders-*.json.gz'
+            json_backend: JSON library used to parse each file; the standard
+                library json if omitted
+            prefetch: Number of files read and parsed ahead in background
+                threads while earlier files are processed; bounds memory to
+                about that many files
+            source_field: Field added to every order holding the path of
+                the file it came from; None leaves orders untouched
+        """
+        self.source = source
+        self.serializer = get_backend(json_backend)
+        self.prefetch = max(1, prefetch)
+        self.source_field = source_field
+        # Orders come from many files, so there is no single file to map
+        self.use_mmap = False
+    
+    def find_files(self) -> List[Path]:
+        """
+        List the input files in the order they are read.
+        
+        A directory yields its JSON and JSON Lines files (compressed or
+        not); a glob yields every matching file. Files are sorted by path,
+        so timestamped file names are read in time order.
+        
+        Returns:
+            Sorted file paths
+        
+        Raises:
+            FileNotFoundError: If nothing matches
+        """
+        path = Path(self.source)
+        if path.is_dir():
+            candidates = [child for child in path.iterdir() if self._is_order_file(child)]
+        elif _GLOB_CHARS.search(str(self.source)):
+            candidates = [Path(match) for match in glob.glob(str(self.source), recursive=True)]
+        else:
+            candidates = [path]
+        
+        files = sorted(candidate for candidate in candidates if candidate.is_file())
+        if not files:
+            raise FileNotFoundError(f"No input files found: {self.source}")
+        return files
+    
+    def read(self) -> List[Dict[str, Any]]:
+        """
+        Read the orders of every file into one list.
+        
+        Returns:
+            List of order dictionaries, file by file
+        
+        Raises:
+            ValueError: If a file's format is unsupported, invalid or empty
+            FileNotFoundError: If no input files are found
+        """
+        return list(self.iter_orders())
+    
+    def iter_orders(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the orders of every file as one logical stream.
+        
+        The next files are read and parsed by a thread pool while the
+        current one is consumed, overlapping disk and decompression time
+        with the rest of the pipeline.
+        
+        Yields:
+            Order dictionaries, file by file in find_files() order
+        
+        Raises:
+            ValueError: If a file's format is unsupported, invalid or empty
+            FileNotFoundError: If no input files are found
+        """
+        files = iter(self.find_files())
+        pending = deque()
+        
+        with ThreadPoolExecutor(max_workers=self.prefetch) as executor:
+            try:
+                while True:
+                    while len(pending) < self.prefetch:
+                        path = next(files, None)
+                        if path is None:
+                            break
+                        pending.append(executor.submit(self._read_file, path))
+                    
+                    if not pending:
+                        break
+                    yield from pending.popleft().result()
+            finally:
+                # Stopped early: drop files that have not started loading
+                for future in pending:
+                    future.cancel()
+    
+    def iter_records(self) -> Iterator[Order]:
+        """
+        Iterate over orders as compact Order records.
+        
+        Yields:
+            Order records, file by file (non-object elements unchanged)
+        
+        Raises:
+            ValueError: If a file's format is unsupported, invalid or empty
+            FileNotFoundError: If no input files are found
+        """
+        for data in self.iter_orders():
+            yield Order.from_dict(data) if isinstance(data, dict) else data
+    
+    def _read_file(self, path: Path) -> List[Dict[str, Any]]:
+        """Read and tag the orders of a single file."""
+        try:
+            orders = Reader(path, json_backend=self.serializer.name).read()
+        except ValueError as e:
+            raise ValueError(f"{e} in {path}")
+        
+        if self.source_field is not None:
+            source = str(path)
+            for order in orders:
+                if isinstance(order, dict):
+                    order[self.source_field] = source
+        return orders
+    
+    def _is_order_file(self, path: Path) -> bool:
+        """Check whether a directory entry is an order file Reader accepts."""
+        if path.name.startswith('.'):
+            # Hidden files, including Exporter's in-progress temporary files
+            return False
+        name = strip_compression(path).name.lower()
+        if name.endswith('.meta.json'):
+            # JSON Lines sidecars written by Exporter
+            return False
+        suffix = Path(name).suffix
+        return suffix == '.json' or suffix in Reader.JSON_LINES_SUFFIXES
\ No newline at end of file
@@ -0,0 +1,40 @@
+import re
+from functools import lru_cache
+from typing import Optional
+
+
+# Everything except ASCII digits and the decimal point
+_NON_NUMERIC = re.compile(r'[^0-9.]')
+
+# Translate table deleting the same characters for ASCII-only strings,
+# which is several times faster than the regex substitution
+_ASCII_NON_NUMERIC = str.maketrans('', '', ''.join(
+    chr(code) for code in range(128) if chr(code) not in '0123456789.'
+))
+
+CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_number(text: str) -> Optional[float]:
+    """
+    Parse a number out of a string such as '$15.99', 'N2000' or '5usd'.
+    
+    Every character other than digits and '.' is dropped before conversion.
+    Results are memoized because the same price strings repeat across orders.
+    
+    Args:
+        text: String containing a number
+        
+    Returns:
+        Parsed value, or None if the string has no digits or decimal point
+        
+    Raises:
+        ValueError: If the remaining characters are not a valid number
+    """
+    if text.isascii():
+        cleaned = text.translate(_ASCII_NON_NUMERIC)
+    else:
+        cleaned = _NON_NUMERIC.sub('', text)
+    
+    return float(cleaned) if cleaned else None
\ No newline at end of file
@@ -0,0 +1,128 @@
+import sys
+from collections.abc import MutableMapping
+from typing import Dict, Any, Iterator, Tuple
+
+
+# Field orders are shared between records, so each order only holds a
+# reference to one interned tuple rather than its own list of keys
+_KEY_ORDERS: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _intern_keys(keys: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return the shared instance of a field order."""
+    return _KEY_ORDERS.setdefault(keys, keys)
+
+
+class Order(MutableMapping):
+    """Compact, dictionary-compatible record for a single order."""
+    
+    # Known fields live in __slots__ instead of a per-order dict and payment
+    # statuses are interned, which cuts memory per order several times over.
+    # Any other fields go to a small overflow dict that is only created when
+    # needed.
+    FIELDS = ('order_id', 'timestamp', 'item', 'quantity', 'price',
+              'payment_status', 'total')
+    
+    __slots__ = FIELDS + ('_keys', '_extra')
+    
+    _FIELD_SET = frozenset(FIELDS)
+    
+    def __init__(self, data: Dict[str, Any] = None, **fields: Any):
+        """
+        Initialize an order.
+        
+        Args:
+            data: Optional mapping of field names to values
+            **fields: Additional field values
+        """
+        self._keys = ()
+        self._extra = None
+        if data:
+            self.update(data)
+        if fields:
+            self.update(fields)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Order':
+        """
+        Build an order from a dictionary, keeping its field order.
+        
+        Args:
+            data: Order dictionary as read from JSON
+            
+        Returns:
+            Compact order
+        """
+        order = cls.__new__(cls)
+        order._keys = _intern_keys(tuple(data))
+        order._extra = None
+        
+        field_set = cls._FIELD_SET
+        for key, value in data.items():
+            if key in field_set:
+                if key == 'payment_status' and type(value) is str:
+                    value = sys.intern(value)
+                object.__setattr__(order, key, value)
+            else:
+                if order._extra is None:
+                    order._extra = {}
+                order._extra[key] = value
+        
+        return order
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a plain dictionary with the original field order."""
+        return {key: self[key] for key in self._keys}
+    
+    def copy(self) -> 'Order':
+        """Return a shallow copy."""
+        order = Order.__new__(Order)
+        order._keys = self._keys
+        order._extra = dict(self._extra) if self._extra is not None else None
+        for key in self._keys:
+            if key in self._FIELD_SET:
+                object.__setattr__(order, key, getattr(self, key))
+        return order
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+    
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._keys:
+            self._keys = _intern_keys(self._keys + (key,))
+        if key in self._FIELD_SET:
+            if key == 'payment_status' and type(value) is str:
+                value = sys.intern(value)
+            object.__setattr__(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+    
+    def __delitem__(self, key: str) -> None:
+        if key not in self._keys:
+            raise KeyError(key)
+        self._keys = _intern_keys(tuple(k for k in self._keys if k != key))
+        if key in self._FIELD_SET:
+            object.__delattr__(self, key)
+        else:
+            del self._extra[key]
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+    
+    def __len__(self) -> int:
+        return len(self._keys)
+    
+    def __repr__(self) -> str:
+        return f"Order({self.to_dict()!r})"
\ No newline at end of file
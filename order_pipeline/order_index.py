@@ -0,0 +1,183 @@
+import hashlib
+import json
+import sqlite3
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from .serializer import to_json
+
+
+def content_hash(order: Dict[str, Any]) -> str:
+    """
+    Hash an order's content independently of its field order.
+    
+    Args:
+        order: Raw order as read from the input
+        
+    Returns:
+        Hex digest
+    """
+    canonical = json.dumps(order, sort_keys=True, separators=(',', ':'),
+                           ensure_ascii=False, default=to_json)
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def code_fingerprint() -> str:
+    """
+    Hash the source code of the order_pipeline package.
+    
+    The package version is not bumped for every change to how orders are
+    cleaned or analyzed, so stored results are tied to the code itself.
+    
+    Returns:
+        Hex digest of every module in the package
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(Path(__file__).parent.glob('*.py')):
+        digest.update(path.name.encode('utf-8'))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class OrderIndex:
+    """Persistent SQLite index of processed orders for incremental runs."""
+    
+    # Keys per lookup query; well below SQLite's bound parameter limit
+    BATCH_SIZE = 500
+    
+    def __init__(self, path: str, signature: str = ''):
+        """
+        Initialize the index.
+        
+        Args:
+            path: Path of the SQLite database file
+            signature: Identifies the pipeline version and settings that
+                produced the stored results; a different signature discards
+                them so they are recomputed
+        """
+        self.path = Path(path)
+        self.signature = signature
+        self.connection: Optional[sqlite3.Connection] = None
+        self.run_id = 0
+    
+    def __enter__(self) -> 'OrderIndex':
+        self.open()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close(commit=exc_type is None)
+    
+    def open(self) -> None:
+        """Open the database and start a new run in one transaction."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.executescript('''
+            CREATE TABLE IF NOT EXISTS orders (
+                order_key TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                reason TEXT,
+                transformed TEXT,
+                run_id INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS state (
+                name TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        ''')
+        
+        if self._get_state('signature') != self.signature:
+            self.connection.execute('DELETE FROM orders')
+            self.connection.execute('DELETE FROM state')
+            self._set_state('signature', self.signature)
+        
+        self.run_id = int(self._get_state('run_id') or 0) + 1
+        self._set_state('run_id', str(self.run_id))
+    
+    def close(self, commit: bool = True) -> None:
+        """
+        Close the database.
+        
+        Args:
+            commit: Keep this run's changes; otherwise roll them back
+        """
+        if self.connection is None:
+            return
+        if commit:
+            self.connection.commit()
+        else:
+            self.connection.rollback()
+        self.connection.close()
+        self.connection = None
+    
+    def lookup(self, keys: List[str]) -> Dict[str, Tuple[str, Optional[str], Optional[str]]]:
+        """
+        Fetch stored results for a batch of order keys.
+        
+        Args:
+            keys: Order keys
+            
+        Returns:
+            Mapping of known keys to (content_hash, reason, transformed_json)
+        """
+        found = {}
+        for start in range(0, len(keys), self.BATCH_SIZE):
+            batch = keys[start:start + self.BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            rows = self.connection.execute(
+                f'SELECT order_key, content_hash, reason, transformed '
+                f'FROM orders WHERE order_key IN ({placeholders})', batch)
+            for key, digest, reason, transformed in rows:
+                found[key] = (digest, reason, transformed)
+        return found
+    
+    def store(self, rows: Iterable[Tuple[str, str, Optional[str], Optional[str]]]) -> None:
+        """
+        Insert or replace results, marking them as seen in this run.
+        
+        Args:
+            rows: (order_key, content_hash, reason, transformed_json) tuples
+        """
+        self.connection.executemany(
+            'INSERT OR REPLACE INTO orders '
+            '(order_key, content_hash, reason, transformed, run_id) VALUES (?, ?, ?, ?, ?)',
+            [row + (self.run_id,) for row in rows])
+    
+    def touch(self, keys: Iterable[str]) -> None:
+        """Mark unchanged orders as seen in this run."""
+        self.connection.executemany(
+            'UPDATE orders SET run_id = ? WHERE order_key = ?',
+            [(self.run_id, key) for key in keys])
+    
+    def pop_stale(self) -> List[Optional[str]]:
+        """
+        Delete orders that were not seen in this run.
+        
+        Returns:
+            Transformed JSON of the deleted orders (None for invalid ones)
+        """
+        rows = self.connection.execute(
+            'SELECT transformed FROM orders WHERE run_id < ?', (self.run_id,)).fetchall()
+        self.connection.execute('DELETE FROM orders WHERE run_id < ?', (self.run_id,))
+        return [transformed for (transformed,) in rows]
+    
+    def load_statistics(self) -> Optional[Dict[str, Any]]:
+        """Get the analyzer state saved by the previous run, if any."""
+        value = self._get_state('statistics')
+        return json.loads(value) if value is not None else None
+    
+    def save_statistics(self, state: Dict[str, Any]) -> None:
+        """Save analyzer state for the next run."""
+        self._set_state('statistics', json.dumps(state))
+    
+    def _get_state(self, name: str) -> Optional[str]:
+        """Read a value from the state table."""
+        row = self.connection.execute(
+            'SELECT value FROM state WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else None
+    
+    def _set_state(self, name: str, value: str) -> None:
+        """Write a value to the state table."""
+        self.connection.execute(
+            'INSERT OR REPLACE INTO state (name, value) VALUES (?, ?)', (name, value))
\ No newline at end of file
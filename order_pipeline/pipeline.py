@@ -1,26 +1,159 @@
+import argparse
+import json
+import logging
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
 from .reader import Reader
+from .multi_reader import MultiReader, is_multi_source
 from .validator import Validator
 from .transformer import Transformer
-from .analyzer import Analyzer
+from .analyzer import Analyzer, AnalyzerAccumulator
 from .exporter import Exporter
+from .order import Order
+from .validate_transform import ValidateTransform
+from .columnar import ColumnarEngine
+from .order_index import OrderIndex, code_fingerprint, content_hash
+from .deduplicator import Deduplicator
+from .metrics import MetricsHook, StageMonitor, RUN_STAGE
+from .profiling import Profiler
+from .result_cache import ResultCache, DEFAULT_MAX_BYTES
+from .serializer import BACKENDS
+from .timestamps import BUCKETS
+
+logger = logging.getLogger(__name__)
 
 
 class Pipeline:
     """Main pipeline orchestrator."""
     
-    def __init__(self, input_path: str, output_path: str):
+    ENGINES = ('staged', 'fused', 'columnar')
+    
+    def __init__(self, input_path: str, output_path: str, streaming: bool = False,
+                 workers: int = 1, chunk_size: int = 10000, engine: str = 'staged',
+                 compact: bool = False, pretty: bool = True,
+                 json_backend: Optional[str] = None, use_mmap: bool = False,
+                 index_path: Optional[str] = None,
+                 compression_level: Optional[int] = None,
+                 hooks: Optional[List[MetricsHook]] = None, quiet: bool = False,
+                 profile: Optional[str] = None, dedup: Optional[str] = None,
+                 dedup_memory_keys: int = 1000000, time_bucket: Optional[str] = None,
+                 group_by: Optional[str] = None, top_n: Optional[int] = None,
+                 max_groups: Optional[int] = None, distribution: bool = False,
+                 sketch_size: int = 200, cache_dir: Optional[str] = None,
+                 cache_max_bytes: int = DEFAULT_MAX_BYTES):
         """
         Initialize pipeline.
         
         Args:
-            input_path: Path to input JSON file
-            output_path: Path for output JSON file
+            input_path: Path to input JSON or JSON Lines file, optionally
+                compressed (.gz, .bz2 or .zst); a directory or glob pattern
+                reads every matching file with MultiReader
+            output_path: Path for output JSON or JSON Lines file, compressed
+                if it ends in .gz, .bz2 or .zst
+            streaming: Chain all stages as generators so each order flows
+                through once and peak memory does not grow with input size;
+                validator.invalid_rows then keeps only the first
+                Validator.STREAMING_MAX_INVALID_ROWS invalid orders
+            workers: Number of processes used to validate and transform
+                chunks in parallel; more than one implies streaming
+            chunk_size: Number of orders sent to a worker, or transformed
+                as one columnar batch, at a time
+            engine: 'staged' to run Validator then Transformer, 'fused' to
+                validate and transform each order in a single traversal, or
+                'columnar' to transform and analyze NumPy batches of
+                chunk_size orders (implies streaming)
+            compact: Hold orders as slotted Order records instead of dicts
+            pretty: Indent the JSON output; False writes compact JSON
+            json_backend: JSON library for reading and writing ('orjson',
+                'ujson' or 'json'); the standard library json if omitted
+            use_mmap: Memory-map the input file (see Reader); with workers,
+                each worker parses its own byte ranges of the shared mapping
+                instead of receiving pickled orders
+            index_path: SQLite file remembering every processed order; when
+                set, only new or changed orders are validated, transformed and
+                re-analyzed (implies streaming, ignores workers and engine)
+            compression_level: Level used for compressed output
+            hooks: Metrics hooks told when each stage starts, ends or fails and
+                after every chunk_size orders of a streamed stage
+            quiet: Log progress messages through the logging module
+                instead of printing them
+            profile: Path of a report to write with cProfile statistics and
+                tracemalloc's top allocations for each stage; slows the run
+            dedup: Drop orders repeating an order_id before validation,
+                keeping the 'first' or the 'last' one (the latter reads the
+                input twice); the number dropped is reported as
+                duplicate_rows in the validation summary
+            dedup_memory_keys: order_ids held in memory before the dedup
+                index spills to a temporary on-disk table
+            time_bucket: 'hour' or 'day' to add revenue and payment status
+                counts per time bucket to the statistics as time_buckets
+            group_by: Order field, e.g. 'item', whose per-value orders,
+                quantity and revenue are added to the statistics as groups
+            top_n: Report only the top_n groups by revenue
+            max_groups: Bound group_by memory to this many keys with an
+                approximate Space-Saving top-K (cannot be used with
+                index_path, since orders cannot be taken back out)
+            distribution: Add min, max, variance and p50/p90/p99 of the
+                order totals to the statistics as total_distribution
+                (cannot be used with index_path either)
+            sketch_size: KLL sketch k for the percentiles; larger is more
+                accurate but uses more memory
+            cache_dir: Directory caching output files and results by input
+                fingerprint (path, size, mtime and content hash) and
+                settings; a rerun on unchanged input copies the cached
+                output instead of processing it (cannot be used with
+                index_path)
+            cache_max_bytes: Size of the cache, beyond which the least
+                recently used runs are evicted
         """
-        self.reader = Reader(input_path)
-        self.validator = Validator()
+        if engine not in self.ENGINES:
+            raise ValueError(f"Unsupported engine: {engine}")
+        if max_groups is not None and index_path is not None:
+            raise ValueError("max_groups cannot be used with index_path")
+        if distribution and index_path is not None:
+            raise ValueError("distribution cannot be used with index_path")
+        if cache_dir is not None and index_path is not None:
+            raise ValueError("cache_dir cannot be used with index_path")
+        
+        self.reader = open_reader(input_path, json_backend=json_backend, use_mmap=use_mmap)
+        self.streaming = (streaming or workers > 1 or engine == 'columnar'
+                          or index_path is not None)
+        self.validator = Validator(
+            Validator.STREAMING_MAX_INVALID_ROWS if self.streaming else None)
         self.transformer = Transformer()
-        self.analyzer = Analyzer()
-        self.exporter = Exporter(output_path)
+        # Passed to the analyzers of worker processes as well
+        self.analyzer_options = {'time_bucket': time_bucket, 'group_by': group_by,
+                                 'top_n': top_n, 'max_groups': max_groups,
+                                 'distribution': distribution, 'sketch_size': sketch_size}
+        self.analyzer = Analyzer(**self.analyzer_options)
+        self.exporter = Exporter(output_path, pretty=pretty, json_backend=json_backend,
+                                 compression_level=compression_level)
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.engine = engine
+        self.compact = compact
+        self.validate_transform = ValidateTransform(self.validator, self.transformer)
+        self.columnar = (ColumnarEngine(self.transformer, self.analyzer)
+                         if engine == 'columnar' else None)
+        self.index = (OrderIndex(index_path, self._signature())
+                      if index_path is not None else None)
+        self.incremental_summary = {'reused': 0, 'processed': 0, 'removed': 0}
+        self.deduplicator = (Deduplicator(dedup, max_memory_keys=dedup_memory_keys)
+                             if dedup is not None else None)
+        hooks = list(hooks or [])
+        self.profiler = Profiler(profile) if profile is not None else None
+        if self.profiler is not None:
+            hooks.append(self.profiler)
+        self.monitor = StageMonitor(hooks, batch_size=chunk_size)
+        self.quiet = quiet
+        self.cache = (ResultCache(cache_dir, cache_max_bytes)
+                      if cache_dir is not None else None)
+        self.cache_hit = False
     
     def run(self) -> dict:
         """
@@ -29,54 +162,497 @@ class Pipeline:
         Returns:
             Dictionary with pipeline results and statistics
         """
-        # Read data
-        print("Reading data...")
-        raw_data = self.reader.read()
-        print(f"Read {len(raw_data)} orders")
+        with self.monitor.stage(RUN_STAGE) as metrics:
+            results = self._run_cached() if self.cache is not None else self._run()
+            if self.monitor.hooks:
+                metrics['orders'] = results['total_processed']
+                metrics['bytes_read'] = self._input_size()
+                metrics['bytes_written'] = self._output_size()
+        return results
+    
+    def _run(self) -> dict:
+        """Run every stage in streaming or batch mode."""
+        return self._run_streaming() if self.streaming else self._run_batch()
+    
+    def _run_cached(self) -> dict:
+        """Restore the results of an identical earlier run, or run and cache them."""
+        self.cache_hit = False
+        try:
+            key = self.cache.key(self._input_paths(), self._cache_config())
+        except OSError:
+            # Missing input; the reader reports it
+            return self._run()
         
-        # Validate
-        print("\nValidating data...")
-        valid_data = self.validator.validate(raw_data)
-        validation_summary = self.validator.get_summary()
-        print(f"Valid orders: {validation_summary['valid_rows']}")
-        print(f"Invalid orders: {validation_summary['invalid_rows']}")
+        results = self.cache.load(key, self._output_paths())
+        if results is not None:
+            self.cache_hit = True
+            self._echo("Input unchanged; restored cached results")
+            return results
         
-        if validation_summary['invalid_rows'] > 0:
-            print("\nInvalid order reasons:")
-            for reason, count in validation_summary['reasons'].items():
-                print(f"  - {reason}: {count}")
+        results = self._run()
+        self.cache.store(key, self._output_paths(), results)
+        return results
+    
+    def _run_batch(self) -> dict:
+        """Run each stage over the whole input before the next one."""
+        monitor = self.monitor
+        
+        # Read data
+        self._echo("Reading data...")
+        with monitor.stage('read') as metrics:
+            raw_data = list(self.reader.iter_records()) if self.compact else self.reader.read()
+            metrics['orders'] = len(raw_data)
+            metrics['bytes_read'] = self._input_size()
+        self._echo(f"Read {len(raw_data)} orders")
         
-        # Transform
-        print("\nTransforming data...")
-        transformed_data = self.transformer.transform(valid_data)
-        print(f"Transformed {len(transformed_data)} orders")
+        if self.deduplicator is not None:
+            with monitor.stage('dedup') as metrics:
+                raw_data = self.deduplicator.dedup(raw_data)
+                metrics['orders'] = len(raw_data)
+        
+        if self.engine == 'fused':
+            # Validate and transform
+            self._echo("\nValidating and transforming data...")
+            with monitor.stage('validate_transform') as metrics:
+                transformed_data = self.validate_transform.run(raw_data)
+                metrics['orders'] = len(raw_data)
+            validation_summary = self._get_validation_summary()
+            self._print_validation(validation_summary)
+        else:
+            # Validate
+            self._echo("\nValidating data...")
+            with monitor.stage('validate') as metrics:
+                valid_data = list(self.validator.iter_validate_parsed(raw_data))
+                metrics['orders'] = len(raw_data)
+            validation_summary = self._get_validation_summary()
+            self._print_validation(validation_summary)
+            
+            # Transform
+            self._echo("\nTransforming data...")
+            with monitor.stage('transform') as metrics:
+                transformed_data = list(self.transformer.iter_transform_parsed(valid_data))
+                metrics['orders'] = len(transformed_data)
+        self._echo(f"Transformed {len(transformed_data)} orders")
         
         # Analyze
-        print("\nAnalyzing data...")
-        stats = self.analyzer.analyze(transformed_data)
-        print(f"Total revenue: ${stats['total_revenue']:.2f}")
-        print(f"Average revenue: ${stats['average_revenue']:.2f}")
-        print(f"Payment status breakdown:")
-        print(f"  - Paid: {stats['payment_status_counts']['paid']}")
-        print(f"  - Pending: {stats['payment_status_counts']['pending']}")
-        print(f"  - Refunded: {stats['payment_status_counts']['refunded']}")
+        self._echo("\nAnalyzing data...")
+        with monitor.stage('analyze') as metrics:
+            stats = self.analyzer.analyze(transformed_data)
+            metrics['orders'] = len(transformed_data)
+        self._print_statistics(stats)
         
         # Export
-        print("\nExporting results...")
-        self.exporter.export(transformed_data, stats)
-        print(f"Results exported successfully")
+        self._echo("\nExporting results...")
+        with monitor.stage('export') as metrics:
+            self.exporter.export(transformed_data, stats)
+            metrics['orders'] = len(transformed_data)
+            metrics['bytes_written'] = self._output_size()
+        self._echo(f"Results exported successfully")
         
         return {
             'validation_summary': validation_summary,
             'statistics': stats,
             'total_processed': len(transformed_data)
         }
+    
+    def _run_streaming(self) -> dict:
+        """Run all stages as one generator chain."""
+        self._echo("Streaming orders through the pipeline...")
+        # Each stage is timed as orders are pulled through it (with hooks)
+        track = self.monitor.track
+        read = track('read', self._iter_input(), bytes_read=self._input_size())
+        if self.deduplicator is not None:
+            first_pass = self._iter_input() if self.deduplicator.policy == 'last' else None
+            read = track('dedup', self.deduplicator.iter_dedup(read, first_pass), read)
+        
+        if self.index is not None:
+            return self._run_incremental(read)
+        elif self.workers > 1:
+            # Without dedup, workers read the input themselves
+            self.analyzer.reset()
+            orders = track('process', self._iter_parallel(
+                read if self.deduplicator is not None else None))
+        elif self.engine == 'fused':
+            orders = track('validate_transform', self.validate_transform.process(read), read)
+            orders = track('analyze', self.analyzer.track(orders), orders)
+        elif self.engine == 'columnar':
+            self.analyzer.reset()
+            orders = track('validate', self.validator.iter_validate_parsed(read), read)
+            orders = track('transform_analyze', self._iter_columnar(orders), orders)
+        else:
+            orders = track('validate', self.validator.iter_validate_parsed(read), read)
+            orders = track('transform', self.transformer.iter_transform_parsed(orders), orders)
+            orders = track('analyze', self.analyzer.track(orders), orders)
+        total_processed = self._export_stream(orders)
+        return self._finish_streaming(total_processed)
+    
+    def _export_stream(self, orders: Iterable[Dict[str, Any]]) -> int:
+        """Export streamed orders, timing the export separately from upstream stages."""
+        with self.monitor.stage('export', exclude=orders) as metrics:
+            total_processed = self.exporter.export_stream(orders, self.analyzer.get_stats)
+            metrics['orders'] = total_processed
+            metrics['bytes_written'] = self._output_size()
+        return total_processed
+    
+    def _run_incremental(self, orders: Iterable[Dict[str, Any]]) -> dict:
+        """Run the streaming chain against the processed-order index."""
+        with self.index:
+            orders = self.monitor.track('process', self._iter_incremental(orders), orders)
+            total_processed = self._export_stream(orders)
+        
+        self._echo(f"Reused {self.incremental_summary['reused']} unchanged orders, "
+                   f"processed {self.incremental_summary['processed']}, "
+                   f"removed {self.incremental_summary['removed']}")
+        results = self._finish_streaming(total_processed)
+        results['incremental_summary'] = dict(self.incremental_summary)
+        return results
+    
+    def _finish_streaming(self, total_processed: int) -> dict:
+        """Report and return the results of a streaming run."""
+        validation_summary = self._get_validation_summary()
+        stats = self.analyzer.get_stats()
+        self._echo(f"Read {validation_summary['total_rows']} orders")
+        self._print_validation(validation_summary)
+        self._echo(f"Transformed {total_processed} orders")
+        self._print_statistics(stats)
+        self._echo(f"Results exported successfully")
+        
+        return {
+            'validation_summary': validation_summary,
+            'statistics': stats,
+            'total_processed': total_processed
+        }
+    
+    def _iter_incremental(self, orders: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield transformed orders, reusing stored results for unchanged ones.
+        
+        Orders are matched by order_id (and occurrence, for repeated ids) and
+        compared by content hash. Statistics start from the previous run's
+        exact accumulator state: changed and vanished orders are subtracted
+        and new ones added, so the work done is proportional to the delta.
+        """
+        index = self.index
+        serializer = self.reader.serializer
+        validator = self.validator
+        summary = self.incremental_summary
+        
+        state = index.load_statistics()
+        accumulator = (AnalyzerAccumulator.from_state(state) if state is not None
+                       else self.analyzer.new_accumulator())
+        self.analyzer.accumulator = accumulator
+        
+        orders = iter(orders)
+        occurrences: Dict[str, int] = {}
+        idx = 0
+        while True:
+            chunk = list(islice(orders, index.BATCH_SIZE))
+            if not chunk:
+                break
+            keys = [self._order_key(order, idx + offset, occurrences)
+                    for offset, order in enumerate(chunk)]
+            known = index.lookup(keys)
+            unchanged = []
+            changed = []
+            
+            for key, order in zip(keys, chunk):
+                digest = content_hash(order)
+                previous = known.get(key)
+                
+                if previous is not None and previous[0] == digest:
+                    _, reason, transformed = previous
+                    validator.record(idx, order, reason)
+                    unchanged.append(key)
+                    summary['reused'] += 1
+                    if reason is None:
+                        yield serializer.loads(transformed)
+                else:
+                    if previous is not None and previous[2] is not None:
+                        accumulator.remove(serializer.loads(previous[2]))
+                    reason, values = validator._check_order(order)
+                    validator.record(idx, order, reason)
+                    transformed = None
+                    summary['processed'] += 1
+                    if reason is None:
+                        result = self.transformer._transform_order(order.copy(), values)
+                        accumulator.update(result)
+                        transformed = serializer.dumps(result, pretty=False)
+                        yield result
+                    changed.append((key, digest, reason, transformed))
+                idx += 1
+            
+            index.touch(unchanged)
+            index.store(changed)
+        
+        for transformed in index.pop_stale():
+            summary['removed'] += 1
+            if transformed is not None:
+                accumulator.remove(serializer.loads(transformed))
+        index.save_statistics(accumulator.to_state())
+    
+    def _order_key(self, order: Dict[str, Any], idx: int, occurrences: Dict[str, int]) -> str:
+        """Build the index key for an order from its id and occurrence."""
+        order_id = order.get('order_id')
+        if order_id is None or order_id == '':
+            # No usable id: fall back to the position in the input
+            return json.dumps([None, idx])
+        
+        id_key = json.dumps(order_id, sort_keys=True, default=str)
+        occurrence = occurrences.get(id_key, 0)
+        occurrences[id_key] = occurrence + 1
+        return json.dumps([order_id, occurrence], sort_keys=True, default=str)
+    
+    def _signature(self) -> str:
+        """Identify the code and settings that determine stored results."""
+        from . import __version__
+        return json.dumps({'version': __version__, 'code': code_fingerprint(),
+                           'analyzer': self.analyzer_options}, sort_keys=True)
+    
+    def _cache_config(self) -> Dict[str, Any]:
+        """Get the code and settings that determine the output files and results."""
+        from . import __version__
+        exporter = self.exporter
+        return {
+            'version': __version__,
+            'code': code_fingerprint(),
+            'analyzer': self.analyzer_options,
+            'dedup': self.deduplicator.policy if self.deduplicator is not None else None,
+            'source_field': getattr(self.reader, 'source_field', None),
+            'format': exporter.output_format,
+            'compression': exporter.compression,
+            'compression_level': exporter.compression_level,
+            'pretty': exporter.pretty,
+            'json_backend': exporter.serializer.name,
+            'row_group_size': exporter.row_group_size
+        }
+    
+    def _iter_columnar(self, parsed: Iterable[Tuple[Dict[str, Any], Tuple[float, float, float]]]
+                       ) -> Iterator[Dict[str, Any]]:
+        """Transform and analyze validated orders in columnar batches."""
+        parsed = iter(parsed)
+        
+        while True:
+            chunk = list(islice(parsed, self.chunk_size))
+            if not chunk:
+                break
+            batch = self.columnar.transform_parsed(chunk)
+            self.columnar.accumulate(batch, self.analyzer.accumulator)
+            yield from batch.to_orders()
+    
+    def _iter_input(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the input orders as dicts or compact records."""
+        return self.reader.iter_records() if self.compact else self.reader.iter_orders()
+    
+    def _iter_parallel(self, orders: Optional[Iterable[Dict[str, Any]]] = None
+                       ) -> Iterator[Dict[str, Any]]:
+        """
+        Validate and transform chunks of orders in worker processes.
+        
+        Results are consumed in submission order and only a bounded number
+        of chunks is in flight, so output and validation summary are the same
+        as a serial run and memory stays proportional to chunk_size. Each
+        worker also returns the chunk's analyzer accumulator, which is merged
+        into the running statistics.
+        
+        Args:
+            orders: Orders to process; read from the input if omitted
+        """
+        options = self.analyzer_options
+        if orders is not None:
+            orders = iter(orders)
+            task = partial(_process_chunk, analyzer_options=options)
+        elif self.reader.use_mmap:
+            # Ship byte ranges; workers parse them from their own mapping
+            orders = self.reader.iter_spans()
+            task = partial(_process_span_chunk, str(self.reader.filepath),
+                           self.reader.serializer.name, compact=self.compact,
+                           analyzer_options=options)
+        else:
+            orders = self._iter_input()
+            task = partial(_process_chunk, analyzer_options=options)
+        
+        pending = deque()
+        offset = 0
+        
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            while True:
+                while len(pending) < self.workers * 2:
+                    chunk = list(islice(orders, self.chunk_size))
+                    if not chunk:
+                        break
+                    pending.append((offset, executor.submit(task, chunk)))
+                    offset += len(chunk)
+                
+                if not pending:
+                    break
+                
+                chunk_offset, future = pending.popleft()
+                transformed, summary, invalid_rows, accumulator = future.result()
+                self.validator.merge(summary, invalid_rows, chunk_offset)
+                self.analyzer.accumulator.merge(accumulator)
+                yield from transformed
+    
+    def _input_size(self) -> int:
+        """Get the bytes on disk of the input files, for metrics hooks."""
+        if not self.monitor.hooks:
+            return 0
+        try:
+            return sum(path.stat().st_size for path in self._input_paths())
+        except OSError:
+            # Missing input; the reader reports it
+            return 0
+    
+    def _input_paths(self) -> List[Path]:
+        """Get the input files the reader reads."""
+        if isinstance(self.reader, MultiReader):
+            return self.reader.find_files()
+        return [self.reader.filepath]
+    
+    def _output_paths(self) -> List[Path]:
+        """Get the files an export writes."""
+        paths = [self.exporter.output_path]
+        if self.exporter.output_format == 'jsonl':
+            paths.append(self.exporter.metadata_path)
+        return paths
+    
+    def _output_size(self) -> int:
+        """Get the bytes on disk of the output files, for metrics hooks."""
+        if not self.monitor.hooks:
+            return 0
+        return sum(path.stat().st_size for path in self._output_paths() if path.exists())
+    
+    def _echo(self, message: str) -> None:
+        """Report progress on stdout, or to the log in quiet mode."""
+        if self.quiet:
+            logger.info(message.strip())
+        else:
+            print(message)
+    
+    def _get_validation_summary(self) -> dict:
+        """Get the validation summary, including dedup counts when enabled."""
+        validation_summary = self.validator.get_summary()
+        if self.deduplicator is not None:
+            validation_summary['duplicate_rows'] = self.deduplicator.duplicates
+        return validation_summary
+    
+    def _print_validation(self, validation_summary: dict) -> None:
+        """Print validation results."""
+        if 'duplicate_rows' in validation_summary:
+            self._echo(f"Duplicate orders: {validation_summary['duplicate_rows']}")
+        self._echo(f"Valid orders: {validation_summary['valid_rows']}")
+        self._echo(f"Invalid orders: {validation_summary['invalid_rows']}")
+        
+        if validation_summary['invalid_rows'] > 0:
+            self._echo("\nInvalid order reasons:")
+            for reason, count in validation_summary['reasons'].items():
+                self._echo(f"  - {reason}: {count}")
+    
+    def _print_statistics(self, stats: dict) -> None:
+        """Print analysis results."""
+        self._echo(f"Total revenue: ${stats['total_revenue']:.2f}")
+        self._echo(f"Average revenue: ${stats['average_revenue']:.2f}")
+        self._echo(f"Payment status breakdown:")
+        self._echo(f"  - Paid: {stats['payment_status_counts']['paid']}")
+        self._echo(f"  - Pending: {stats['payment_status_counts']['pending']}")
+        self._echo(f"  - Refunded: {stats['payment_status_counts']['refunded']}")
+        
+        if 'groups' in stats:
+            groups = stats['groups']
+            approximate = " (approximate)" if groups.get('approximate') else ""
+            self._echo(f"Top {groups['field']} by {groups['rank_by']}{approximate}:")
+            for group in groups['groups']:
+                self._echo(f"  - {group['key']}: {group[groups['rank_by']]}")
+        
+        if 'total_distribution' in stats:
+            distribution = stats['total_distribution']
+            self._echo(f"Order totals: min ${distribution['min']:.2f}, "
+                       f"p50 ${distribution['p50']:.2f}, p90 ${distribution['p90']:.2f}, "
+                       f"p99 ${distribution['p99']:.2f}, max ${distribution['max']:.2f}")
 
 
-if __name__ == '__main__':
-    pipeline = Pipeline('shoplink.json', 'shoplink_cleaned.json')
+def open_reader(input_path: Union[str, Path], json_backend: Optional[str] = None,
+                use_mmap: bool = False) -> Union[Reader, MultiReader]:
+    """
+    Create the reader for an input path.
+    
+    Args:
+        input_path: A single file, or a directory or glob pattern
+        json_backend: JSON library used for parsing
+        use_mmap: Memory-map a single input file
+        
+    Returns:
+        MultiReader for directories and globs, Reader otherwise
+    """
+    if is_multi_source(input_path):
+        return MultiReader(input_path, json_backend=json_backend)
+    return Reader(input_path, json_backend=json_backend, use_mmap=use_mmap)
+
+
+def _process_chunk(chunk: List[Dict[str, Any]],
+                   analyzer_options: Optional[Dict[str, Any]] = None
+                   ) -> Tuple[List[Dict[str, Any]], Dict[str, Any], List[Dict[str, Any]],
+                              AnalyzerAccumulator]:
+    """Validate, transform and analyze one chunk of orders in a worker process."""
+    # The chunk is a private copy, so the fused stage can transform in place
+    validator = Validator()
+    transformed = ValidateTransform(validator).run(chunk)
+    accumulator = Analyzer(**(analyzer_options or {})).new_accumulator()
+    for order in transformed:
+        accumulator.update(order)
+    return transformed, validator.get_summary(), validator.invalid_rows, accumulator
+
+
+def _process_span_chunk(path: str, json_backend: str, spans: List[Tuple[int, int]],
+                        compact: bool = False,
+                        analyzer_options: Optional[Dict[str, Any]] = None
+                        ) -> Tuple[List[Dict[str, Any]], Dict[str, Any],
+                                   List[Dict[str, Any]], AnalyzerAccumulator]:
+    """Parse a chunk of orders from a memory-mapped file, then process it."""
+    reader = Reader(path, json_backend=json_backend, use_mmap=True)
+    chunk = reader.read_spans(spans)
+    if compact:
+        chunk = [Order.from_dict(data) if isinstance(data, dict) else data for data in chunk]
+    return _process_chunk(chunk, analyzer_options)
+
+
+def main(argv: Optional[List[str]] = None) -> dict:
+    """Run the pipeline from the command line."""
+    parser = argparse.ArgumentParser(description="Clean and analyze ShopLink orders.")
+    parser.add_argument('input_path', nargs='?', default='shoplink.json')
+    parser.add_argument('output_path', nargs='?', default='shoplink_cleaned.json')
+    parser.add_argument('--streaming', action='store_true',
+                        help="stream orders through the stages")
+    parser.add_argument('--profile', metavar='REPORT',
+                        help="write a per-stage cProfile/tracemalloc report")
+    parser.add_argument('--time-bucket', choices=BUCKETS,
+                        help="add revenue and status counts per hour or day")
+    parser.add_argument('--group-by', metavar='FIELD',
+                        help="add orders, quantity and revenue per value of FIELD")
+    parser.add_argument('--top', type=int, metavar='N', help="report only the top N groups")
+    parser.add_argument('--max-groups', type=int, metavar='K',
+                        help="track at most K groups (approximate top-K)")
+    parser.add_argument('--distribution', action='store_true',
+                        help="add min, max, variance and percentiles of order totals")
+    parser.add_argument('--cache-dir', metavar='DIR',
+                        help="reuse cached results when the input is unchanged")
+    parser.add_argument('--json-backend', choices=sorted(BACKENDS),
+                        help="JSON library for reading and writing (default: json)")
+    args = parser.parse_args(argv)
+    
+    pipeline = Pipeline(args.input_path, args.output_path, streaming=args.streaming,
+                        profile=args.profile, time_bucket=args.time_bucket,
+                        group_by=args.group_by, top_n=args.top,
+                        max_groups=args.max_groups, distribution=args.distribution,
+                        cache_dir=args.cache_dir, json_backend=args.json_backend)
     results = pipeline.run()
     print("\n" + "="*50)
     print("Pipeline completed successfully!")
     print(f"Processed {results['total_processed']} orders")
-    print("="*50)
\ No newline at end of file
+    print("="*50)
+    if args.profile:
+        print(f"Profile written to {args.profile}")
+    return results
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
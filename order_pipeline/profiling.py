@@ -0,0 +1,166 @@
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Union
+
+from .metrics import MetricsHook, RUN_STAGE
+
+
+class Profiler(MetricsHook):
+    """Profiles CPU time and allocations per stage and writes a report."""
+    
+    # Per-line statistics only need the innermost frame, and every extra
+    # frame makes snapshots slower to compare
+    TRACE_FRAMES = 1
+    
+    def __init__(self, path: Union[str, Path], top: int = 25):
+        """
+        Initialize the profiler.
+        
+        Args:
+            path: Text report to write when the run finishes; the combined
+                cProfile data is also saved next to it with a .prof suffix
+                for tools such as snakeviz
+            top: Functions and allocation sites listed per section
+        """
+        self.path = Path(path)
+        self.top = top
+        self.sections: List[Dict[str, Any]] = []
+        self._run_profile: Optional[cProfile.Profile] = None
+        self._current: Optional[Dict[str, Any]] = None
+        self._started_tracing = False
+    
+    def on_stage_start(self, stage: str) -> None:
+        """Start profiling the run, or switch to a profile for the stage."""
+        if stage == RUN_STAGE:
+            self._started_tracing = not tracemalloc.is_tracing()
+            if self._started_tracing:
+                tracemalloc.start(self.TRACE_FRAMES)
+            self._run_profile = cProfile.Profile()
+            self._run_profile.enable()
+            return
+        
+        if self._current is not None:
+            # Streamed stages run interleaved, so the outer stage's profile
+            # covers the whole chain rather than any one stage
+            self._current['overlaps'].append(stage)
+            return
+        
+        self._run_profile.disable()
+        profile = cProfile.Profile()
+        self._current = {
+            'stage': stage,
+            'profile': profile,
+            'snapshot': tracemalloc.take_snapshot(),
+            'overlaps': [],
+            'stage_seconds': {},
+            'start': time.perf_counter()
+        }
+        profile.enable()
+    
+    def on_stage_end(self, stage: str, metrics: Dict[str, Any]) -> None:
+        """Finish a stage's section, or write the report at the end of the run."""
+        if stage == RUN_STAGE:
+            self._run_profile.disable()
+            self._finish_run(metrics)
+            return
+        
+        current = self._current
+        if current is None:
+            return
+        current['stage_seconds'][stage] = metrics['seconds']
+        if current['stage'] != stage:
+            return
+        current['profile'].disable()
+        current['seconds'] = time.perf_counter() - current.pop('start')
+        current['metrics'] = dict(metrics)
+        current['allocations'] = self._allocations(current.pop('snapshot'))
+        self.sections.append(current)
+        self._current = None
+        self._run_profile.enable()
+    
+    def on_stage_error(self, stage: str, error: BaseException) -> None:
+        """Stop profiling a failed stage, or the whole run without a report."""
+        current = self._current
+        if current is not None and stage in (current['stage'], RUN_STAGE):
+            current['profile'].disable()
+            self._current = None
+            if stage != RUN_STAGE:
+                self._run_profile.enable()
+        
+        if stage == RUN_STAGE:
+            self._run_profile.disable()
+            self.sections = []
+            if self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+    
+    def _finish_run(self, metrics: Dict[str, Any]) -> None:
+        """Combine all profiles and write the report files."""
+        stats = pstats.Stats(self._run_profile)
+        for section in self.sections:
+            stats.add(section['profile'])
+        
+        lines = ["Pipeline profile", "================", ""]
+        lines.append(f"Run: {metrics['orders']} orders in {metrics['seconds']:.3f}s "
+                     f"(timings include profiling overhead)")
+        lines.append("")
+        
+        for section in self.sections:
+            lines += self._section_header(section)
+            lines += ["", "CPU, by cumulative time:", self._format_stats(pstats.Stats(section['profile']))]
+            lines += ["Memory allocated during the section and still held at its end:"]
+            lines += section['allocations'] + [""]
+        
+        title = "Whole run"
+        lines += [title, '-' * len(title), "", "CPU, by cumulative time:", self._format_stats(stats)]
+        lines += ["Largest allocations still held at the end of the run:"]
+        lines += self._allocations() + [""]
+        
+        if self._started_tracing:
+            tracemalloc.stop()
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text('\n'.join(lines), encoding='utf-8')
+        stats.dump_stats(str(self.path.with_suffix('.prof')))
+    
+    def _section_header(self, section: Dict[str, Any]) -> List[str]:
+        """Title a stage's section, or the whole chain of streamed stages."""
+        stage_metrics = section['metrics']
+        if not section['overlaps']:
+            title = f"Stage {section['stage']}: {stage_metrics['orders']} orders " \
+                    f"in {stage_metrics['seconds']:.3f}s"
+            return [title, '-' * len(title)]
+        
+        # Inner stages start as the outer ones first pull from them
+        stages = list(reversed(section['overlaps'])) + [section['stage']]
+        title = f"Streamed stages {', '.join(stages)}: " \
+                f"{stage_metrics['orders']} orders in {section['seconds']:.3f}s"
+        own = ', '.join(f"{stage} {section['stage_seconds'].get(stage, 0.0):.3f}s"
+                        for stage in stages)
+        return [title, '-' * len(title),
+                "The stages run interleaved, so the profile below covers all of them.",
+                f"Time spent in each stage itself: {own}"]
+    
+    def _format_stats(self, stats: pstats.Stats) -> str:
+        """Render the top functions of a profile."""
+        stream = io.StringIO()
+        stats.stream = stream
+        stats.sort_stats('cumulative').print_stats(self.top)
+        return stream.getvalue()
+    
+    def _allocations(self, before: Optional[tracemalloc.Snapshot] = None) -> List[str]:
+        """List the top allocation sites, optionally as growth since a snapshot."""
+        snapshot = tracemalloc.take_snapshot()
+        if before is not None:
+            entries = snapshot.compare_to(before, 'lineno')
+        else:
+            entries = snapshot.statistics('lineno')
+        # Leave out the profiler's own bookkeeping
+        ignored = (tracemalloc.__file__, cProfile.__file__, __file__)
+        entries = [entry for entry in entries
+                   if entry.traceback[0].filename not in ignored]
+        return [f"  {entry}" for entry in entries[:self.top]]
\ No newline at end of file
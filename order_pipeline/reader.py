@@ -1,19 +1,52 @@
+import io
 import json
-from typing import List, Dict, Any
+import mmap
+import re
+from contextlib import closing, contextmanager
+from typing import List, Dict, Any, BinaryIO, Iterable, Iterator, Optional, TextIO, Tuple
 from pathlib import Path
 
+from .compression import detect_compression, open_compressed, strip_compression
+from .order import Order
+from .serializer import get_backend
+
+# Strings (skipped whole, so brackets inside them are ignored) and the
+# structural characters that delimit array elements
+_JSON_TOKENS = re.compile(rb'"(?:[^"\\]|\\.)*"|[\[\]{},]', re.DOTALL)
+_WHITESPACE = b' \t\n\r'
+_OPENERS = (ord('['), ord('{'))
+_QUOTE = ord('"')
+_COMMA = ord(',')
+
 
 class Reader:
-    """Reads order data from JSON files."""
+    """Reads order data from JSON and JSON Lines files, optionally compressed."""
+    
+    CHUNK_SIZE = 64 * 1024
+    JSON_LINES_SUFFIXES = ('.jsonl', '.ndjson')
     
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, json_backend: Optional[str] = None,
+                 use_mmap: bool = False):
         """
         Initialize the Reader with a file path.
         
         Args:
-            filepath: Path to the JSON file
+            filepath: Path to the JSON or JSON Lines file; a .gz, .bz2 or
+                .zst suffix (e.g. orders.jsonl.gz) decompresses it on the fly
+            json_backend: JSON library used to parse whole documents and
+                JSON Lines records; the standard library json if omitted
+            use_mmap: Memory-map the file and parse straight from the
+                page cache instead of reading it into a decoded string;
+                backends other than orjson parse it one order at a time,
+                since they would otherwise copy the whole mapping; ignored
+                for compressed files, which cannot be mapped
         """
         self.filepath = Path(filepath)
+        self.serializer = get_backend(json_backend)
+        self.compression = detect_compression(self.filepath)
+        self.use_mmap = use_mmap and self.compression is None
+        self.format_suffix = strip_compression(self.filepath).suffix.lower()
+        self.json_lines = self.format_suffix in self.JSON_LINES_SUFFIXES
     
     def read(self) -> List[Dict[str, Any]]:
         """
@@ -21,27 +54,363 @@ class Reader:
         
         Returns:
             List of order dictionaries
-            
+        
         Raises:
             ValueError: If file format is unsupported or file is empty
             FileNotFoundError: If file doesn't exist
         """
-        if not self.filepath.exists():
-            raise FileNotFoundError(f"File not found: {self.filepath}")
+        self._check_file()
+        
+        if self.use_mmap:
+            with self._map() as buffer:
+                if self.json_lines or not self.serializer.parses_buffers:
+                    # Close the scan before unmapping, even if an order fails
+                    with closing(self._iter_spans(buffer)) as spans:
+                        data = [self._load_span(buffer, start, end)
+                                for start, end in spans]
+                else:
+                    data = self._load_buffer(buffer)
+            self._check_data(data)
+            return data
         
-        if self.filepath.suffix.lower() != '.json':
-            raise ValueError(f"Unsupported file format: {self.filepath.suffix}")
+        if self.json_lines:
+            with self._open_text() as f:
+                data = list(self._iter_json_lines(f))
+            self._check_data(data)
+            return data
         
+        with self._open_binary() as f:
+            content = f.read()
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except json.JSONDecodeError as e:
+            data = self.serializer.loads(content)
+        except ValueError as e:
             raise ValueError(f"Invalid JSON format: {e}")
         
+        self._check_data(data)
+        
+        return data
+    
+    def iter_orders(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over orders one at a time without loading the whole file.
+        
+        The top-level JSON array (or each JSON Lines record) is parsed
+        incrementally, so memory use is bounded by the size of a single
+        order rather than the file.
+        
+        Yields:
+            Order dictionaries in file order
+        
+        Raises:
+            ValueError: If file format is unsupported, invalid or empty
+            FileNotFoundError: If file doesn't exist
+        """
+        self._check_file()
+        
+        if self.use_mmap:
+            with self._map() as buffer:
+                for start, end in self._iter_spans(buffer):
+                    yield self._load_span(buffer, start, end)
+            return
+        
+        with self._open_text() as f:
+            if self.json_lines:
+                yield from self._iter_json_lines(f)
+            else:
+                yield from self._iter_json_array(f)
+    
+    def iter_records(self) -> Iterator[Order]:
+        """
+        Iterate over orders as compact Order records.
+        
+        Yields:
+            Order records in file order (non-object elements unchanged)
+        
+        Raises:
+            ValueError: If file format is unsupported, invalid or empty
+            FileNotFoundError: If file doesn't exist
+        """
+        for data in self.iter_orders():
+            yield Order.from_dict(data) if isinstance(data, dict) else data
+    
+    def iter_spans(self) -> Iterator[Tuple[int, int]]:
+        """
+        Iterate over the byte range of every order in the file.
+        
+        The ranges can be handed to other processes, which parse just their
+        share with read_spans() from the same page-cache-backed mapping.
+        
+        Yields:
+            (start, end) byte offsets of each order, in file order
+        
+        Raises:
+            ValueError: If file format is unsupported, compressed, invalid
+                or empty
+            FileNotFoundError: If file doesn't exist
+        """
+        self._check_file()
+        self._check_mappable()
+        
+        with self._map() as buffer:
+            yield from self._iter_spans(buffer)
+    
+    def read_spans(self, spans: Iterable[Tuple[int, int]]) -> List[Dict[str, Any]]:
+        """
+        Parse the orders at the given byte ranges.
+        
+        Args:
+            spans: (start, end) byte offsets as produced by iter_spans()
+            
+        Returns:
+            List of order dictionaries
+        
+        Raises:
+            ValueError: If an order is not valid JSON or the file is compressed
+            FileNotFoundError: If file doesn't exist
+        """
+        self._check_file()
+        self._check_mappable()
+        
+        with self._map() as buffer:
+            return [self._load_span(buffer, start, end) for start, end in spans]
+    
+    def _check_file(self) -> None:
+        """Check that the input file exists and has a supported format."""
+        if not self.filepath.exists():
+            raise FileNotFoundError(f"File not found: {self.filepath}")
+        
+        suffix = self.format_suffix
+        if suffix != '.json' and suffix not in self.JSON_LINES_SUFFIXES:
+            raise ValueError(f"Unsupported file format: {strip_compression(self.filepath).suffix}")
+    
+    def _check_mappable(self) -> None:
+        """Check that the file's bytes are the JSON itself, not compressed."""
+        if self.compression is not None:
+            raise ValueError(f"Byte ranges are not available for {self.compression} files")
+    
+    def _check_data(self, data: Any) -> None:
+        """Check that a fully parsed document is a non-empty list."""
         if not data:
             raise ValueError("File is empty")
         
         if not isinstance(data, list):
             raise ValueError("JSON must contain a list of orders")
+    
+    def _open_binary(self) -> BinaryIO:
+        """Open the input file, decompressing it on the fly if needed."""
+        if self.compression is None:
+            return open(self.filepath, 'rb')
+        return open_compressed(self.filepath, self.compression)
+    
+    def _open_text(self) -> TextIO:
+        """Open the input file as UTF-8 text, decompressing it if needed."""
+        if self.compression is None:
+            return open(self.filepath, 'r', encoding='utf-8')
+        return io.TextIOWrapper(self._open_binary(), encoding='utf-8')
+    
+    @contextmanager
+    def _map(self) -> Iterator[mmap.mmap]:
+        """Memory-map the input file read-only."""
+        with open(self.filepath, 'rb') as f:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Zero-length files cannot be mapped
+                if self.json_lines:
+                    raise ValueError("File is empty")
+                raise ValueError("Invalid JSON format: file has no content")
+            with buffer:
+                yield buffer
+    
+    def _load_buffer(self, buffer: mmap.mmap) -> Any:
+        """Parse a whole mapped document."""
+        try:
+            with memoryview(buffer) as view:
+                return self.serializer.loads_buffer(view)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON format: {e}")
+    
+    def _load_span(self, buffer: mmap.mmap, start: int, end: int) -> Any:
+        """Parse the JSON value at a byte range of a mapped file."""
+        try:
+            return self.serializer.loads(buffer[start:end])
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON format at byte {start}: {e}")
+    
+    def _iter_spans(self, buffer: mmap.mmap) -> Iterator[Tuple[int, int]]:
+        """Find the byte range of every order in a mapped file."""
+        if self.json_lines:
+            return self._iter_line_spans(buffer)
+        return self._iter_array_spans(buffer)
+    
+    def _iter_line_spans(self, buffer: mmap.mmap) -> Iterator[Tuple[int, int]]:
+        """Find the byte range of every non-blank line."""
+        size = len(buffer)
+        pos = 0
+        count = 0
+        
+        while pos < size:
+            end = buffer.find(b'\n', pos)
+            if end == -1:
+                end = size
+            start, stop = self._strip_span(buffer, pos, end)
+            if start < stop:
+                yield start, stop
+                count += 1
+            pos = end + 1
+        
+        if not count:
+            raise ValueError("File is empty")
+    
+    def _iter_array_spans(self, buffer: mmap.mmap) -> Iterator[Tuple[int, int]]:
+        """Find the byte range of every element of a top-level JSON array."""
+        size = len(buffer)
+        first, _ = self._strip_span(buffer, 0, size)
+        if first == size or buffer[first] != ord('['):
+            # Not an array: fall back to a full parse for the usual errors
+            self._check_data(self._load_buffer(buffer))
+            raise ValueError("JSON must contain a list of orders")
+        
+        depth = 0
+        count = 0
+        element_start = first
+        for match in _JSON_TOKENS.finditer(buffer, first):
+            char = buffer[match.start()]
+            if char == _QUOTE:
+                continue
+            if char in _OPENERS:
+                depth += 1
+                if depth == 1:
+                    element_start = match.end()
+            elif char == _COMMA:
+                if depth == 1:
+                    yield self._element_span(buffer, element_start, match.start())
+                    count += 1
+                    element_start = match.end()
+            else:
+                depth -= 1
+                if depth == 0:
+                    start, stop = self._strip_span(buffer, element_start, match.start())
+                    if start < stop or count:
+                        yield self._element_span(buffer, element_start, match.start())
+                        count += 1
+                    break
+        else:
+            raise ValueError("Invalid JSON format: unterminated array")
+        
+        if not count:
+            raise ValueError("File is empty")
+        
+        trailing, _ = self._strip_span(buffer, match.end(), size)
+        if trailing != size:
+            raise ValueError("Invalid JSON format: extra data after array")
+    
+    def _element_span(self, buffer: mmap.mmap, start: int, end: int) -> Tuple[int, int]:
+        """Trim an array element's byte range, rejecting empty elements."""
+        start, end = self._strip_span(buffer, start, end)
+        if start == end:
+            raise ValueError(f"Invalid JSON format: missing value at byte {start}")
+        return start, end
+    
+    def _strip_span(self, buffer: mmap.mmap, start: int, end: int) -> Tuple[int, int]:
+        """Trim JSON whitespace from both ends of a byte range."""
+        while start < end and buffer[start] in _WHITESPACE:
+            start += 1
+        while end > start and buffer[end - 1] in _WHITESPACE:
+            end -= 1
+        return start, end
+    
+    def _iter_json_lines(self, f: TextIO) -> Iterator[Any]:
+        """Decode one JSON record per line, skipping blank lines."""
+        count = 0
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = self.serializer.loads(line)
+            except ValueError as e:
+                raise ValueError(f"Invalid JSON format on line {line_number}: {e}")
+            yield record
+            count += 1
+        
+        if not count:
+            raise ValueError("File is empty")
+    
+    def _iter_json_array(self, f: TextIO) -> Iterator[Any]:
+        """Incrementally decode the elements of a top-level JSON array."""
+        decoder = json.JSONDecoder()
+        buffer = ''
+        pos = 0
+        eof = False
+        
+        def fill() -> bool:
+            """Append the next chunk to the buffer, dropping consumed text."""
+            nonlocal buffer, pos, eof
+            if eof:
+                return False
+            chunk = f.read(self.CHUNK_SIZE)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            return True
+        
+        def skip_whitespace() -> str:
+            """Advance past whitespace and return the next character."""
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in ' \t\n\r':
+                    pos += 1
+                if pos < len(buffer):
+                    return buffer[pos]
+                if not fill():
+                    return ''
+        
+        first = skip_whitespace()
+        if first != '[':
+            # Not an array: fall back to a full parse for the usual errors
+            while fill():
+                pass
+            try:
+                data = json.loads(buffer[pos:])
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON format: {e}")
+            self._check_data(data)
+        pos += 1
+        
+        count = 0
+        while True:
+            char = skip_whitespace()
+            if char == ']' and count == 0:
+                raise ValueError("File is empty")
+            if char == ']':
+                pos += 1
+                break
+            if count:
+                if char != ',':
+                    raise ValueError(
+                        f"Invalid JSON format: expected ',' or ']' near {char!r}"
+                    )
+                pos += 1
+                skip_whitespace()
+            
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    # The element may straddle a chunk boundary
+                    if fill():
+                        continue
+                    raise ValueError(f"Invalid JSON format: {e}")
+                if end == len(buffer) and fill():
+                    # A trailing number could continue in the next chunk
+                    continue
+                break
+            
+            pos = end
+            count += 1
+            yield item
         
-        return data
\ No newline at end of file
+        if skip_whitespace():
+            raise ValueError("Invalid JSON format: extra data after array")
\ No newline at end of file
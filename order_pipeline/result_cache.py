@@ -0,0 +1,221 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import uuid
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .serializer import to_json
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of a cache entry changes
+CACHE_VERSION = 1
+
+DEFAULT_MAX_BYTES = 1 << 30
+
+RESULTS_FILE = 'results.json'
+
+CHUNK_SIZE = 1 << 20
+
+
+def file_fingerprint(path: Path) -> Dict[str, Any]:
+    """
+    Identify a file's current contents.
+    
+    Args:
+        path: File to fingerprint
+    
+    Returns:
+        Resolved path, size, modification time and a BLAKE2b hash of the bytes
+    
+    Raises:
+        OSError: If the file cannot be read
+    """
+    path = Path(path).resolve()
+    stat = path.stat()
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(block)
+    return {
+        'path': str(path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'hash': digest.hexdigest()
+    }
+
+
+class ResultCache:
+    """Size-bounded, least recently used on-disk cache of pipeline runs."""
+    
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the cache.
+        
+        Each entry is a directory holding copies of a run's output files and
+        its results. Using an entry marks it as recently used; after each new
+        entry the least recently used ones are deleted until the cache fits in
+        max_bytes.
+        
+        Args:
+            directory: Directory holding the cache entries
+            max_bytes: Total size of cached files to keep
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+    
+    def key(self, inputs: Iterable[Path], config: Dict[str, Any]) -> str:
+        """
+        Compute the cache key of a run.
+        
+        Args:
+            inputs: Input files read by the run
+            config: Code fingerprint and settings that determine the run's
+                output
+        
+        Returns:
+            Hex digest changing whenever an input file or the config does
+        
+        Raises:
+            OSError: If an input file cannot be read
+        """
+        fingerprint = {
+            'cache_version': CACHE_VERSION,
+            'inputs': [file_fingerprint(path) for path in inputs],
+            'config': config
+        }
+        canonical = json.dumps(fingerprint, sort_keys=True, default=to_json)
+        return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def load(self, key: str, outputs: List[Path]) -> Optional[Dict[str, Any]]:
+        """
+        Restore a cached run.
+        
+        Args:
+            key: Cache key from key()
+            outputs: Paths to copy the cached output files to, in the order
+                they were stored
+        
+        Returns:
+            The cached results, or None if the run is not cached
+        """
+        entry = self.directory / key
+        try:
+            with open(entry / RESULTS_FILE, encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        artifacts = [entry / name for name in cached.get('artifacts', [])]
+        if len(artifacts) != len(outputs) or not all(path.is_file() for path in artifacts):
+            # Incomplete entry; drop it so it is rebuilt
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+        
+        for artifact, output in zip(artifacts, outputs):
+            _copy_atomic(artifact, Path(output))
+        _touch(entry)
+        return cached['results']
+    
+    def store(self, key: str, outputs: List[Path], results: Dict[str, Any]) -> bool:
+        """
+        Cache a completed run, then evict old entries to fit in max_bytes.
+        
+        The cache is best effort: failures are logged, not raised.
+        
+        Args:
+            key: Cache key from key()
+            outputs: Output files written by the run
+            results: Results returned by the run
+        
+        Returns:
+            True if the run was cached
+        """
+        entry = self.directory / key
+        temp = self.directory / f'.{key}.{uuid.uuid4().hex[:8]}.tmp'
+        try:
+            size = sum(Path(output).stat().st_size for output in outputs)
+            if size > self.max_bytes:
+                return False
+            
+            temp.mkdir(parents=True)
+            names = []
+            for idx, output in enumerate(outputs):
+                name = f'artifact{idx}{"".join(Path(output).suffixes)}'
+                shutil.copyfile(output, temp / name)
+                names.append(name)
+            with open(temp / RESULTS_FILE, 'w', encoding='utf-8') as f:
+                json.dump({'artifacts': names, 'results': results}, f, default=to_json)
+            
+            if entry.exists():
+                shutil.rmtree(entry)
+            os.replace(temp, entry)
+        except OSError as e:
+            logger.warning("Failed to cache results: %s", e)
+            shutil.rmtree(temp, ignore_errors=True)
+            return False
+        
+        self.evict()
+        return True
+    
+    def evict(self) -> int:
+        """
+        Delete least recently used entries until the cache fits in max_bytes.
+        
+        Returns:
+            Number of entries deleted
+        """
+        entries = []
+        for entry in self._entries():
+            try:
+                last_used = (entry / RESULTS_FILE).stat().st_mtime_ns
+                size = sum(path.stat().st_size for path in entry.iterdir())
+            except OSError:
+                # Being replaced or deleted by another run
+                continue
+            entries.append((last_used, size, entry))
+        
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed += 1
+        return removed
+    
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        for entry in self._entries():
+            shutil.rmtree(entry, ignore_errors=True)
+    
+    def _entries(self) -> List[Path]:
+        """List complete entry directories, skipping ones being written."""
+        if not self.directory.is_dir():
+            return []
+        return [path for path in self.directory.iterdir()
+                if path.is_dir() and not path.name.startswith('.')]
+
+
+def _copy_atomic(source: Path, target: Path) -> None:
+    """Copy a file over the target through a temporary file next to it."""
+    temp = target.with_name(f'.{target.name}.{uuid.uuid4().hex[:8]}.tmp')
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, temp)
+        os.replace(temp, target)
+    except OSError as e:
+        with suppress(OSError):
+            temp.unlink()
+        raise IOError(f"Failed to write file: {e}")
+
+
+def _touch(entry: Path) -> None:
+    """Mark an entry as just used."""
+    with suppress(OSError):
+        os.utime(entry / RESULTS_FILE)
\ No newline at end of file
@@ -0,0 +1,146 @@
+import json
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - optional dependency
+    ujson = None
+
+
+def to_json(obj: Any) -> Any:
+    """Serialize records such as Order that are not plain dictionaries."""
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class JsonBackend:
+    """JSON serializer backed by the standard library."""
+    
+    name = 'json'
+    # Whether loads_buffer() parses the buffer in place rather than a copy
+    parses_buffers = False
+    
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Parse a JSON document.
+        
+        Args:
+            data: JSON text or UTF-8 bytes
+            
+        Returns:
+            Parsed value
+            
+        Raises:
+            ValueError: If the document is not valid JSON
+        """
+        return json.loads(data)
+    
+    def loads_buffer(self, buffer: memoryview) -> Any:
+        """
+        Parse a JSON document from a buffer such as a memory-mapped file.
+        
+        Backends that cannot read buffers directly parse a bytes copy.
+        
+        Args:
+            buffer: UTF-8 encoded JSON
+            
+        Returns:
+            Parsed value
+            
+        Raises:
+            ValueError: If the document is not valid JSON
+        """
+        return self.loads(bytes(buffer))
+    
+    def dumps(self, obj: Any, pretty: bool = True) -> str:
+        """
+        Serialize a value to JSON text.
+        
+        Args:
+            obj: Value to serialize
+            pretty: Indent with two spaces; otherwise use compact separators
+            
+        Returns:
+            JSON text
+            
+        Raises:
+            TypeError: If the value cannot be serialized
+        """
+        if pretty:
+            return json.dumps(obj, indent=2, ensure_ascii=False, default=to_json)
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=to_json)
+
+
+class OrjsonBackend(JsonBackend):
+    """JSON serializer backed by orjson."""
+    
+    name = 'orjson'
+    parses_buffers = True
+    
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+    
+    def loads_buffer(self, buffer: memoryview) -> Any:
+        # orjson parses memoryviews in place, with no intermediate copy
+        return orjson.loads(buffer)
+    
+    def dumps(self, obj: Any, pretty: bool = True) -> str:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, default=to_json, option=option).decode('utf-8')
+
+
+class UjsonBackend(JsonBackend):
+    """JSON serializer backed by ujson."""
+    
+    name = 'ujson'
+    
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return ujson.loads(data)
+    
+    def dumps(self, obj: Any, pretty: bool = True) -> str:
+        return ujson.dumps(obj, indent=2 if pretty else 0, ensure_ascii=False,
+                           escape_forward_slashes=False, default=to_json)
+
+
+BACKENDS = {
+    'orjson': (OrjsonBackend, orjson),
+    'ujson': (UjsonBackend, ujson),
+    'json': (JsonBackend, json),
+}
+
+# The accelerated backends differ in float and escaping details, so they are
+# opt-in and output is byte-identical wherever the pipeline runs by default
+DEFAULT_BACKEND = 'json'
+
+
+def get_backend(name: Optional[str] = None) -> JsonBackend:
+    """
+    Get a JSON backend by name.
+    
+    Args:
+        name: 'orjson', 'ujson' or 'json'; the standard library json if
+            omitted
+        
+    Returns:
+        JSON backend instance
+        
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If the requested backend is not installed
+    """
+    if name is None:
+        name = DEFAULT_BACKEND
+    
+    if name not in BACKENDS:
+        raise ValueError(f"Unsupported JSON backend: {name}")
+    
+    backend_class, module = BACKENDS[name]
+    if module is None:
+        raise ImportError(f"JSON backend is not installed: {name}")
+    return backend_class()
\ No newline at end of file
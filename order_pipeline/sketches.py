@@ -0,0 +1,287 @@
+import heapq
+import math
+import random
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+
+class SpaceSaving:
+    """Approximate heaviest keys of a stream in a fixed number of counters."""
+    
+    def __init__(self, capacity: int):
+        """
+        Initialize the sketch.
+        
+        Any key whose true weight exceeds total weight / capacity is
+        guaranteed to be tracked, and each reported weight overestimates the
+        true one by at most its error.
+        
+        Args:
+            capacity: Number of keys tracked at once
+        
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        
+        self.capacity = capacity
+        # Key -> [estimated weight, maximum overestimate]
+        self.counters: Dict[Hashable, List[float]] = {}
+        # Lazily deleted (weight, sequence, key) entries; an entry is stale
+        # once its key's weight has grown or the key has been evicted
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._sequence = 0
+    
+    def update(self, key: Hashable, weight: float = 1.0) -> None:
+        """
+        Add weight to a key, evicting the lightest key if the sketch is full.
+        
+        Args:
+            key: Key to count
+            weight: Non-negative weight, e.g. 1 per order or the order total
+        """
+        counter = self.counters.get(key)
+        if counter is not None:
+            counter[0] += weight
+        elif len(self.counters) < self.capacity:
+            counter = self.counters[key] = [weight, 0.0]
+        else:
+            # The newcomer inherits the evicted weight as its error bound
+            floor, _ = self._pop_min()
+            counter = self.counters[key] = [floor + weight, floor]
+        self._push(key, counter[0])
+    
+    def merge(self, other: 'SpaceSaving') -> 'SpaceSaving':
+        """
+        Fold in a sketch of another part of the stream.
+        
+        Keys missing from a full sketch may have had up to its smallest
+        weight, so that weight is added to both estimate and error before
+        the heaviest capacity keys are kept.
+        
+        Args:
+            other: Sketch with the same or any other capacity
+        
+        Returns:
+            The sketch, for chaining
+        """
+        own_floor = self._floor()
+        other_floor = other._floor()
+        merged = {}
+        for key in self.counters.keys() | other.counters.keys():
+            weight, error = self.counters.get(key, (own_floor, own_floor))
+            other_weight, other_error = other.counters.get(key, (other_floor, other_floor))
+            merged[key] = [weight + other_weight, error + other_error]
+        
+        kept = heapq.nlargest(self.capacity, merged.items(), key=lambda item: item[1][0])
+        self.counters = dict(kept)
+        self._rebuild()
+        return self
+    
+    def top(self, n: Optional[int] = None) -> List[Tuple[Hashable, float, float]]:
+        """
+        Get the heaviest keys.
+        
+        Args:
+            n: Number of keys to return; all tracked keys if omitted
+        
+        Returns:
+            (key, estimated weight, maximum overestimate) tuples, heaviest first
+        """
+        ranked = sorted(self.counters.items(), key=lambda item: (-item[1][0], str(item[0])))
+        return [(key, weight, error) for key, (weight, error) in ranked[:n]]
+    
+    def to_state(self) -> Dict[str, Any]:
+        """Get the sketch as JSON-serializable data."""
+        return {
+            'capacity': self.capacity,
+            'counters': [[key, weight, error] for key, (weight, error) in self.counters.items()]
+        }
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'SpaceSaving':
+        """Rebuild a sketch saved with to_state()."""
+        sketch = cls(state['capacity'])
+        sketch.counters = {key: [weight, error] for key, weight, error in state['counters']}
+        sketch._rebuild()
+        return sketch
+    
+    def _floor(self) -> float:
+        """Get the most weight an untracked key can have had."""
+        if len(self.counters) < self.capacity:
+            return 0.0
+        return min(weight for weight, _ in self.counters.values())
+    
+    def _push(self, key: Hashable, weight: float) -> None:
+        """Record a key's new weight, compacting the heap when mostly stale."""
+        self._sequence += 1
+        heapq.heappush(self._heap, (weight, self._sequence, key))
+        if len(self._heap) > 4 * self.capacity:
+            self._rebuild()
+    
+    def _pop_min(self) -> Tuple[float, Hashable]:
+        """Evict the lightest tracked key."""
+        while True:
+            weight, _, key = heapq.heappop(self._heap)
+            counter = self.counters.get(key)
+            if counter is not None and counter[0] == weight:
+                del self.counters[key]
+                return weight, key
+    
+    def _rebuild(self) -> None:
+        """Rebuild the heap from the live counters only."""
+        self._heap = []
+        for key, (weight, _) in self.counters.items():
+            self._sequence += 1
+            self._heap.append((weight, self._sequence, key))
+        heapq.heapify(self._heap)
+
+
+class KLLSketch:
+    """Mergeable streaming quantile estimates in O(k log(n / k)) memory."""
+    
+    # Each lower level holds this fraction of the capacity of the one above
+    DECAY = 2 / 3
+    
+    def __init__(self, k: int = 200, seed: int = 0):
+        """
+        Initialize the sketch.
+        
+        Values are kept in levels of compactors; when a level fills up it is
+        sorted and every other value moves up a level with twice the weight.
+        Rank error shrinks roughly as 1 / k: k=200 stays within about 1-2%.
+        
+        Args:
+            k: Capacity of the top level; larger is more accurate but keeps
+                more values
+            seed: Seed for choosing which half of a level moves up, so runs
+                over the same input give the same estimates
+        
+        Raises:
+            ValueError: If k is below 2
+        """
+        if k < 2:
+            raise ValueError("Sketch size must be at least 2")
+        
+        self.k = k
+        self.count = 0
+        self.levels: List[List[float]] = [[]]
+        self._random = random.Random(seed)
+        self._size = 0
+        self._max_size = self._capacity(0)
+    
+    def update(self, value: float) -> None:
+        """
+        Add a value.
+        
+        Args:
+            value: Value to add
+        """
+        self.levels[0].append(value)
+        self.count += 1
+        self._size += 1
+        if self._size >= self._max_size:
+            self._compress()
+    
+    def update_many(self, values: Sequence[float]) -> None:
+        """
+        Add values in order, leaving the same sketch as update() on each.
+        
+        Args:
+            values: Values to add
+        """
+        start = 0
+        while start < len(values):
+            # Fill the bottom level up to the next compaction in one step
+            room = max(self._max_size - self._size, 1)
+            chunk = values[start:start + room]
+            self.levels[0].extend(chunk)
+            self.count += len(chunk)
+            self._size += len(chunk)
+            start += len(chunk)
+            if self._size >= self._max_size:
+                self._compress()
+    
+    def merge(self, other: 'KLLSketch') -> 'KLLSketch':
+        """
+        Fold in a sketch of another part of the stream.
+        
+        Args:
+            other: Sketch with the same or any other k
+        
+        Returns:
+            The sketch, for chaining
+        """
+        while len(self.levels) < len(other.levels):
+            self._grow()
+        for level, values in zip(self.levels, other.levels):
+            level.extend(values)
+        self.count += other.count
+        self._size = sum(len(level) for level in self.levels)
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate the value at a quantile.
+        
+        Args:
+            q: Quantile between 0 and 1, e.g. 0.99
+        
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        weighted = sorted((value, 1 << height)
+                          for height, level in enumerate(self.levels) for value in level)
+        if not weighted:
+            return None
+        
+        target = q * sum(weight for _, weight in weighted)
+        seen = 0
+        for value, weight in weighted:
+            seen += weight
+            if seen >= target:
+                return value
+        return weighted[-1][0]
+    
+    def to_state(self) -> Dict[str, Any]:
+        """Get the sketch as JSON-serializable data."""
+        return {'k': self.k, 'count': self.count,
+                'levels': [list(level) for level in self.levels]}
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'KLLSketch':
+        """Rebuild a sketch saved with to_state()."""
+        sketch = cls(state['k'])
+        sketch.count = state['count']
+        sketch.levels = [list(level) for level in state['levels']]
+        sketch._size = sum(len(level) for level in sketch.levels)
+        sketch._max_size = sum(sketch._capacity(height) for height in range(len(sketch.levels)))
+        return sketch
+    
+    def _capacity(self, height: int) -> int:
+        """Get how many values a level holds before it is compacted."""
+        depth = len(self.levels) - height - 1
+        return max(2, math.ceil(self.k * self.DECAY ** depth))
+    
+    def _grow(self) -> None:
+        """Add a level on top, shrinking the capacity of those below."""
+        self.levels.append([])
+        self._max_size = sum(self._capacity(height) for height in range(len(self.levels)))
+    
+    def _compress(self) -> None:
+        """Compact the lowest full level into the one above it."""
+        for height, level in enumerate(self.levels):
+            if len(level) < self._capacity(height):
+                continue
+            if height + 1 == len(self.levels):
+                self._grow()
+            level.sort()
+            # An odd value out stays behind so total weight is preserved
+            leftover = [level.pop()] if len(level) % 2 else []
+            offset = self._random.randrange(2)
+            self.levels[height + 1].extend(level[offset::2])
+            self.levels[height] = leftover
+            self._size = sum(len(level) for level in self.levels)
+            return
\ No newline at end of file
@@ -0,0 +1,170 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+
+# Sentinel format meaning datetime.fromisoformat(), which is much faster
+# than strptime for the shapes it understands
+ISO_FORMAT = 'iso'
+
+_YEAR_FIRST_DATES = ('%Y-%m-%d', '%Y/%m/%d')
+_MONTH_FIRST_DATES = ('%m/%d/%Y', '%m-%d-%Y', '%m.%d.%Y')
+_DAY_FIRST_DATES = ('%d/%m/%Y', '%d-%m-%Y', '%d.%m.%Y')
+_TIMES = ('%H:%M:%S.%f', '%H:%M:%S', '%H:%M', '%I:%M:%S %p', '%I:%M %p')
+
+
+def _formats(dates: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Combine dates with every time and offset, then the dates alone."""
+    return tuple(
+        f"{date}{separator}{time}{zone}"
+        for date in dates
+        for separator in ('T', ' ')
+        for time in _TIMES
+        for zone in ('%z', ' %z', '')
+    ) + dates
+
+
+# Formats tried, in order, for a pattern fromisoformat() rejects. Numeric
+# dates are read month first unless only the other order gives a valid date
+FORMATS = _formats(_YEAR_FIRST_DATES + _MONTH_FIRST_DATES + _DAY_FIRST_DATES)
+
+# The same, preferring day first for dates such as 02/03/2025
+DAY_FIRST_FORMATS = _formats(_YEAR_FIRST_DATES + _DAY_FIRST_DATES + _MONTH_FIRST_DATES)
+
+# Every digit maps to '0', so '2025-10-19 08:05' and '2024-01-02 17:45'
+# share the pattern '0000-00-00 00:00'
+_DIGIT_PATTERN = str.maketrans('0123456789', '0000000000')
+
+MAX_PATTERNS = 1024
+
+BUCKETS = ('hour', 'day')
+
+
+class TimestampParser:
+    """Parses timestamps in mixed formats, remembering the format per pattern."""
+    
+    def __init__(self, formats: Optional[Tuple[str, ...]] = None, day_first: bool = False):
+        """
+        Initialize the parser.
+        
+        A pattern such as '00/00/0000' fits both day and month first, so its
+        format is only remembered once a day above 12 settles the order;
+        until then each timestamp is read in the preferred order.
+        
+        Args:
+            formats: strptime formats to try, in order, when fromisoformat()
+                cannot read a timestamp; FORMATS or DAY_FIRST_FORMATS if omitted
+            day_first: Read ambiguous numeric dates such as 02/03/2025 as
+                2 March rather than February 3
+        """
+        if formats is None:
+            formats = DAY_FIRST_FORMATS if day_first else FORMATS
+        self.formats = formats
+        # Pattern of digits and separators -> format that parsed it
+        self._patterns: Dict[str, str] = {}
+    
+    def parse(self, value: Any) -> Optional[datetime]:
+        """
+        Parse a timestamp such as '2025-10-19T08:00:00Z' or '2025/10/19T08:25Z'.
+        
+        The format is sniffed the first time a pattern is seen and reused for
+        every later timestamp with the same pattern. Timestamps without an
+        offset are taken to be UTC.
+        
+        Args:
+            value: Timestamp string
+        
+        Returns:
+            Timezone-aware datetime in UTC, or None if the value is not a
+            string or matches none of the formats
+        """
+        if not isinstance(value, str):
+            return None
+        
+        text = value.strip()
+        pattern = text.translate(_DIGIT_PATTERN)
+        fmt = self._patterns.get(pattern)
+        if fmt is not None:
+            try:
+                return _to_utc(_parse(text, fmt))
+            except ValueError:
+                # Right pattern, impossible date such as month 13
+                return None
+        
+        return self._sniff(text, pattern)
+    
+    def normalize(self, value: Any) -> Optional[str]:
+        """
+        Convert a timestamp to ISO 8601 in UTC, e.g. '2025-10-19T08:25:00Z'.
+        
+        Args:
+            value: Timestamp string
+        
+        Returns:
+            Normalized timestamp to the second, or None if it cannot be parsed
+        """
+        parsed = self.parse(value)
+        if parsed is None:
+            return None
+        return (f"{parsed.year:04d}-{parsed.month:02d}-{parsed.day:02d}"
+                f"T{parsed.hour:02d}:{parsed.minute:02d}:{parsed.second:02d}Z")
+    
+    def bucket(self, value: Any, granularity: str) -> Optional[str]:
+        """
+        Get the hour or day a timestamp falls in.
+        
+        Args:
+            value: Timestamp string, normalized or not
+            granularity: 'hour' or 'day'
+        
+        Returns:
+            '2025-10-19T08:00:00Z' for an hour, '2025-10-19' for a day, or
+            None if the timestamp cannot be parsed
+        """
+        if not _is_normalized(value):
+            value = self.normalize(value)
+            if value is None:
+                return None
+        
+        if granularity == 'hour':
+            return value[:13] + ':00:00Z'
+        return value[:10]
+    
+    def _sniff(self, text: str, pattern: str) -> Optional[datetime]:
+        """Try each format on a new pattern and remember the first that fits."""
+        for fmt in (ISO_FORMAT,) + self.formats:
+            try:
+                parsed = _parse(text, fmt)
+            except ValueError:
+                continue
+            # Only successes are remembered, so one bad value cannot hide a
+            # format from the valid timestamps sharing its pattern
+            if len(self._patterns) < MAX_PATTERNS and not _is_ambiguous(fmt, parsed):
+                self._patterns[pattern] = fmt
+            return _to_utc(parsed)
+        
+        return None
+
+
+def _parse(text: str, fmt: str) -> datetime:
+    """Parse with fromisoformat() or strptime()."""
+    if fmt == ISO_FORMAT:
+        return datetime.fromisoformat(text)
+    return datetime.strptime(text, fmt)
+
+
+def _is_ambiguous(fmt: str, parsed: datetime) -> bool:
+    """Check whether a date would also be valid with day and month swapped."""
+    return fmt[:2] in ('%d', '%m') and parsed.day <= 12
+
+
+def _to_utc(parsed: datetime) -> datetime:
+    """Convert to UTC, reading naive datetimes as UTC."""
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _is_normalized(value: Any) -> bool:
+    """Check for the 'YYYY-MM-DDTHH:MM:SSZ' form TimestampParser.normalize() returns."""
+    return (isinstance(value, str) and len(value) == 20 and value[10] == 'T'
+            and value[19] == 'Z' and value[:4].isdigit())
\ No newline at end of file
@@ -1,10 +1,26 @@
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
+
+from .numeric import parse_number
+from .timestamps import TimestampParser
+
+_WHITESPACE = re.compile(r'\s+')
 
 
 class Transformer:
     """Transforms and normalizes order data."""
     
+    def __init__(self, day_first: bool = False):
+        """
+        Initialize Transformer.
+        
+        Args:
+            day_first: Read ambiguous numeric dates such as 02/03/2025 as
+                2 March rather than February 3
+        """
+        # Remembers the format of each timestamp pattern seen so far
+        self.timestamps = TimestampParser(day_first=day_first)
+    
     def transform(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Transform list of orders.
@@ -15,20 +31,47 @@ class Transformer:
         Returns:
             List of transformed orders
         """
-        transformed = []
+        return list(self.iter_transform(data))
+    
+    def iter_transform(self, data: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Transform orders lazily, one at a time.
         
+        Args:
+            data: Iterable of valid orders
+            
+        Yields:
+            Transformed orders
+        """
         for order in data:
-            transformed_order = self._transform_order(order.copy())
-            transformed.append(transformed_order)
+            yield self._transform_order(order.copy())
+    
+    def iter_transform_parsed(self, data: Iterable[Tuple[Dict[str, Any],
+                                                         Tuple[float, float, float]]]
+                              ) -> Iterator[Dict[str, Any]]:
+        """
+        Transform orders whose numeric fields were already parsed.
         
-        return transformed
+        Args:
+            data: Iterable of (order, (quantity, price, total)) tuples as
+                produced by Validator.iter_validate_parsed()
+            
+        Yields:
+            Transformed orders
+        """
+        for order, values in data:
+            yield self._transform_order(order.copy(), values)
     
-    def _transform_order(self, order: Dict[str, Any]) -> Dict[str, Any]:
-        """Transform a single order."""
+    def _transform_order(self, order: Dict[str, Any],
+                         values: Optional[Tuple[float, float, float]] = None) -> Dict[str, Any]:
+        """Transform a single order, reusing pre-parsed numbers if given."""
         # Convert to numeric
-        order['quantity'] = self._to_numeric(order['quantity'])
-        order['price'] = self._to_numeric(order['price'])
-        order['total'] = self._to_numeric(order['total'])
+        if values is None:
+            order['quantity'] = self._to_numeric(order['quantity'])
+            order['price'] = self._to_numeric(order['price'])
+            order['total'] = self._to_numeric(order['total'])
+        else:
+            order['quantity'], order['price'], order['total'] = values
         
         # Normalize payment status
         order['payment_status'] = self._normalize_payment_status(
@@ -39,6 +82,9 @@ class Transformer:
         if 'item' in order:
             order['item'] = self._clean_text(order['item'])
         
+        if 'timestamp' in order:
+            order['timestamp'] = self._normalize_timestamp(order['timestamp'])
+        
         # Recalculate total for consistency
         order['total'] = round(order['quantity'] * order['price'], 2)
         
@@ -51,8 +97,8 @@ class Transformer:
         
         if isinstance(value, str):
             # Remove currency symbols and text
-            cleaned = re.sub(r'[^0-9.]', '', value)
-            return float(cleaned) if cleaned else 0.0
+            number = parse_number(value)
+            return 0.0 if number is None else number
         
         return float(value)
     
@@ -70,6 +116,11 @@ class Transformer:
             return normalized
         return str(status).strip().lower()
     
+    def _normalize_timestamp(self, timestamp: Any) -> Any:
+        """Convert a timestamp to ISO 8601 UTC, leaving unparseable ones as they are."""
+        normalized = self.timestamps.normalize(timestamp)
+        return timestamp if normalized is None else normalized
+    
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text fields."""
         if not isinstance(text, str):
@@ -79,6 +130,6 @@ class Transformer:
         text = text.strip()
         
         # Fix multiple spaces
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE.sub(' ', text)
         
         return text
\ No newline at end of file
@@ -0,0 +1,65 @@
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+
+from .validator import Validator
+from .transformer import Transformer
+
+
+class ValidateTransform:
+    """Validates and transforms orders in a single pass."""
+    
+    def __init__(self, validator: Optional[Validator] = None,
+                 transformer: Optional[Transformer] = None):
+        """
+        Initialize the fused stage.
+        
+        Args:
+            validator: Validator whose rules and summary are used
+            transformer: Transformer whose normalization rules are used
+        """
+        self.validator = validator or Validator()
+        self.transformer = transformer or Transformer()
+    
+    def run(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Validate and transform a list of orders.
+        
+        Args:
+            data: List of order dictionaries
+            
+        Returns:
+            List of transformed valid orders
+        """
+        return list(self.process(data))
+    
+    def process(self, data: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Validate and transform orders lazily in one traversal.
+        
+        Valid orders are transformed in place rather than copied, so the
+        caller must own the input dictionaries (for example orders straight
+        from Reader). Invalid orders are left untouched and recorded in the
+        validator's summary exactly as Validator.validate() would.
+        
+        Args:
+            data: Iterable of order dictionaries
+            
+        Yields:
+            Transformed valid orders
+        """
+        validator = self.validator
+        transformer = self.transformer
+        summary = validator.validation_summary
+        
+        for idx, order in enumerate(data):
+            summary['total_rows'] += 1
+            reason, values = validator._check_order(order)
+            
+            if reason is None:
+                summary['valid_rows'] += 1
+                yield transformer._transform_order(order, values)
+            else:
+                validator._record_invalid(idx, order, reason)
+    
+    def get_summary(self) -> Dict[str, Any]:
+        """Get validation summary."""
+        return self.validator.get_summary()
\ No newline at end of file
@@ -1,5 +1,6 @@
-import re
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
+
+from .numeric import parse_number
 
 
 class Validator:
@@ -10,7 +11,19 @@ class Validator:
         'quantity', 'price', 'payment_status', 'total'
     ]
     
-    def __init__(self):
+    # Invalid rows kept by streaming runs, whose memory must not grow with
+    # the input; the summary still counts every invalid row
+    STREAMING_MAX_INVALID_ROWS = 1000
+    
+    def __init__(self, max_invalid_rows: Optional[int] = None):
+        """
+        Initialize Validator.
+        
+        Args:
+            max_invalid_rows: Keep only the first this many invalid rows in
+                invalid_rows; all of them if omitted
+        """
+        self.max_invalid_rows = max_invalid_rows
         self.invalid_rows = []
         self.validation_summary = {
             'total_rows': 0,
@@ -29,22 +42,96 @@ class Validator:
         Returns:
             List of valid orders
         """
-        valid_orders = []
-        self.validation_summary['total_rows'] = len(data)
+        return list(self.iter_validate(data))
+    
+    def iter_validate(self, data: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Validate orders lazily, yielding each valid order as it is checked.
+        
+        The validation summary is updated as the input is consumed, so it is
+        only complete once the iterator is exhausted.
+        
+        Args:
+            data: Iterable of order dictionaries
+            
+        Yields:
+            Valid orders
+        """
+        for order, _ in self.iter_validate_parsed(data):
+            yield order
+    
+    def iter_validate_parsed(self, data: Iterable[Dict[str, Any]]
+                             ) -> Iterator[Tuple[Dict[str, Any], Tuple[float, float, float]]]:
+        """
+        Validate orders lazily, also yielding the numbers parsed on the way.
         
+        Pass the result to Transformer.iter_transform_parsed() so quantity,
+        price and total are only parsed once per pipeline run.
+        
+        Args:
+            data: Iterable of order dictionaries
+            
+        Yields:
+            Tuples of (valid_order, (quantity, price, total))
+        """
         for idx, order in enumerate(data):
-            is_valid, reason = self._validate_order(order)
+            reason, values = self._check_order(order)
+            self.record(idx, order, reason)
             
-            if is_valid:
-                valid_orders.append(order)
-                self.validation_summary['valid_rows'] += 1
-            else:
-                self.invalid_rows.append({'index': idx, 'order': order, 'reason': reason})
-                self.validation_summary['invalid_rows'] += 1
-                self.validation_summary['reasons'][reason] = \
-                    self.validation_summary['reasons'].get(reason, 0) + 1
-        
-        return valid_orders
+            if reason is None:
+                yield order, values
+    
+    def merge(self, summary: Dict[str, Any], invalid_rows: List[Dict[str, Any]],
+              offset: int = 0) -> None:
+        """
+        Fold in the results of validating a chunk of the input elsewhere.
+        
+        Chunks must be merged in input order so that reason counts keep the
+        same ordering as a single-pass validation.
+        
+        Args:
+            summary: Validation summary produced for the chunk
+            invalid_rows: Invalid rows recorded for the chunk
+            offset: Position of the chunk's first order in the whole input
+        """
+        for key in ('total_rows', 'valid_rows', 'invalid_rows'):
+            self.validation_summary[key] += summary[key]
+        
+        for reason, count in summary['reasons'].items():
+            self.validation_summary['reasons'][reason] = \
+                self.validation_summary['reasons'].get(reason, 0) + count
+        
+        for row in invalid_rows[:self._room()]:
+            self.invalid_rows.append({**row, 'index': row['index'] + offset})
+    
+    def record(self, idx: int, order: Dict[str, Any], reason: Optional[str]) -> None:
+        """
+        Count a validation result that was worked out elsewhere.
+        
+        Args:
+            idx: Position of the order in the input
+            order: The order
+            reason: Why the order is invalid, or None if it is valid
+        """
+        self.validation_summary['total_rows'] += 1
+        if reason is None:
+            self.validation_summary['valid_rows'] += 1
+        else:
+            self._record_invalid(idx, order, reason)
+    
+    def _record_invalid(self, idx: int, order: Dict[str, Any], reason: str) -> None:
+        """Record an invalid order in the summary."""
+        if self._room():
+            self.invalid_rows.append({'index': idx, 'order': order, 'reason': reason})
+        self.validation_summary['invalid_rows'] += 1
+        self.validation_summary['reasons'][reason] = \
+            self.validation_summary['reasons'].get(reason, 0) + 1
+    
+    def _room(self) -> Optional[int]:
+        """Get how many more invalid rows may be kept; None if unlimited."""
+        if self.max_invalid_rows is None:
+            return None
+        return max(self.max_invalid_rows - len(self.invalid_rows), 0)
     
     def _validate_order(self, order: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
         """
@@ -53,37 +140,48 @@ class Validator:
         Returns:
             Tuple of (is_valid, reason_if_invalid)
         """
+        reason, _ = self._check_order(order)
+        return reason is None, reason
+    
+    def _check_order(self, order: Dict[str, Any]
+                     ) -> Tuple[Optional[str], Optional[Tuple[float, float, float]]]:
+        """
+        Validate a single order, keeping the parsed numeric fields.
+        
+        Returns:
+            Tuple of (reason_if_invalid, (quantity, price, total) if valid)
+        """
         # Check required fields
         missing_fields = [field for field in self.REQUIRED_FIELDS 
                          if field not in order or order[field] is None or order[field] == '']
         if missing_fields:
-            return False, f"Missing fields: {', '.join(missing_fields)}"
+            return f"Missing fields: {', '.join(missing_fields)}", None
         
         # Validate quantity
         try:
             qty = self._extract_numeric(order['quantity'])
             if qty <= 0:
-                return False, "Quantity must be positive"
+                return "Quantity must be positive", None
         except (ValueError, TypeError):
-            return False, "Invalid quantity format"
+            return "Invalid quantity format", None
         
         # Validate price
         try:
             price = self._extract_numeric(order['price'])
             if price <= 0:
-                return False, "Price must be positive"
+                return "Price must be positive", None
         except (ValueError, TypeError):
-            return False, "Invalid price format"
+            return "Invalid price format", None
         
         # Validate total
         try:
             total = self._extract_numeric(order['total'])
             if total <= 0:
-                return False, "Total must be positive"
+                return "Total must be positive", None
         except (ValueError, TypeError):
-            return False, "Invalid total format"
+            return "Invalid total format", None
         
-        return True, None
+        return None, (qty, price, total)
     
     def _extract_numeric(self, value: Any) -> float:
         """Extract numeric value from various formats."""
@@ -92,9 +190,9 @@ class Validator:
         
         if isinstance(value, str):
             # Remove currency symbols, whitespace, and common text
-            cleaned = re.sub(r'[^0-9.]', '', value)
-            if cleaned:
-                return float(cleaned)
+            number = parse_number(value)
+            if number is not None:
+                return number
         
         raise ValueError(f"Cannot convert to numeric: {value}")
     
@@ -49,4 +49,13 @@ def sample_orders_with_edge_cases():
             'total': 'N6000',
             'payment_status': 'PAID'
         }
-    ]
\ No newline at end of file
+    ]
+
+
+@pytest.fixture
+def input_file(tmp_path, sample_orders_with_edge_cases):
+    """Input file with one invalid order among valid ones."""
+    path = tmp_path / "input.json"
+    with open(path, 'w') as f:
+        json.dump(sample_orders_with_edge_cases * 2 + [{'order_id': 'X', 'quantity': -1}], f)
+    return path
\ No newline at end of file
@@ -1,5 +1,5 @@
 import pytest
-from order_pipeline.analyzer import Analyzer
+from order_pipeline.analyzer import Analyzer, AnalyzerAccumulator, DistributionAccumulator
 
 
 class TestAnalyzer:
@@ -56,4 +56,207 @@ class TestAnalyzer:
         
         assert result['total_orders'] == 0
         assert result['total_revenue'] == 0.0
-        assert result['average_revenue'] == 0.0
\ No newline at end of file
+        assert result['average_revenue'] == 0.0
+    
+    def test_track_matches_analyze(self):
+        """Test streaming statistics match batch analysis."""
+        analyzer = Analyzer()
+        orders = [
+            {'total': 50.25, 'payment_status': 'paid'},
+            {'total': 30.0, 'payment_status': 'unknown'},
+            {'total': 100.0, 'payment_status': 'refunded'}
+        ]
+        
+        passed = list(analyzer.track(iter(orders)))
+        
+        assert passed == orders
+        assert analyzer.get_stats() == analyzer.analyze(orders)
+    
+    def test_accumulator_merge_matches_single_pass(self):
+        """Test merged chunk accumulators match analyzing all orders at once."""
+        analyzer = Analyzer()
+        orders = [
+            {'total': value, 'payment_status': status}
+            for value, status in [(0.1, 'paid'), (1e16, 'pending'), (0.2, 'paid'),
+                                  (-1e16, 'refunded'), (0.3, 'other'), (19.99, 'paid')]
+        ]
+        
+        left = analyzer.new_accumulator()
+        right = analyzer.new_accumulator()
+        for order in orders[:2]:
+            left.update(order)
+        for order in orders[2:]:
+            right.update(order)
+        
+        result = left.merge(right).finalize()
+        
+        assert result == analyzer.analyze(orders)
+        assert result['total_orders'] == 6
+        assert result['total_revenue'] == 20.59
+        assert result['payment_status_counts'] == {'paid': 3, 'pending': 2, 'refunded': 1}
+    
+    def test_accumulator_remove_and_state_round_trip(self):
+        """Test removing an order and restoring saved state are exact."""
+        orders = [
+            {'total': 0.1, 'payment_status': 'paid'},
+            {'total': 0.2, 'payment_status': 'refunded'},
+            {'total': 1e16, 'payment_status': 'unknown'}
+        ]
+        analyzer = Analyzer()
+        accumulator = analyzer.new_accumulator()
+        for order in orders:
+            accumulator.update(order)
+        accumulator.remove(orders[2])
+        restored = AnalyzerAccumulator.from_state(accumulator.to_state())
+        
+        assert restored.finalize() == analyzer.analyze(orders[:2])
+    
+    def test_time_buckets(self):
+        """Test revenue and statuses are split by hour in the same pass."""
+        orders = [
+            {'timestamp': '2025-10-19T08:00:00Z', 'total': 10.0, 'payment_status': 'paid'},
+            {'timestamp': '2025-10-19 08:45', 'total': 5.5, 'payment_status': 'pending'},
+            {'timestamp': '2025/10/19T09:05Z', 'total': 2.0, 'payment_status': 'paid'},
+            {'timestamp': 'later', 'total': 1.0, 'payment_status': 'refunded'}
+        ]
+        
+        result = Analyzer(time_bucket='hour').analyze(orders)
+        
+        buckets = result['time_buckets']
+        assert list(buckets) == ['2025-10-19T08:00:00Z', '2025-10-19T09:00:00Z', 'unknown']
+        assert buckets['2025-10-19T08:00:00Z']['total_revenue'] == 15.5
+        assert buckets['2025-10-19T08:00:00Z']['payment_status_counts'] == {
+            'paid': 1, 'pending': 1, 'refunded': 0
+        }
+        assert buckets['unknown']['total_orders'] == 1
+        assert result['total_revenue'] == 18.5
+        
+        accumulator = Analyzer(time_bucket='hour').new_accumulator()
+        assert accumulator.bucket_key('2025-10-19 08:45') == '2025-10-19T08:00:00Z'
+        assert accumulator.bucket_key(None) == 'unknown'
+    
+    def test_time_buckets_merge_remove_and_state(self):
+        """Test bucketed accumulators merge, remove and round-trip exactly."""
+        orders = [
+            {'timestamp': '2025-10-19T08:00:00Z', 'total': 10.0, 'payment_status': 'paid'},
+            {'timestamp': '2025-10-20T08:00:00Z', 'total': 3.0, 'payment_status': 'paid'},
+            {'timestamp': '2025-10-20T09:00:00Z', 'total': 4.0, 'payment_status': 'refunded'}
+        ]
+        analyzer = Analyzer(time_bucket='day')
+        first = analyzer.new_accumulator().update(orders[0])
+        second = analyzer.new_accumulator().update(orders[1]).update(orders[2])
+        
+        merged = first.merge(second)
+        assert merged.finalize() == analyzer.analyze(orders)
+        
+        merged.remove(orders[0])
+        restored = AnalyzerAccumulator.from_state(merged.to_state())
+        assert restored.finalize() == analyzer.analyze(orders[1:])
+        assert list(restored.finalize()['time_buckets']) == ['2025-10-20']
+    
+    def test_unsupported_time_bucket(self):
+        """Test error for an unknown bucket size."""
+        with pytest.raises(ValueError, match="Unsupported time bucket"):
+            Analyzer(time_bucket='week')
+    
+    def test_group_by_item(self):
+        """Test orders, quantity and revenue are summed per item."""
+        orders = [
+            {'item': 'Mouse', 'quantity': 2.0, 'total': 31.98, 'payment_status': 'paid'},
+            {'item': 'Sleeve', 'quantity': 1.0, 'total': 12.5, 'payment_status': 'paid'},
+            {'item': 'Mouse', 'quantity': 1.0, 'total': 15.99, 'payment_status': 'pending'},
+            {'item': 'Case', 'quantity': 3.0, 'total': 6000.0, 'payment_status': 'paid'}
+        ]
+        
+        result = Analyzer().group_by(orders, 'item', top_n=2)
+        
+        assert result['distinct_keys'] == 3
+        assert result['groups'] == [
+            {'key': 'Case', 'orders': 1, 'quantity': 3.0, 'revenue': 6000.0},
+            {'key': 'Mouse', 'orders': 2, 'quantity': 3.0, 'revenue': 47.97}
+        ]
+        by_orders = Analyzer().group_by(orders, 'payment_status', rank_by='orders')
+        assert [group['key'] for group in by_orders['groups']] == ['paid', 'pending']
+    
+    def test_groups_in_statistics_merge_and_state(self):
+        """Test grouped accumulators merge, remove and round-trip exactly."""
+        orders = [
+            {'item': 'A', 'quantity': 1.0, 'total': 0.1, 'payment_status': 'paid'},
+            {'item': 'B', 'quantity': 2.0, 'total': 0.2, 'payment_status': 'paid'},
+            {'item': 'A', 'quantity': 1.0, 'total': 0.3, 'payment_status': 'paid'}
+        ]
+        analyzer = Analyzer(group_by='item')
+        merged = analyzer.new_accumulator().update(orders[0]).merge(
+            analyzer.new_accumulator().update(orders[1]).update(orders[2]))
+        
+        assert merged.finalize() == analyzer.analyze(orders)
+        assert merged.finalize()['groups']['groups'][0] == {
+            'key': 'A', 'orders': 2, 'quantity': 2.0, 'revenue': 0.4
+        }
+        
+        merged.remove(orders[1])
+        restored = AnalyzerAccumulator.from_state(merged.to_state())
+        assert restored.finalize() == analyzer.analyze([orders[0], orders[2]])
+    
+    def test_approximate_groups(self):
+        """Test max_groups bounds memory and still finds the best sellers."""
+        orders = [{'item': 'Hit', 'quantity': 1.0, 'total': 100.0, 'payment_status': 'paid'}] * 5
+        orders += [{'item': f"Tail {i}", 'quantity': 1.0, 'total': 1.0, 'payment_status': 'paid'}
+                   for i in range(100)]
+        analyzer = Analyzer(group_by='item', top_n=1, max_groups=10)
+        
+        accumulator = analyzer.new_accumulator()
+        for order in orders:
+            accumulator.update(order)
+        
+        groups = accumulator.finalize()['groups']
+        assert groups['approximate'] is True
+        assert groups['groups'][0]['key'] == 'Hit'
+        assert groups['groups'][0]['revenue'] - groups['groups'][0]['error'] <= 500.0
+        assert len(accumulator.groups.sketch.counters) == 10
+        before = accumulator.finalize()
+        with pytest.raises(ValueError, match="approximate groups"):
+            accumulator.remove(orders[0])
+        assert accumulator.finalize() == before
+    
+    def test_total_distribution(self):
+        """Test min, max, variance and percentiles of order totals."""
+        orders = [{'total': float(total), 'payment_status': 'paid'} for total in range(1, 101)]
+        
+        result = Analyzer(distribution=True).analyze(orders)['total_distribution']
+        
+        assert result['min'] == 1.0
+        assert result['max'] == 100.0
+        assert result['mean'] == 50.5
+        assert result['variance'] == 841.67
+        assert result['stddev'] == 29.01
+        assert (result['p50'], result['p90'], result['p99']) == (50.0, 90.0, 99.0)
+    
+    def test_distribution_update_many(self):
+        """Test adding a batch with its moments matches adding each value."""
+        values = [3.5, 120.0, 7.25, 0.5, 42.0]
+        mean = sum(values) / len(values)
+        m2 = sum((value - mean) ** 2 for value in values)
+        single = DistributionAccumulator(sketch_size=4).update(9.0)
+        for value in values:
+            single.update(value)
+        
+        bulk = DistributionAccumulator(sketch_size=4).update(9.0).update_many(values, mean, m2)
+        
+        assert bulk.finalize() == single.finalize()
+        assert bulk.sketch.to_state() == single.sketch.to_state()
+    
+    def test_distribution_merge_and_state(self):
+        """Test merged distributions match a single pass."""
+        orders = [{'total': total, 'payment_status': 'paid'} for total in [3.5, 120.0, 7.25, 0.5]]
+        analyzer = Analyzer(distribution=True)
+        first = analyzer.new_accumulator().update(orders[0])
+        second = analyzer.new_accumulator()
+        for order in orders[1:]:
+            second.update(order)
+        
+        restored = AnalyzerAccumulator.from_state(first.merge(second).to_state())
+        
+        assert restored.finalize() == analyzer.analyze(orders)
+        with pytest.raises(ValueError, match="distribution"):
+            restored.remove(orders[0])
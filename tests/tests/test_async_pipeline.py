@@ -0,0 +1,87 @@
+import pytest
+import asyncio
+import json
+from concurrent.futures import ProcessPoolExecutor
+from order_pipeline.async_pipeline import AsyncPipeline
+from order_pipeline.order import Order
+from order_pipeline.pipeline import Pipeline
+
+
+async def _aiter(orders):
+    """Serve orders from an async generator, yielding to the loop each time."""
+    for order in orders:
+        await asyncio.sleep(0)
+        yield order
+
+
+class TestAsyncPipeline:
+    """Test cases for AsyncPipeline class."""
+    
+    @pytest.fixture
+    def input_data(self, sample_orders_with_edge_cases):
+        """Orders with an invalid one, repeated over several batches."""
+        return (sample_orders_with_edge_cases + [
+            {'order_id': 'ORD009', 'item': 'Invalid', 'quantity': -1}
+        ]) * 3
+    
+    def test_file_source_matches_pipeline(self, tmp_path, input_data):
+        """Test reading a file gives the same output as Pipeline."""
+        input_file = tmp_path / "input.json"
+        with open(input_file, 'w') as f:
+            json.dump(input_data, f)
+        
+        sync_file = tmp_path / "sync.json"
+        async_file = tmp_path / "async.json"
+        sync_results = Pipeline(str(input_file), str(sync_file)).run()
+        async_results = asyncio.run(
+            AsyncPipeline(str(input_file), str(async_file), chunk_size=4).run())
+        
+        assert async_results == sync_results
+        assert async_file.read_bytes() == sync_file.read_bytes()
+    
+    def test_async_source_with_process_pool(self, tmp_path, input_data):
+        """Test an async iterator source processed in worker processes."""
+        input_file = tmp_path / "input.json"
+        with open(input_file, 'w') as f:
+            json.dump(input_data, f)
+        original = json.loads(json.dumps(input_data))
+        
+        sync_file = tmp_path / "sync.json"
+        async_file = tmp_path / "async.jsonl"
+        sync_results = Pipeline(str(input_file), str(sync_file)).run()
+        
+        async def run():
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                return await AsyncPipeline(_aiter(input_data), str(async_file),
+                                           chunk_size=5, executor=executor).run()
+        
+        async_results = asyncio.run(run())
+        
+        assert async_results == sync_results
+        assert input_data == original
+        assert async_file.read_text().count('\n') == sync_results['total_processed']
+    
+    def test_async_source_records_are_not_modified(self, tmp_path, input_data):
+        """Test Order records from an async source are copied before processing."""
+        records = [Order.from_dict(order) for order in input_data]
+        original = [dict(record) for record in records]
+        
+        asyncio.run(AsyncPipeline(_aiter(records), str(tmp_path / "output.json"),
+                                  chunk_size=5).run())
+        
+        assert [dict(record) for record in records] == original
+    
+    def test_source_error_keeps_previous_output(self, tmp_path, input_data):
+        """Test a failing source leaves no partial output behind."""
+        output_file = tmp_path / "output.json"
+        output_file.write_text('previous')
+        
+        async def failing():
+            yield input_data[0]
+            raise RuntimeError("feed dropped")
+        
+        with pytest.raises(RuntimeError, match="feed dropped"):
+            asyncio.run(AsyncPipeline(failing(), str(output_file)).run())
+        
+        assert output_file.read_text() == 'previous'
+        assert [path.name for path in tmp_path.iterdir()] == ['output.json']
\ No newline at end of file
@@ -0,0 +1,84 @@
+import pytest
+from order_pipeline.analyzer import Analyzer
+from order_pipeline.transformer import Transformer
+
+np = pytest.importorskip('numpy')
+
+from order_pipeline.columnar import ColumnarEngine, _round_cents
+
+
+class TestColumnarEngine:
+    """Tests for the NumPy columnar engine."""
+    
+    def test_transform_matches_dict_path(self, sample_orders_with_edge_cases):
+        """Test columnar transform converts back to the same orders."""
+        orders = sample_orders_with_edge_cases + [{
+            'order_id': 'ORD010',
+            'item': '  USB   Hub ',
+            'quantity': '3',
+            'price': '1.005',
+            'payment_status': ' Processing ',
+            'total': '3.015'
+        }]
+        engine = ColumnarEngine()
+        
+        batch = engine.transform(orders)
+        
+        assert len(batch) == 4
+        assert batch.to_orders() == Transformer().transform(orders)
+    
+    def test_analyze_matches_analyzer(self, sample_orders_with_edge_cases):
+        """Test vectorized statistics match Analyzer to the cent."""
+        orders = sample_orders_with_edge_cases * 3
+        orders[1] = dict(orders[1], payment_status='unknown')
+        engine = ColumnarEngine()
+        
+        batch = engine.transform(orders)
+        expected = Analyzer().analyze(Transformer().transform(orders))
+        
+        assert engine.analyze(batch) == expected
+    
+    def test_round_cents_matches_python_round(self):
+        """Test vectorized rounding agrees with round(value, 2)."""
+        values = np.array([0.125, 0.135, 1.005, 2.675, 10.0049999, 33.3333, 1e-9, 8.115])
+        
+        expected = [round(value, 2) for value in values.tolist()]
+        
+        assert _round_cents(values).tolist() == expected
+    
+    def test_time_buckets_match_analyzer(self, sample_orders_with_edge_cases):
+        """Test bucketed columnar statistics match Analyzer."""
+        orders = sample_orders_with_edge_cases * 2
+        orders[0] = dict(orders[0], timestamp='2025-10-20T10:00:00Z')
+        orders[4] = dict(orders[4], timestamp='unknown')
+        analyzer = Analyzer(time_bucket='hour')
+        engine = ColumnarEngine(analyzer=analyzer)
+        
+        batch = engine.transform(orders)
+        expected = analyzer.analyze(Transformer().transform(orders))
+        
+        assert engine.analyze(batch) == expected
+        assert len(expected['time_buckets']) == 3
+    
+    @pytest.mark.parametrize('field', ['item', 'payment_status', 'order_id', 'quantity'])
+    def test_groups_match_analyzer(self, sample_orders_with_edge_cases, field):
+        """Test columnar group-by matches Analyzer for any field."""
+        orders = sample_orders_with_edge_cases * 3
+        orders[1] = {key: value for key, value in orders[1].items() if key != 'item'}
+        analyzer = Analyzer(group_by=field)
+        engine = ColumnarEngine(analyzer=analyzer)
+        
+        batch = engine.transform(orders)
+        expected = analyzer.analyze(Transformer().transform(orders))
+        
+        assert engine.analyze(batch) == expected
+    
+    def test_distribution_matches_analyzer(self, sample_orders_with_edge_cases):
+        """Test columnar total distribution matches Analyzer."""
+        orders = sample_orders_with_edge_cases * 3
+        analyzer = Analyzer(distribution=True, sketch_size=4)
+        engine = ColumnarEngine(analyzer=analyzer)
+        
+        batch = engine.transform(orders)
+        
+        assert engine.analyze(batch) == analyzer.analyze(Transformer().transform(orders))
@@ -0,0 +1,101 @@
+import pytest
+import bz2
+import gzip
+import json
+from order_pipeline.exporter import Exporter
+from order_pipeline.pipeline import Pipeline
+from order_pipeline.reader import Reader
+
+
+def _zstd_open(path, mode):
+    """Open a zstd file with the optional zstandard library."""
+    zstandard = pytest.importorskip('zstandard')
+    return zstandard.open(path, mode)
+
+
+OPENERS = {'.gz': gzip.open, '.bz2': bz2.open, '.zst': _zstd_open}
+
+
+class TestCompression:
+    """Test cases for compressed input and output."""
+    
+    @pytest.mark.parametrize('name', ['orders.json.gz', 'orders.jsonl.bz2', 'orders.json.zst'])
+    def test_reader_decompresses(self, tmp_path, name, sample_orders_with_edge_cases):
+        """Test compressed files read the same as their plain content."""
+        path = tmp_path / name
+        if '.jsonl' in name:
+            text = ''.join(json.dumps(order) + '\n' for order in sample_orders_with_edge_cases)
+        else:
+            text = json.dumps(sample_orders_with_edge_cases)
+        with OPENERS[path.suffix](path, 'wb') as f:
+            f.write(text.encode('utf-8'))
+        
+        reader = Reader(str(path), use_mmap=True)
+        
+        assert not reader.use_mmap
+        assert reader.read() == sample_orders_with_edge_cases
+        assert list(reader.iter_orders()) == sample_orders_with_edge_cases
+        with pytest.raises(ValueError, match="Byte ranges"):
+            list(reader.iter_spans())
+    
+    def test_unsupported_compressed_format(self, tmp_path):
+        """Test the format behind the compression suffix is still checked."""
+        path = tmp_path / "orders.txt.gz"
+        with gzip.open(path, 'wb') as f:
+            f.write(b'[]')
+        
+        with pytest.raises(ValueError, match="Unsupported file format: .txt"):
+            Reader(str(path)).read()
+    
+    @pytest.mark.parametrize('name', ['output.json.gz', 'output.jsonl.gz', 'output.json.bz2'])
+    def test_exporter_compresses(self, tmp_path, name):
+        """Test compressed exports hold the same bytes as plain ones."""
+        orders = [{'order_id': '1', 'total': 50.0}, {'order_id': '2', 'total': 5.0}]
+        stats = {'total_revenue': 55.0}
+        plain_file = tmp_path / name.rsplit('.', 1)[0]
+        compressed_file = tmp_path / "out" / name
+        
+        Exporter(str(plain_file)).export(orders, stats)
+        exporter = Exporter(str(compressed_file), compression_level=1)
+        exporter.export_stream(iter(orders), stats)
+        
+        with OPENERS[compressed_file.suffix](compressed_file, 'rb') as f:
+            assert f.read() == plain_file.read_bytes()
+        if '.jsonl' in name:
+            assert exporter.metadata_path == tmp_path / "out" / "output.meta.json"
+            assert exporter.metadata_path.exists()
+    
+    def test_pipeline_round_trip(self, tmp_path, sample_orders_with_edge_cases):
+        """Test the pipeline reads and writes compressed files end to end."""
+        input_file = tmp_path / "input.json.gz"
+        with gzip.open(input_file, 'wt', encoding='utf-8') as f:
+            json.dump(sample_orders_with_edge_cases, f)
+        plain_input = tmp_path / "input.json"
+        plain_input.write_text(json.dumps(sample_orders_with_edge_cases))
+        
+        plain_file = tmp_path / "plain.json"
+        compressed_file = tmp_path / "compressed.json.gz"
+        plain_results = Pipeline(str(plain_input), str(plain_file)).run()
+        compressed_results = Pipeline(str(input_file), str(compressed_file), streaming=True).run()
+        
+        assert compressed_results == plain_results
+        with gzip.open(compressed_file, 'rb') as f:
+            assert f.read() == plain_file.read_bytes()
+    
+    @pytest.mark.parametrize('name', ['orders.json.gz', 'orders.jsonl.gz', 'orders.json.bz2',
+                                      'orders.json.zst'])
+    def test_corrupt_input_names_file(self, tmp_path, name, sample_orders_with_edge_cases):
+        """Test corrupt or truncated compressed input raises ValueError with the file name."""
+        path = tmp_path / name
+        with OPENERS[path.suffix](path, 'wb') as f:
+            f.write(json.dumps(sample_orders_with_edge_cases).encode('utf-8'))
+        truncated = path.read_bytes()[:-20]
+        path.write_bytes(truncated)
+        garbage = tmp_path / ("garbage" + ''.join(path.suffixes))
+        garbage.write_bytes(truncated[:10] + b'\x00' * 200)
+        
+        for broken in (path, garbage):
+            with pytest.raises(ValueError, match=f"Corrupt .* file .*{broken.name}"):
+                Reader(str(broken)).read()
+            with pytest.raises(ValueError, match=f"Corrupt .* file .*{broken.name}"):
+                list(Reader(str(broken)).iter_orders())
\ No newline at end of file
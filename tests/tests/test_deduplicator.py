@@ -0,0 +1,78 @@
+import pytest
+from order_pipeline.deduplicator import BloomFilter, Deduplicator, KeyIndex
+
+
+ORDERS = [
+    {'order_id': 'A', 'total': 1},
+    {'order_id': 'B', 'total': 2},
+    {'order_id': 'A', 'total': 3},
+    {'total': 4},
+    {'order_id': 'B', 'total': 5},
+    {'order_id': 'C', 'total': 6},
+]
+
+
+class TestDeduplicator:
+    """Test cases for Deduplicator class."""
+    
+    def test_keep_first(self):
+        """Test the first order of each order_id is kept."""
+        deduplicator = Deduplicator('first')
+        
+        result = deduplicator.dedup(ORDERS)
+        
+        assert [order['total'] for order in result] == [1, 2, 4, 6]
+        assert deduplicator.duplicates == 2
+    
+    def test_keep_last_streaming(self):
+        """Test the last order of each order_id is kept, in input order."""
+        deduplicator = Deduplicator('last')
+        
+        result = list(deduplicator.iter_dedup(iter(ORDERS), iter(ORDERS)))
+        
+        assert [order['total'] for order in result] == [3, 4, 5, 6]
+        assert deduplicator.duplicates == 2
+    
+    @pytest.mark.parametrize('policy', ['first', 'last'])
+    def test_spilled_index_matches_memory(self, tmp_path, policy):
+        """Test spilling order_ids to disk gives the same result."""
+        orders = [{'order_id': f'ORD{i % 37}', 'total': i} for i in range(200)]
+        
+        in_memory = Deduplicator(policy).dedup(orders)
+        spilled = Deduplicator(policy, max_memory_keys=5, expected_keys=100,
+                               directory=str(tmp_path)).dedup(orders)
+        
+        assert spilled == in_memory
+        assert len(spilled) == 37
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_unsupported_policy(self):
+        """Test error for unknown policies."""
+        with pytest.raises(ValueError, match="Unsupported dedup policy"):
+            Deduplicator('random')
+
+
+class TestKeyIndex:
+    """Test cases for KeyIndex and BloomFilter classes."""
+    
+    def test_index_lookups_after_spill(self):
+        """Test keys are found in memory and on disk."""
+        index = KeyIndex(max_memory_keys=3, expected_keys=50)
+        for i in range(10):
+            index.put(f'k{i}', i)
+        index.put('k1', 99)
+        
+        assert [index.get(f'k{i}') for i in range(10)] == [0, 99] + list(range(2, 10))
+        assert index.get('missing') is None
+        index.close()
+    
+    def test_bloom_filter_has_no_false_negatives(self):
+        """Test every added key is reported as present."""
+        bloom = BloomFilter(1000, error_rate=0.01)
+        keys = [f'ORD{i}' for i in range(1000)]
+        for key in keys:
+            bloom.add(key)
+        
+        assert all(key in bloom for key in keys)
+        false_positives = sum(f'other{i}' in bloom for i in range(1000))
+        assert false_positives < 50
\ No newline at end of file
@@ -45,4 +45,146 @@ class TestExporter:
             data = json.load(f)
         
         assert 'statistics' in data
-        assert data['statistics']['total_revenue'] == 50.0
\ No newline at end of file
+        assert data['statistics']['total_revenue'] == 50.0
+    
+    @pytest.mark.parametrize('orders', [
+        [],
+        [{'order_id': '1', 'item': 'Café', 'total': 50.0, 'tags': {'a': [1, 2]}}],
+        [{'order_id': str(i), 'total': i * 1.5} for i in range(5)]
+    ])
+    @pytest.mark.parametrize('pretty', [True, False])
+    def test_export_stream_matches_export(self, tmp_path, orders, pretty):
+        """Test streaming export writes the same bytes as export() and a one-shot dump."""
+        batch_file = tmp_path / "batch.json"
+        stream_file = tmp_path / "stream.json"
+        stats = {'total_revenue': 50.0}
+        document = {'orders': orders, 'metadata': {'total_orders': len(orders)},
+                    'statistics': stats}
+        
+        Exporter(str(batch_file), pretty=pretty).export(orders, stats)
+        exporter = Exporter(str(stream_file), pretty=pretty)
+        count = exporter.export_stream(iter(orders), lambda: stats)
+        
+        assert count == len(orders)
+        assert stream_file.read_bytes() == batch_file.read_bytes()
+        assert stream_file.read_text(encoding='utf-8') == exporter.serializer.dumps(document, pretty)
+    
+    def test_export_jsonl(self, tmp_path):
+        """Test JSON Lines export writes one order per line and a sidecar."""
+        output_file = tmp_path / "output.jsonl"
+        exporter = Exporter(str(output_file))
+        
+        orders = [{'order_id': '1', 'total': 50.0}, {'order_id': '2', 'total': 5.0}]
+        exporter.export(orders, {'total_revenue': 55.0})
+        
+        lines = output_file.read_text().splitlines()
+        assert [json.loads(line) for line in lines] == orders
+        
+        with open(exporter.metadata_path) as f:
+            sidecar = json.load(f)
+        assert sidecar['metadata']['total_orders'] == 2
+        assert sidecar['statistics']['total_revenue'] == 55.0
+    
+    def test_unsupported_output_format(self, tmp_path):
+        """Test error for unknown output formats."""
+        with pytest.raises(ValueError, match="Unsupported output format"):
+            Exporter(str(tmp_path / "output.json"), output_format='xml')
+    
+    @pytest.mark.parametrize('json_backend', ['json', None])
+    def test_export_compact(self, tmp_path, json_backend):
+        """Test compact output is unindented and streams identically."""
+        batch_file = tmp_path / "batch.json"
+        stream_file = tmp_path / "stream.json"
+        orders = [{'order_id': '1', 'total': 50.0}, {'order_id': '2', 'total': 5.0}]
+        stats = {'total_revenue': 55.0}
+        
+        Exporter(str(batch_file), pretty=False, json_backend=json_backend).export(orders, stats)
+        Exporter(str(stream_file), pretty=False,
+                 json_backend=json_backend).export_stream(iter(orders), stats)
+        
+        text = batch_file.read_text()
+        assert '\n' not in text
+        assert json.loads(text)['orders'] == orders
+        assert stream_file.read_bytes() == batch_file.read_bytes()
+    
+    def test_failed_export_keeps_previous_file(self, tmp_path):
+        """Test an export that fails part way leaves the old file intact."""
+        output_file = tmp_path / "output.json"
+        exporter = Exporter(str(output_file), buffer_size=16)
+        exporter.export([{'order_id': '1', 'total': 50.0}])
+        previous = output_file.read_bytes()
+        
+        def orders():
+            yield {'order_id': '2', 'total': 5.0}
+            raise ValueError("Invalid JSON format")
+        
+        with pytest.raises(ValueError):
+            exporter.export_stream(orders())
+        
+        assert output_file.read_bytes() == previous
+        assert [path.name for path in tmp_path.iterdir()] == ['output.json']
+    
+    def test_export_with_fsync(self, tmp_path):
+        """Test fsync writes the same file and leaves no temporary files."""
+        output_file = tmp_path / "out" / "output.jsonl"
+        exporter = Exporter(str(output_file), fsync=True)
+        
+        exporter.export([{'order_id': '1', 'total': 50.0}])
+        
+        assert sorted(path.name for path in output_file.parent.iterdir()) == [
+            'output.jsonl', 'output.meta.json'
+        ]
+        assert json.loads(output_file.read_text()) == {'order_id': '1', 'total': 50.0}
+    
+    def test_export_parquet(self, tmp_path):
+        """Test Parquet export writes typed row groups and statistics metadata."""
+        pq = pytest.importorskip('pyarrow.parquet')
+        import pyarrow as pa
+        output_file = tmp_path / "output.parquet"
+        orders = [
+            {'order_id': str(i), 'timestamp': '2025-10-19', 'item': 'Widget',
+             'quantity': 2, 'price': 1.5 * i, 'payment_status': ['paid', 'pending'][i % 2],
+             'total': 3.0 * i, 'source_file': 'a.json'}
+            for i in range(5)
+        ]
+        exporter = Exporter(str(output_file), row_group_size=2)
+        
+        count = exporter.export_stream(iter(orders), lambda: {'total_revenue': 30.0})
+        
+        parquet_file = pq.ParquetFile(output_file)
+        assert count == 5
+        assert parquet_file.metadata.num_row_groups == 3
+        assert parquet_file.schema_arrow.field('quantity').type == pa.float64()
+        assert pa.types.is_dictionary(parquet_file.schema_arrow.field('payment_status').type)
+        assert json.loads(parquet_file.metadata.metadata[b'statistics']) == {'total_revenue': 30.0}
+        assert json.loads(parquet_file.metadata.metadata[b'metadata']) == {'total_orders': 5}
+        rows = parquet_file.read().to_pylist()
+        assert [row['total'] for row in rows] == [order['total'] for order in orders]
+        assert rows[1]['payment_status'] == 'pending'
+        assert rows[0]['source_file'] == 'a.json'
+        assert rows[0]['extra_fields'] is None
+    
+    def test_export_parquet_late_field(self, tmp_path):
+        """Test fields first seen after the first row group are kept as JSON."""
+        pq = pytest.importorskip('pyarrow.parquet')
+        output_file = tmp_path / "output.parquet"
+        orders = [{'order_id': str(i), 'total': float(i)} for i in range(3)]
+        orders.append({'order_id': '3', 'total': 3.0, 'coupon': 'SAVE5', 'gift': True})
+        
+        count = Exporter(str(output_file), row_group_size=2).export_stream(iter(orders))
+        
+        rows = pq.ParquetFile(output_file).read().to_pylist()
+        assert count == 4
+        assert [row['order_id'] for row in rows] == ['0', '1', '2', '3']
+        assert rows[2]['extra_fields'] is None
+        assert json.loads(rows[3]['extra_fields']) == {'coupon': 'SAVE5', 'gift': True}
+    
+    def test_export_parquet_bad_value(self, tmp_path):
+        """Test values that do not fit their column are write errors."""
+        pytest.importorskip('pyarrow')
+        output_file = tmp_path / "output.parquet"
+        
+        with pytest.raises(IOError, match="Failed to write file"):
+            Exporter(str(output_file)).export([{'order_id': '1', 'total': 'lots'}])
+        
+        assert list(tmp_path.iterdir()) == []
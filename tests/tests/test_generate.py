@@ -0,0 +1,46 @@
+import pytest
+import json
+from benchmarks.generate import generate_orders, main, write_orders
+
+
+class TestGenerate:
+    """Test cases for the benchmark order generator."""
+    
+    def test_same_seed_same_orders(self, tmp_path):
+        """Test a seed always produces the same orders and files."""
+        first = write_orders(str(tmp_path / "first.jsonl"), 200, seed=7)
+        second = write_orders(str(tmp_path / "second.jsonl"), 200, seed=7)
+        
+        assert first.read_bytes() == second.read_bytes()
+        assert list(generate_orders(50, seed=1)) != list(generate_orders(50, seed=2))
+    
+    def test_json_and_json_lines_hold_same_orders(self, tmp_path):
+        """Test both output formats hold the generated orders."""
+        orders = list(generate_orders(20, seed=3))
+        array_file = write_orders(str(tmp_path / "orders.json"), 20, seed=3)
+        lines_file = write_orders(str(tmp_path / "orders.jsonl"), 20, seed=3)
+        
+        assert json.loads(array_file.read_text()) == orders
+        assert [json.loads(line) for line in lines_file.read_text().splitlines()] == orders
+    
+    @pytest.mark.parametrize('rates', [
+        {'invalid_rate': -0.1},
+        {'invalid_rate': 1.5},
+        {'dirty_rate': float('nan')}
+    ])
+    def test_invalid_rate(self, rates):
+        """Test rates outside 0 to 1 are rejected."""
+        with pytest.raises(ValueError, match="must be between 0 and 1"):
+            next(generate_orders(1, **rates))
+    
+    @pytest.mark.parametrize('argv', [
+        ['--invalid-rate', '2'],
+        ['--dirty-rate', '0.1', '--dirty-rate', '0.2']
+    ])
+    def test_cli_rejects_bad_rates(self, tmp_path, capsys, argv):
+        """Test out-of-range and duplicate rate options are command-line errors."""
+        with pytest.raises(SystemExit):
+            main([str(tmp_path / "orders.json")] + argv)
+        
+        assert 'error' in capsys.readouterr().err
+        assert not (tmp_path / "orders.json").exists()
\ No newline at end of file
@@ -0,0 +1,97 @@
+import pytest
+import json
+import logging
+from order_pipeline.metrics import (JsonEmitter, MetricsHook, MetricsRecorder,
+                                    PrometheusEmitter)
+from order_pipeline.pipeline import Pipeline
+
+
+class EventLog(MetricsHook):
+    """Hook remembering the order of events."""
+    
+    def __init__(self):
+        self.events = []
+    
+    def on_stage_start(self, stage):
+        self.events.append(('start', stage))
+    
+    def on_batch(self, stage, count):
+        self.events.append(('batch', stage, count))
+    
+    def on_stage_end(self, stage, metrics):
+        self.events.append(('end', stage))
+    
+    def on_stage_error(self, stage, error):
+        self.events.append(('error', stage))
+
+
+class TestMetrics:
+    """Test cases for pipeline metrics hooks."""
+    
+    @pytest.mark.parametrize('streaming', [False, True])
+    def test_stage_metrics(self, tmp_path, input_file, streaming):
+        """Test every stage reports counts, timings and I/O."""
+        output_file = tmp_path / "output.json"
+        recorder = MetricsRecorder()
+        
+        results = Pipeline(str(input_file), str(output_file), streaming=streaming,
+                           hooks=[recorder]).run()
+        
+        stages = recorder.stages
+        assert list(stages) == ['read', 'validate', 'transform', 'analyze', 'export', 'pipeline']
+        assert stages['read']['orders'] == 7
+        assert stages['read']['bytes_read'] == input_file.stat().st_size
+        assert stages['transform']['orders'] == results['total_processed']
+        assert stages['export']['bytes_written'] == output_file.stat().st_size
+        assert stages['pipeline']['orders'] == results['total_processed']
+        assert all(stage['seconds'] >= 0 for stage in stages.values())
+        assert stages['pipeline']['seconds'] >= stages['export']['seconds']
+    
+    def test_streaming_events(self, tmp_path, input_file):
+        """Test streamed stages report batches before they end."""
+        log = EventLog()
+        
+        Pipeline(str(input_file), str(tmp_path / "output.json"), streaming=True,
+                 chunk_size=4, hooks=[log]).run()
+        
+        read_events = [event for event in log.events if event[1] == 'read']
+        assert read_events == [('start', 'read'), ('batch', 'read', 4),
+                               ('batch', 'read', 3), ('end', 'read')]
+        assert log.events[0] == ('start', 'pipeline')
+        assert log.events[-1] == ('end', 'pipeline')
+    
+    @pytest.mark.parametrize('streaming', [False, True])
+    def test_failed_stage_events(self, tmp_path, streaming):
+        """Test a stage that raises reports an error instead of ending."""
+        input_file = tmp_path / "input.json"
+        input_file.write_text('[{"order_id": "ORD001",')
+        log = EventLog()
+        
+        with pytest.raises(ValueError):
+            Pipeline(str(input_file), str(tmp_path / "output.json"), streaming=streaming,
+                     hooks=[log]).run()
+        
+        assert ('error', 'read') in log.events
+        assert log.events[-1] == ('error', 'pipeline')
+        assert not [event for event in log.events if event[0] == 'end']
+    
+    def test_emitters_write_files(self, tmp_path, input_file):
+        """Test the JSON and Prometheus emitters write their files at the end."""
+        json_file = tmp_path / "metrics" / "run.json"
+        prom_file = tmp_path / "metrics" / "run.prom"
+        
+        Pipeline(str(input_file), str(tmp_path / "output.json"),
+                 hooks=[JsonEmitter(json_file), PrometheusEmitter(prom_file)]).run()
+        
+        assert json.loads(json_file.read_text())['stages']['read']['orders'] == 7
+        text = prom_file.read_text()
+        assert '# TYPE order_pipeline_stage_seconds gauge' in text
+        assert 'order_pipeline_stage_orders{stage="read"} 7' in text
+    
+    def test_quiet_mode_logs_instead_of_printing(self, tmp_path, input_file, capsys, caplog):
+        """Test quiet mode keeps stdout clean and logs progress."""
+        with caplog.at_level(logging.INFO, logger='order_pipeline'):
+            Pipeline(str(input_file), str(tmp_path / "output.json"), quiet=True).run()
+        
+        assert capsys.readouterr().out == ''
+        assert 'Read 7 orders' in caplog.messages
\ No newline at end of file
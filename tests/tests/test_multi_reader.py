@@ -0,0 +1,75 @@
+import pytest
+import gzip
+import json
+from order_pipeline.multi_reader import MultiReader, is_multi_source
+from order_pipeline.pipeline import Pipeline
+
+
+def _write_drops(directory, orders):
+    """Write orders across plain, JSON Lines and compressed hourly files."""
+    directory.mkdir()
+    (directory / "orders-01.json").write_text(json.dumps(orders[:1]))
+    (directory / "orders-02.jsonl").write_text(
+        ''.join(json.dumps(order) + '\n' for order in orders[1:2]))
+    with gzip.open(directory / "orders-03.json.gz", 'wt', encoding='utf-8') as f:
+        json.dump(orders[2:], f)
+    (directory / "orders.meta.json").write_text('{"metadata": {}}')
+    (directory / "notes.txt").write_text('not orders')
+
+
+class TestMultiReader:
+    """Test cases for MultiReader class."""
+    
+    @pytest.mark.parametrize('prefetch', [1, 3])
+    def test_reads_directory_in_order(self, tmp_path, sample_orders_with_edge_cases, prefetch):
+        """Test a directory is read file by file with source tags."""
+        drops = tmp_path / "drops"
+        _write_drops(drops, sample_orders_with_edge_cases)
+        
+        orders = list(MultiReader(drops, prefetch=prefetch).iter_orders())
+        
+        assert [{k: v for k, v in order.items() if k != 'source_file'} for order in orders] \
+            == sample_orders_with_edge_cases
+        assert [order['source_file'] for order in orders] == [
+            str(drops / "orders-01.json"), str(drops / "orders-02.jsonl"),
+            str(drops / "orders-03.json.gz")
+        ]
+    
+    def test_glob_and_untagged(self, tmp_path, sample_orders_with_edge_cases):
+        """Test glob patterns select files and tagging can be turned off."""
+        drops = tmp_path / "drops"
+        _write_drops(drops, sample_orders_with_edge_cases)
+        
+        reader = MultiReader(str(drops / "orders-0[12].*"), source_field=None)
+        
+        assert reader.find_files() == [drops / "orders-01.json", drops / "orders-02.jsonl"]
+        assert reader.read() == sample_orders_with_edge_cases[:2]
+        assert is_multi_source(str(drops / "*.json"))
+        assert not is_multi_source(str(drops / "orders-01.json"))
+        
+        bracketed = drops / "orders[01].json"
+        bracketed.write_text('[]')
+        assert not is_multi_source(str(bracketed))
+    
+    def test_no_files(self, tmp_path):
+        """Test error when nothing matches."""
+        with pytest.raises(FileNotFoundError, match="No input files found"):
+            MultiReader(str(tmp_path / "*.json")).read()
+    
+    def test_error_names_file(self, tmp_path):
+        """Test parse errors say which file failed."""
+        (tmp_path / "bad.json").write_text('{invalid')
+        
+        with pytest.raises(ValueError, match="bad.json"):
+            MultiReader(tmp_path).read()
+    
+    def test_pipeline_reads_directory(self, tmp_path, sample_orders_with_edge_cases):
+        """Test the pipeline treats a directory as one input stream."""
+        drops = tmp_path / "drops"
+        _write_drops(drops, sample_orders_with_edge_cases)
+        
+        results = Pipeline(str(drops), str(tmp_path / "output.json")).run()
+        
+        assert results['validation_summary']['total_rows'] == len(sample_orders_with_edge_cases)
+        with open(tmp_path / "output.json") as f:
+            assert all('source_file' in order for order in json.load(f)['orders'])
\ No newline at end of file
@@ -0,0 +1,36 @@
+import pytest
+from order_pipeline.numeric import parse_number
+
+
+class TestParseNumber:
+    """Tests for shared numeric parsing."""
+    
+    def test_currency_formats(self):
+        """Test numbers are extracted from currency strings."""
+        assert parse_number('$15.99') == 15.99
+        assert parse_number('N2000') == 2000.0
+        assert parse_number('45 dollars') == 45.0
+        assert parse_number('5usd') == 5.0
+        assert parse_number('€12.50') == 12.50
+    
+    def test_no_digits(self):
+        """Test strings without digits give None."""
+        assert parse_number('N/A') is None
+        assert parse_number('') is None
+    
+    def test_signs_are_dropped(self):
+        """Test the minus sign is stripped like any other symbol."""
+        assert parse_number('-3') == 3.0
+    
+    def test_malformed_number(self):
+        """Test error when the cleaned string is not a number."""
+        with pytest.raises(ValueError):
+            parse_number('1.2.3')
+    
+    def test_results_are_cached(self):
+        """Test repeated strings are served from the memo cache."""
+        parse_number.cache_clear()
+        parse_number('$9.99')
+        parse_number('$9.99')
+        
+        assert parse_number.cache_info().hits == 1
\ No newline at end of file
@@ -0,0 +1,56 @@
+import pickle
+import sys
+from order_pipeline.order import Order
+from order_pipeline.validator import Validator
+from order_pipeline.transformer import Transformer
+from order_pipeline.analyzer import Analyzer
+
+
+class TestOrder:
+    """Tests for the compact Order record."""
+    
+    def test_round_trip_keeps_field_order(self):
+        """Test conversion back to a dict keeps fields and their order."""
+        data = {'total': '$5', 'order_id': 'ORD001', 'source': 'feed', 'item': 'Widget'}
+        
+        order = Order.from_dict(data)
+        
+        assert order == data
+        assert list(order.to_dict().items()) == list(data.items())
+        assert 'quantity' not in order
+        assert order.get('quantity') is None
+    
+    def test_smaller_than_dict(self, sample_valid_order):
+        """Test the record uses less memory than the equivalent dict."""
+        order = Order.from_dict(sample_valid_order)
+        
+        assert sys.getsizeof(order) < sys.getsizeof(sample_valid_order)
+        assert not hasattr(order, '__dict__')
+    
+    def test_payment_status_is_interned(self):
+        """Test identical payment statuses share one string object."""
+        first = Order.from_dict({'payment_status': ''.join(['pa', 'id'])})
+        second = Order.from_dict({'payment_status': ''.join(['p', 'aid'])})
+        
+        assert first['payment_status'] is second['payment_status']
+    
+    def test_copy_and_pickle(self, sample_valid_order):
+        """Test copies are independent and records survive pickling."""
+        order = Order.from_dict(sample_valid_order)
+        
+        copy = order.copy()
+        copy['item'] = 'Changed'
+        
+        assert order['item'] == 'Wireless Mouse'
+        assert pickle.loads(pickle.dumps(order)) == order
+    
+    def test_stages_accept_records(self, sample_orders_with_edge_cases):
+        """Test Validator, Transformer and Analyzer work on Order records."""
+        records = [Order.from_dict(order) for order in sample_orders_with_edge_cases]
+        
+        transformed = Transformer().transform(Validator().validate(records))
+        expected = Transformer().transform(Validator().validate(sample_orders_with_edge_cases))
+        
+        assert all(isinstance(order, Order) for order in transformed)
+        assert transformed == expected
+        assert Analyzer().analyze(transformed) == Analyzer().analyze(expected)
\ No newline at end of file
@@ -0,0 +1,56 @@
+import pytest
+from order_pipeline.order_index import OrderIndex, content_hash
+
+
+class TestOrderIndex:
+    """Test cases for OrderIndex class."""
+    
+    def test_content_hash_ignores_field_order(self):
+        """Test orders with the same fields in any order hash the same."""
+        assert content_hash({'a': 1, 'b': 'x'}) == content_hash({'b': 'x', 'a': 1})
+        assert content_hash({'a': 1}) != content_hash({'a': 2})
+    
+    def test_store_and_lookup(self, tmp_path):
+        """Test stored results are found by a later run."""
+        path = tmp_path / "index.db"
+        with OrderIndex(path) as index:
+            index.store([('k1', 'h1', None, '{"total":1}'), ('k2', 'h2', 'Bad', None)])
+            index.save_statistics({'total_orders': 1})
+        
+        with OrderIndex(path) as index:
+            found = index.lookup(['k1', 'k2', 'k3'])
+            assert found == {'k1': ('h1', None, '{"total":1}'), 'k2': ('h2', 'Bad', None)}
+            assert index.load_statistics() == {'total_orders': 1}
+    
+    def test_pop_stale_returns_unseen_orders(self, tmp_path):
+        """Test orders not seen in the current run are removed."""
+        path = tmp_path / "index.db"
+        with OrderIndex(path) as index:
+            index.store([('k1', 'h1', None, 'a'), ('k2', 'h2', None, 'b')])
+        
+        with OrderIndex(path) as index:
+            index.touch(['k1'])
+            assert index.pop_stale() == ['b']
+            assert list(index.lookup(['k1', 'k2'])) == ['k1']
+    
+    def test_signature_change_discards_results(self, tmp_path):
+        """Test a different pipeline signature starts from scratch."""
+        path = tmp_path / "index.db"
+        with OrderIndex(path, signature='v1') as index:
+            index.store([('k1', 'h1', None, 'a')])
+            index.save_statistics({'total_orders': 1})
+        
+        with OrderIndex(path, signature='v2') as index:
+            assert index.lookup(['k1']) == {}
+            assert index.load_statistics() is None
+    
+    def test_failed_run_is_rolled_back(self, tmp_path):
+        """Test an exception during a run leaves the index unchanged."""
+        path = tmp_path / "index.db"
+        with pytest.raises(RuntimeError):
+            with OrderIndex(path) as index:
+                index.store([('k1', 'h1', None, 'a')])
+                raise RuntimeError("boom")
+        
+        with OrderIndex(path) as index:
+            assert index.lookup(['k1']) == {}
\ No newline at end of file
@@ -80,4 +80,291 @@ class TestPipelineIntegration:
         results = pipeline.run()
         
         assert results['total_processed'] == 1
-        assert results['validation_summary']['invalid_rows'] == 1
\ No newline at end of file
+        assert results['validation_summary']['invalid_rows'] == 1
+    
+    def test_streaming_matches_batch(self, tmp_path, sample_orders_with_edge_cases):
+        """Test streaming mode produces the same output as batch mode."""
+        input_data = sample_orders_with_edge_cases + [
+            {'order_id': 'ORD009', 'item': 'Invalid', 'quantity': -1}
+        ]
+        input_file = tmp_path / "input.json"
+        with open(input_file, 'w') as f:
+            json.dump(input_data, f)
+        
+        batch_file = tmp_path / "batch.json"
+        stream_file = tmp_path / "stream.json"
+        batch_results = Pipeline(str(input_file), str(batch_file)).run()
+        stream_results = Pipeline(str(input_file), str(stream_file), streaming=True).run()
+        
+        assert stream_results == batch_results
+        assert stream_file.read_bytes() == batch_file.read_bytes()
+    
+    @pytest.mark.parametrize('use_mmap', [False, True])
+    def test_parallel_matches_serial(self, tmp_path, sample_orders_with_edge_cases, use_mmap):
+        """Test multi-process mode produces the same output as a serial run."""
+        input_data = []
+        for i in range(7):
+            input_data.extend(dict(order, order_id=f'{i}-{order["order_id"]}')
+                              for order in sample_orders_with_edge_cases)
+            input_data.append({'order_id': f'BAD{i}', 'item': 'Invalid', 'quantity': -1})
+        input_file = tmp_path / "input.json"
+        with open(input_file, 'w') as f:
+            json.dump(input_data, f)
+        
+        serial_file = tmp_path / "serial.json"
+        parallel_file = tmp_path / "parallel.json"
+        serial = Pipeline(str(input_file), str(serial_file))
+        parallel = Pipeline(str(input_file), str(parallel_file), workers=2, chunk_size=3,
+                            use_mmap=use_mmap)
+        serial_results = serial.run()
+        parallel_results = parallel.run()
+        
+        assert parallel_results == serial_results
+        assert parallel.validator.invalid_rows == serial.validator.invalid_rows
+        assert parallel_file.read_bytes() == serial_file.read_bytes()
+    
+    @pytest.mark.parametrize('streaming', [False, True])
+    def test_fused_engine_matches_staged(self, tmp_path, sample_orders_with_edge_cases, streaming):
+        """Test the fused engine produces the same output as the staged one."""
+        input_data = sample_orders_with_edge_cases + [
+            {'order_id': 'ORD009', 'item': 'Invalid', 'quantity': -1}
+        ]
+        input_file = tmp_path / "input.json"
+        with open(input_file, 'w') as f:
+            json.dump(input_data, f)
+        
+        staged_file = tmp_path / "staged.json"
+        fused_file = tmp_path / "fused.json"
+        staged_results = Pipeline(str(input_file), str(staged_file)).run()
+        fused_results = Pipeline(str(input_file), str(fused_file),
+                                 streaming=streaming, engine='fused').run()
+        
+        assert fused_results == staged_results
+        assert fused_file.read_bytes() == staged_file.read_bytes()
+    
+    def test_columnar_engine_matches_staged(self, tmp_path, sample_orders_with_edge_cases):
+        """Test the columnar engine produces the same output as the staged one."""
+        pytest.importorskip('numpy')
+        input_data = (sample_orders_with_edge_cases * 3) + [
+            {'order_id': 'ORD009', 'item': 'Invalid', 'quantity': -1}
+        ]
+        input_file = tmp_path / "input.json"
+        with open(input_file, 'w') as f:
+            json.dump(input_data, f)
+        
+        staged_file = tmp_path / "staged.json"
+        columnar_file = tmp_path / "columnar.json"
+        staged_results = Pipeline(str(input_file), str(staged_file)).run()
+        columnar_results = Pipeline(str(input_file), str(columnar_file),
+                                    engine='columnar', chunk_size=4).run()
+        
+        assert columnar_results == staged_results
+        assert columnar_file.read_bytes() == staged_file.read_bytes()
+    
+    @pytest.mark.parametrize('options', [
+        {},
+        {'streaming': True, 'engine': 'fused'},
+        {'streaming': True, 'workers': 2, 'chunk_size': 3},
+        {'streaming': True, 'workers': 2, 'chunk_size': 3, 'use_mmap': True}
+    ])
+    def test_compact_records_match_dicts(self, tmp_path, sample_orders_with_edge_cases, options):
+        """Test compact Order records produce the same output as dicts."""
+        input_data = sample_orders_with_edge_cases + [
+            {'order_id': 'ORD009', 'item': 'Invalid', 'quantity': -1, 'note': 'x'}
+        ]
+        input_file = tmp_path / "input.json"
+        with open(input_file, 'w') as f:
+            json.dump(input_data, f)
+        
+        dict_file = tmp_path / "dicts.json"
+        compact_file = tmp_path / "compact.json"
+        dict_results = Pipeline(str(input_file), str(dict_file)).run()
+        compact_results = Pipeline(str(input_file), str(compact_file),
+                                   compact=True, **options).run()
+        
+        assert compact_results == dict_results
+        assert compact_file.read_bytes() == dict_file.read_bytes()
+    
+    def test_incremental_run_matches_full_run(self, tmp_path, sample_orders_with_edge_cases):
+        """Test an incremental rerun only processes changes and matches a full run."""
+        input_data = sample_orders_with_edge_cases + [
+            {'order_id': 'ORD009', 'item': 'Invalid', 'quantity': -1}
+        ]
+        input_file = tmp_path / "input.json"
+        index_file = tmp_path / "index.db"
+        with open(input_file, 'w') as f:
+            json.dump(input_data, f)
+        Pipeline(str(input_file), str(tmp_path / "first.json"),
+                 index_path=str(index_file)).run()
+        
+        # Change one order, drop another and add a new one
+        changed = [dict(order) for order in input_data]
+        changed[0]['quantity'] = 7
+        del changed[1]
+        changed.append(dict(sample_orders_with_edge_cases[1], order_id='ORD010'))
+        with open(input_file, 'w') as f:
+            json.dump(changed, f)
+        
+        full_file = tmp_path / "full.json"
+        incremental_file = tmp_path / "incremental.json"
+        full_results = Pipeline(str(input_file), str(full_file)).run()
+        incremental_results = Pipeline(str(input_file), str(incremental_file),
+                                       index_path=str(index_file)).run()
+        
+        assert incremental_results.pop('incremental_summary') == {
+            'reused': len(changed) - 2, 'processed': 2, 'removed': 1
+        }
+        assert incremental_results == full_results
+        assert incremental_file.read_bytes() == full_file.read_bytes()
+    
+    def test_code_change_discards_index(self, tmp_path, sample_orders_with_edge_cases, monkeypatch):
+        """Test results stored by different pipeline code are recomputed."""
+        input_file = tmp_path / "input.json"
+        index_file = tmp_path / "index.db"
+        with open(input_file, 'w') as f:
+            json.dump(sample_orders_with_edge_cases, f)
+        Pipeline(str(input_file), str(tmp_path / "first.json"),
+                 index_path=str(index_file)).run()
+        
+        monkeypatch.setattr('order_pipeline.pipeline.code_fingerprint', lambda: 'changed')
+        results = Pipeline(str(input_file), str(tmp_path / "second.json"),
+                           index_path=str(index_file)).run()
+        
+        assert results['incremental_summary'] == {
+            'reused': 0, 'processed': len(sample_orders_with_edge_cases), 'removed': 0
+        }
+    
+    @pytest.mark.parametrize('options', [{}, {'streaming': True}, {'workers': 2, 'chunk_size': 2}])
+    @pytest.mark.parametrize('policy', ['first', 'last'])
+    def test_dedup_drops_repeated_orders(self, tmp_path, sample_orders_with_edge_cases,
+                                         options, policy):
+        """Test duplicate order_ids are dropped before analysis and counted."""
+        retry = dict(sample_orders_with_edge_cases[0], quantity=3, total='$47.97')
+        input_file = tmp_path / "input.json"
+        with open(input_file, 'w') as f:
+            json.dump(sample_orders_with_edge_cases + [retry], f)
+        output_file = tmp_path / "output.json"
+        
+        results = Pipeline(str(input_file), str(output_file), dedup=policy, **options).run()
+        
+        summary = results['validation_summary']
+        assert summary['duplicate_rows'] == 1
+        assert summary['total_rows'] == len(sample_orders_with_edge_cases)
+        with open(output_file) as f:
+            totals = [order['total'] for order in json.load(f)['orders']
+                      if order['order_id'] == retry['order_id']]
+        assert totals == ([47.97] if policy == 'last' else [31.98])
+    
+    @pytest.mark.parametrize('options', [
+        {'streaming': True},
+        {'engine': 'columnar', 'chunk_size': 2},
+        {'workers': 2, 'chunk_size': 2}
+    ])
+    def test_time_buckets_match_batch(self, tmp_path, sample_orders_with_edge_cases, options):
+        """Test every execution mode reports the same hourly buckets."""
+        input_data = sample_orders_with_edge_cases + [
+            dict(sample_orders_with_edge_cases[1], order_id='ORD010',
+                 timestamp='2025-10-19 09:30')
+        ]
+        input_file = tmp_path / "input.json"
+        with open(input_file, 'w') as f:
+            json.dump(input_data, f)
+        
+        batch_results = Pipeline(str(input_file), str(tmp_path / "batch.json"),
+                                 time_bucket='hour').run()
+        results = Pipeline(str(input_file), str(tmp_path / "output.json"),
+                           time_bucket='hour', **options).run()
+        
+        buckets = batch_results['statistics']['time_buckets']
+        assert list(buckets) == ['2025-10-19T08:00:00Z', '2025-10-19T09:00:00Z']
+        assert buckets['2025-10-19T08:00:00Z']['total_orders'] == 3
+        assert results['statistics'] == batch_results['statistics']
+    
+    @pytest.mark.parametrize('options', [
+        {'streaming': True},
+        {'engine': 'columnar', 'chunk_size': 2},
+        {'workers': 2, 'chunk_size': 2}
+    ])
+    def test_groups_match_batch(self, tmp_path, sample_orders_with_edge_cases, options):
+        """Test every execution mode reports the same top items."""
+        input_file = tmp_path / "input.json"
+        with open(input_file, 'w') as f:
+            json.dump(sample_orders_with_edge_cases * 2, f)
+        
+        batch_results = Pipeline(str(input_file), str(tmp_path / "batch.json"),
+                                 group_by='item', top_n=2).run()
+        results = Pipeline(str(input_file), str(tmp_path / "output.json"),
+                           group_by='item', top_n=2, **options).run()
+        
+        groups = batch_results['statistics']['groups']
+        assert [group['key'] for group in groups['groups']] == ['Phone Case', 'Wireless Mouse']
+        assert groups['groups'][0]['orders'] == 2
+        assert results['statistics'] == batch_results['statistics']
+    
+    def test_approximate_groups_reject_index(self, tmp_path):
+        """Test approximate groups cannot be combined with incremental runs."""
+        with pytest.raises(ValueError, match="max_groups"):
+            Pipeline(str(tmp_path / "in.json"), str(tmp_path / "out.json"),
+                     group_by='item', max_groups=10, index_path=str(tmp_path / "index.db"))
+    
+    @pytest.mark.parametrize('options', [
+        {'streaming': True},
+        {'engine': 'columnar', 'chunk_size': 2},
+        {'workers': 2, 'chunk_size': 2}
+    ])
+    def test_distribution_matches_batch(self, tmp_path, sample_orders_with_edge_cases, options):
+        """Test every execution mode reports the same total distribution."""
+        input_file = tmp_path / "input.json"
+        with open(input_file, 'w') as f:
+            json.dump(sample_orders_with_edge_cases * 2, f)
+        
+        batch_results = Pipeline(str(input_file), str(tmp_path / "batch.json"),
+                                 distribution=True).run()
+        results = Pipeline(str(input_file), str(tmp_path / "output.json"),
+                           distribution=True, **options).run()
+        
+        distribution = batch_results['statistics']['total_distribution']
+        assert (distribution['min'], distribution['max']) == (12.5, 6000.0)
+        assert results['statistics'] == batch_results['statistics']
+    
+    def test_distribution_rejects_index(self, tmp_path):
+        """Test the distribution cannot be combined with incremental runs."""
+        with pytest.raises(ValueError, match="distribution"):
+            Pipeline(str(tmp_path / "in.json"), str(tmp_path / "out.json"),
+                     distribution=True, index_path=str(tmp_path / "index.db"))
+    
+    def test_cached_rerun_restores_output(self, tmp_path, sample_orders_with_edge_cases,
+                                          monkeypatch):
+        """Test an unchanged rerun is served from the cache and a change is not."""
+        input_file = tmp_path / "input.json"
+        with open(input_file, 'w') as f:
+            json.dump(sample_orders_with_edge_cases, f)
+        output_file = tmp_path / "output.json"
+        cache_dir = str(tmp_path / "cache")
+        
+        first = Pipeline(str(input_file), str(output_file), cache_dir=cache_dir)
+        results = first.run()
+        expected = output_file.read_bytes()
+        output_file.unlink()
+        
+        rerun = Pipeline(str(input_file), str(output_file), cache_dir=cache_dir)
+        monkeypatch.setattr(rerun, '_run', lambda: pytest.fail("input processed again"))
+        assert rerun.run() == results
+        assert rerun.cache_hit
+        assert output_file.read_bytes() == expected
+        
+        compact = Pipeline(str(input_file), str(output_file), cache_dir=cache_dir, pretty=False)
+        compact.run()
+        assert not compact.cache_hit
+        
+        monkeypatch.setattr('order_pipeline.pipeline.code_fingerprint', lambda: 'changed')
+        upgraded = Pipeline(str(input_file), str(output_file), cache_dir=cache_dir)
+        upgraded.run()
+        assert not upgraded.cache_hit
+        monkeypatch.undo()
+        
+        with open(input_file, 'w') as f:
+            json.dump(sample_orders_with_edge_cases[:2], f)
+        changed = Pipeline(str(input_file), str(output_file), cache_dir=cache_dir)
+        assert changed.run()['total_processed'] == 2
+        assert not changed.cache_hit
@@ -0,0 +1,59 @@
+import pytest
+import pstats
+import sys
+import tracemalloc
+from order_pipeline.pipeline import Pipeline, main
+
+
+class TestProfiling:
+    """Test cases for pipeline profiling."""
+    
+    def test_profile_report_per_stage(self, tmp_path, input_file):
+        """Test a batch run writes a section for every stage."""
+        report = tmp_path / "profile" / "report.txt"
+        
+        Pipeline(str(input_file), str(tmp_path / "output.json"), profile=str(report)).run()
+        
+        text = report.read_text()
+        for stage in ('read', 'validate', 'transform', 'analyze', 'export'):
+            assert f"Stage {stage}:" in text
+        assert "Whole run" in text
+        assert "iter_validate_parsed" in text
+        assert pstats.Stats(str(report.with_suffix('.prof'))).total_calls > 0
+    
+    def test_streaming_profile_covers_chain(self, tmp_path, input_file):
+        """Test streamed stages share one section instead of export's."""
+        report = tmp_path / "report.txt"
+        
+        Pipeline(str(input_file), str(tmp_path / "output.json"), streaming=True,
+                 profile=str(report)).run()
+        
+        text = report.read_text()
+        assert "Streamed stages read, validate, transform, analyze, export: 6 orders" in text
+        assert "Time spent in each stage itself: read " in text
+        assert "Stage export:" not in text
+    
+    def test_command_line_profile(self, tmp_path, input_file, capsys):
+        """Test the entry point's --profile option."""
+        report = tmp_path / "report.txt"
+        
+        results = main([str(input_file), str(tmp_path / "output.json"), '--profile', str(report)])
+        
+        assert results['total_processed'] == 6
+        assert report.exists()
+        assert f"Profile written to {report}" in capsys.readouterr().out
+    
+    @pytest.mark.parametrize('streaming', [False, True])
+    def test_failed_run_stops_profiling(self, tmp_path, streaming):
+        """Test a run that raises leaves no profiler or tracing behind."""
+        input_file = tmp_path / "input.json"
+        input_file.write_text('[{"order_id": "ORD001",')
+        report = tmp_path / "report.txt"
+        
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            Pipeline(str(input_file), str(tmp_path / "output.json"), streaming=streaming,
+                     profile=str(report)).run()
+        
+        assert not tracemalloc.is_tracing()
+        assert sys.getprofile() is None
+        assert not report.exists()
\ No newline at end of file
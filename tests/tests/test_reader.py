@@ -68,4 +68,136 @@ class TestReader:
         
         reader = Reader(str(file_path))
         with pytest.raises(ValueError, match="must contain a list"):
-            reader.read()
\ No newline at end of file
+            reader.read()
+
+class TestReaderIterOrders:
+    """Tests for Reader.iter_orders streaming mode."""
+    
+    def test_iter_orders_matches_read(self, tmp_path):
+        """Test streaming yields the same orders as read()."""
+        data = [
+            {"order_id": str(i), "item": "Widget é", "quantity": i, "price": 1.5}
+            for i in range(200)
+        ]
+        file_path = tmp_path / "test.json"
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        
+        reader = Reader(str(file_path))
+        reader.CHUNK_SIZE = 7
+        result = list(reader.iter_orders())
+        
+        assert result == reader.read()
+    
+    def test_iter_orders_is_lazy(self, tmp_path):
+        """Test orders are yielded before the whole file is parsed."""
+        file_path = tmp_path / "test.json"
+        file_path.write_text('[{"order_id": "1"}, {"order_id": "2"}, {broken')
+        
+        reader = Reader(str(file_path))
+        orders = reader.iter_orders()
+        
+        assert next(orders) == {"order_id": "1"}
+        assert next(orders) == {"order_id": "2"}
+        with pytest.raises(ValueError, match="Invalid JSON format"):
+            next(orders)
+    
+    def test_iter_orders_errors(self, tmp_path):
+        """Test streaming keeps the read() error semantics."""
+        with pytest.raises(FileNotFoundError):
+            list(Reader('nonexistent.json').iter_orders())
+        
+        empty_file = tmp_path / "empty.json"
+        empty_file.write_text("[ ]")
+        with pytest.raises(ValueError, match="File is empty"):
+            list(Reader(str(empty_file)).iter_orders())
+        
+        dict_file = tmp_path / "dict.json"
+        dict_file.write_text('{"order_id": "1"}')
+        with pytest.raises(ValueError, match="must contain a list"):
+            list(Reader(str(dict_file)).iter_orders())
+        
+        trailing_file = tmp_path / "trailing.json"
+        trailing_file.write_text('[{"order_id": "1"}] extra')
+        with pytest.raises(ValueError, match="Invalid JSON format"):
+            list(Reader(str(trailing_file)).iter_orders())
+
+class TestReaderJsonLines:
+    """Tests for reading JSON Lines files."""
+    
+    def test_read_jsonl(self, tmp_path):
+        """Test reading one order per line, skipping blank lines."""
+        file_path = tmp_path / "orders.jsonl"
+        file_path.write_text('{"order_id": "1"}\n\n{"order_id": "2"}\n')
+        
+        reader = Reader(str(file_path))
+        
+        assert reader.read() == [{"order_id": "1"}, {"order_id": "2"}]
+        assert list(reader.iter_orders()) == reader.read()
+    
+    def test_jsonl_errors(self, tmp_path):
+        """Test empty and malformed JSON Lines files are rejected."""
+        empty_file = tmp_path / "empty.ndjson"
+        empty_file.write_text("\n")
+        with pytest.raises(ValueError, match="File is empty"):
+            Reader(str(empty_file)).read()
+        
+        bad_file = tmp_path / "bad.jsonl"
+        bad_file.write_text('{"order_id": "1"}\n{oops\n')
+        with pytest.raises(ValueError, match="line 2"):
+            list(Reader(str(bad_file)).iter_orders())
+
+class TestReaderMmap:
+    """Tests for memory-mapped reading."""
+    
+    @pytest.mark.parametrize('backend', ['json', 'orjson'])
+    @pytest.mark.parametrize('name', ['orders.json', 'orders.jsonl'])
+    def test_mmap_matches_read(self, tmp_path, name, backend):
+        """Test memory-mapped reading returns the same orders."""
+        data = [
+            {"order_id": "1", "item": "Brackets ]}, and \"quotes\"", "tags": [1, {"a": 2}]},
+            {"order_id": "2", "item": "Café"}
+        ]
+        file_path = tmp_path / name
+        if name.endswith('.jsonl'):
+            file_path.write_text('\n'.join(json.dumps(order) for order in data) + '\n\n')
+        else:
+            file_path.write_text(json.dumps(data, indent=2))
+        
+        if backend == 'orjson':
+            pytest.importorskip('orjson')
+        reader = Reader(str(file_path), json_backend=backend, use_mmap=True)
+        
+        assert reader.read() == data
+        assert list(reader.iter_orders()) == data
+    
+    def test_spans_can_be_read_separately(self, tmp_path):
+        """Test byte ranges can be parsed in any grouping."""
+        data = [{"order_id": str(i)} for i in range(5)]
+        file_path = tmp_path / "orders.json"
+        file_path.write_text(json.dumps(data))
+        reader = Reader(str(file_path))
+        
+        spans = list(reader.iter_spans())
+        
+        assert len(spans) == 5
+        assert reader.read_spans(spans[3:]) == data[3:]
+        assert reader.read_spans(spans[:1]) == data[:1]
+    
+    def test_mmap_errors(self, tmp_path):
+        """Test memory-mapped reading keeps the read() error semantics."""
+        cases = {
+            "[]": "File is empty",
+            '{"order_id": "1"}': "must contain a list",
+            '[{"order_id": "1"},]': "Invalid JSON format",
+            '[{"order_id": "1"}': "Invalid JSON format",
+            '[{"order_id": }]': "Invalid JSON format",
+            '': "Invalid JSON format",
+        }
+        for content, message in cases.items():
+            file_path = tmp_path / "case.json"
+            file_path.write_text(content)
+            with pytest.raises(ValueError, match=message):
+                list(Reader(str(file_path), use_mmap=True).iter_orders())
+            with pytest.raises(ValueError, match=message):
+                Reader(str(file_path), use_mmap=True).read()
\ No newline at end of file
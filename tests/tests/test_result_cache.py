@@ -0,0 +1,73 @@
+import os
+
+from order_pipeline.result_cache import ResultCache, file_fingerprint
+
+
+class TestResultCache:
+    """Tests for the on-disk result cache."""
+    
+    def write(self, path, text):
+        """Write a small file and return its path."""
+        path.write_text(text)
+        return path
+    
+    def test_key_changes_with_content_and_config(self, tmp_path):
+        """Test the key follows input bytes and settings."""
+        cache = ResultCache(str(tmp_path / "cache"))
+        source = self.write(tmp_path / "in.json", "[1]")
+        key = cache.key([source], {'pretty': True})
+        
+        assert cache.key([source], {'pretty': True}) == key
+        assert cache.key([source], {'pretty': False}) != key
+        self.write(source, "[2]")
+        assert cache.key([source], {'pretty': True}) != key
+        assert file_fingerprint(source)['size'] == 3
+    
+    def test_store_and_load(self, tmp_path):
+        """Test a stored run is copied back to the output paths."""
+        cache = ResultCache(str(tmp_path / "cache"))
+        output = self.write(tmp_path / "out.jsonl", '{"a": 1}\n')
+        sidecar = self.write(tmp_path / "out.meta.json", '{}')
+        
+        assert cache.store('k1', [output, sidecar], {'total_processed': 1})
+        output.unlink()
+        sidecar.unlink()
+        
+        assert cache.load('k1', [output, sidecar]) == {'total_processed': 1}
+        assert output.read_text() == '{"a": 1}\n'
+        assert sidecar.read_text() == '{}'
+        assert cache.load('missing', [output, sidecar]) is None
+    
+    def test_incomplete_entry_is_a_miss(self, tmp_path):
+        """Test an entry missing an artifact is dropped."""
+        cache = ResultCache(str(tmp_path / "cache"))
+        output = self.write(tmp_path / "out.json", '{}')
+        cache.store('k1', [output], {})
+        
+        assert cache.load('k1', [output, tmp_path / "extra.json"]) is None
+        assert not (tmp_path / "cache" / "k1").exists()
+    
+    def test_least_recently_used_are_evicted(self, tmp_path):
+        """Test eviction keeps the cache within max_bytes, oldest use first."""
+        cache = ResultCache(str(tmp_path / "cache"), max_bytes=1500)
+        output = self.write(tmp_path / "out.json", 'x' * 600)
+        cache.store('old', [output], {})
+        cache.store('used', [output], {})
+        for age, key in enumerate(['used', 'old']):
+            stamp = 1000000000 + age
+            os.utime(tmp_path / "cache" / key / "results.json", (stamp, stamp))
+        # Using 'old' makes 'used' the least recently used entry
+        cache.load('old', [output])
+        
+        cache.store('new', [output], {})
+        
+        remaining = sorted(path.name for path in (tmp_path / "cache").iterdir())
+        assert remaining == ['new', 'old']
+    
+    def test_oversized_run_is_not_cached(self, tmp_path):
+        """Test a run bigger than the whole cache is skipped."""
+        cache = ResultCache(str(tmp_path / "cache"), max_bytes=10)
+        output = self.write(tmp_path / "out.json", 'x' * 100)
+        
+        assert not cache.store('k1', [output], {})
+        assert cache.load('k1', [output]) is None
\ No newline at end of file
@@ -0,0 +1,53 @@
+import pytest
+import json
+from order_pipeline.order import Order
+from order_pipeline.serializer import get_backend, BACKENDS
+
+
+INSTALLED = [name for name, (_, module) in BACKENDS.items() if module is not None]
+
+
+class TestSerializer:
+    """Tests for the pluggable JSON backends."""
+    
+    @pytest.mark.parametrize('name', INSTALLED)
+    def test_round_trip(self, name):
+        """Test every installed backend reads back what it writes."""
+        backend = get_backend(name)
+        data = {'orders': [{'item': 'Café', 'total': 31.98, 'date': '2025/10/19'}]}
+        
+        for pretty in (True, False):
+            text = backend.dumps(data, pretty)
+            assert backend.loads(text) == data
+            assert json.loads(text) == data
+    
+    @pytest.mark.parametrize('name', INSTALLED)
+    def test_serializes_order_records(self, name):
+        """Test Order records are written as plain objects."""
+        backend = get_backend(name)
+        
+        text = backend.dumps([Order.from_dict({'order_id': '1', 'total': 5.0})], pretty=False)
+        
+        assert json.loads(text) == [{'order_id': '1', 'total': 5.0}]
+    
+    def test_stdlib_formats(self):
+        """Test the stdlib backend keeps the indented and compact layouts."""
+        backend = get_backend('json')
+        
+        assert backend.dumps({'a': [1]}) == '{\n  "a": [\n    1\n  ]\n}'
+        assert backend.dumps({'a': [1]}, pretty=False) == '{"a":[1]}'
+    
+    def test_default_is_stdlib(self):
+        """Test the stdlib backend is used unless another is requested."""
+        assert get_backend().name == 'json'
+    
+    def test_unknown_backend(self):
+        """Test error for unknown backend names."""
+        with pytest.raises(ValueError, match="Unsupported JSON backend"):
+            get_backend('yaml')
+    
+    def test_invalid_json(self):
+        """Test parse errors are raised as ValueError."""
+        for name in INSTALLED:
+            with pytest.raises(ValueError):
+                get_backend(name).loads('{ invalid json }')
\ No newline at end of file
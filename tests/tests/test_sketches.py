@@ -0,0 +1,130 @@
+import random
+
+import pytest
+from order_pipeline.sketches import KLLSketch, SpaceSaving
+
+
+class TestSpaceSaving:
+    """Tests for the Space-Saving heavy hitters sketch."""
+    
+    def test_exact_below_capacity(self):
+        """Test weights are exact while every key fits."""
+        sketch = SpaceSaving(3)
+        for key, weight in [('a', 2.0), ('b', 1.0), ('a', 3.0), ('c', 0.5)]:
+            sketch.update(key, weight)
+        
+        assert sketch.top() == [('a', 5.0, 0.0), ('b', 1.0, 0.0), ('c', 0.5, 0.0)]
+        assert sketch.top(1) == [('a', 5.0, 0.0)]
+    
+    def test_heavy_hitters_survive_eviction(self):
+        """Test frequent keys are found in a long tail with bounded error."""
+        rng = random.Random(7)
+        stream = ['hot'] * 500 + ['warm'] * 300 + [f"tail{i}" for i in range(2000)]
+        rng.shuffle(stream)
+        sketch = SpaceSaving(20)
+        for key in stream:
+            sketch.update(key)
+        
+        top = sketch.top(2)
+        assert [key for key, _, _ in top] == ['hot', 'warm']
+        for key, weight, error in top:
+            true_weight = stream.count(key)
+            assert weight - error <= true_weight <= weight
+        assert len(sketch.counters) == 20
+        assert len(sketch._heap) <= 4 * sketch.capacity
+    
+    def test_merge_keeps_guarantees(self):
+        """Test merged sketches still bound every tracked weight."""
+        stream = ['a'] * 50 + ['b'] * 30 + [f"t{i}" for i in range(200)]
+        random.Random(3).shuffle(stream)
+        left, right = SpaceSaving(10), SpaceSaving(10)
+        for key in stream[:140]:
+            left.update(key)
+        for key in stream[140:]:
+            right.update(key)
+        
+        left.merge(right)
+        
+        assert [key for key, _, _ in left.top(2)] == ['a', 'b']
+        for key, weight, error in left.top():
+            assert weight - error <= stream.count(key) <= weight
+    
+    def test_state_round_trip(self):
+        """Test a restored sketch continues like the original."""
+        sketch = SpaceSaving(2)
+        for key in 'aabc':
+            sketch.update(key)
+        
+        restored = SpaceSaving.from_state(sketch.to_state())
+        restored.update('a')
+        sketch.update('a')
+        
+        assert restored.top() == sketch.top()
+    
+    def test_invalid_capacity(self):
+        """Test error for a sketch without counters."""
+        with pytest.raises(ValueError, match="Capacity must be positive"):
+            SpaceSaving(0)
+
+
+class TestKLLSketch:
+    """Tests for the KLL quantile sketch."""
+    
+    def rank(self, values, estimate):
+        """Get the fraction of values below an estimate."""
+        return sum(value < estimate for value in values) / len(values)
+    
+    def test_exact_while_small(self):
+        """Test quantiles are exact until the first compaction."""
+        sketch = KLLSketch(k=50)
+        for value in [5.0, 1.0, 3.0, 2.0, 4.0]:
+            sketch.update(value)
+        
+        assert sketch.quantile(0.5) == 3.0
+        assert sketch.quantile(1.0) == 5.0
+        assert KLLSketch().quantile(0.5) is None
+    
+    def test_bounded_memory_and_rank_error(self):
+        """Test a long stream keeps few values and accurate ranks."""
+        rng = random.Random(11)
+        values = [rng.expovariate(0.1) for _ in range(20000)]
+        sketch = KLLSketch(k=100)
+        for value in values:
+            sketch.update(value)
+        
+        assert sum(len(level) for level in sketch.levels) < 500
+        for q in (0.5, 0.9, 0.99):
+            assert abs(self.rank(values, sketch.quantile(q)) - q) < 0.03
+    
+    def test_update_many_matches_update(self):
+        """Test bulk updates leave the same sketch as one update per value."""
+        rng = random.Random(3)
+        values = [rng.random() for _ in range(5000)]
+        single, bulk = KLLSketch(k=20, seed=4), KLLSketch(k=20, seed=4)
+        for value in values:
+            single.update(value)
+        for start in range(0, len(values), 700):
+            bulk.update_many(values[start:start + 700])
+        
+        assert bulk.to_state() == single.to_state()
+    
+    def test_merge_and_state_round_trip(self):
+        """Test merged and restored sketches keep their accuracy."""
+        rng = random.Random(5)
+        values = [rng.random() for _ in range(10000)]
+        left, right = KLLSketch(k=100), KLLSketch(k=100)
+        for value in values[:3000]:
+            left.update(value)
+        for value in values[3000:]:
+            right.update(value)
+        
+        merged = KLLSketch.from_state(left.merge(right).to_state())
+        merged.update(0.5)
+        
+        assert merged.count == len(values) + 1
+        assert abs(self.rank(values, merged.quantile(0.9)) - 0.9) < 0.03
+    
+    def test_invalid_size(self):
+        """Test error for a sketch too small to compact."""
+        with pytest.raises(ValueError, match="Sketch size"):
+            KLLSketch(k=1)
\ No newline at end of file
@@ -0,0 +1,79 @@
+import pytest
+from order_pipeline.timestamps import TimestampParser
+
+
+class TestTimestampParser:
+    """Tests for mixed-format timestamp parsing."""
+    
+    def test_normalizes_mixed_formats(self):
+        """Test each input format is converted to ISO 8601 UTC."""
+        parser = TimestampParser()
+        
+        assert parser.normalize('2025-10-19T08:00:00Z') == '2025-10-19T08:00:00Z'
+        assert parser.normalize('2025-10-19 08:05') == '2025-10-19T08:05:00Z'
+        assert parser.normalize('2025/10/19T08:25Z') == '2025-10-19T08:25:00Z'
+        assert parser.normalize('19/10/2025 08:10 AM') == '2025-10-19T08:10:00Z'
+        assert parser.normalize('2025-01-15') == '2025-01-15T00:00:00Z'
+    
+    def test_offsets_are_converted_to_utc(self):
+        """Test timestamps with an offset are shifted to UTC."""
+        parser = TimestampParser()
+        
+        assert parser.normalize('2025-10-19T08:00:00+01:00') == '2025-10-19T07:00:00Z'
+    
+    def test_unparseable_values(self):
+        """Test values matching no format give None."""
+        parser = TimestampParser()
+        
+        assert parser.normalize('t') is None
+        assert parser.normalize('2025-13-45') is None
+        assert parser.normalize(None) is None
+    
+    def test_format_is_remembered_per_pattern(self, monkeypatch):
+        """Test a pattern's format is sniffed once and reused."""
+        parser = TimestampParser()
+        parser.parse('2025/10/19T08:25Z')
+        
+        def fail(text, pattern):
+            raise AssertionError("format sniffed again")
+        
+        monkeypatch.setattr(parser, '_sniff', fail)
+        assert parser.normalize('2024/01/02T17:45Z') == '2024-01-02T17:45:00Z'
+        assert parser.parse('2024/13/02T17:45Z') is None
+    
+    def test_bad_value_does_not_hide_format(self):
+        """Test an invalid first value does not poison its pattern."""
+        parser = TimestampParser()
+        
+        assert parser.parse('2025/13/19T08:25Z') is None
+        assert parser.normalize('2025/10/19T08:25Z') == '2025-10-19T08:25:00Z'
+    
+    @pytest.mark.parametrize('granularity,expected', [
+        ('hour', '2025-10-19T08:00:00Z'),
+        ('day', '2025-10-19')
+    ])
+    def test_bucket(self, granularity, expected):
+        """Test timestamps are truncated to their hour or day."""
+        parser = TimestampParser()
+        
+        assert parser.bucket('2025-10-19T08:25:00Z', granularity) == expected
+        assert parser.bucket('2025/10/19T08:25Z', granularity) == expected
+        assert parser.bucket('soon', granularity) is None
+    
+    def test_ambiguous_dates_follow_date_order(self):
+        """Test dates valid either way are read in the configured order."""
+        month_first = TimestampParser()
+        day_first = TimestampParser(day_first=True)
+        
+        assert month_first.normalize('02/03/2025 10:00') == '2025-02-03T10:00:00Z'
+        assert day_first.normalize('02/03/2025 10:00') == '2025-03-02T10:00:00Z'
+        assert month_first.normalize('19/10/2025 10:00') == '2025-10-19T10:00:00Z'
+    
+    def test_ambiguous_pattern_is_settled_by_later_value(self):
+        """Test an ambiguous pattern is only remembered once a value settles it."""
+        parser = TimestampParser()
+        
+        assert parser.normalize('02/03/2025') == '2025-02-03T00:00:00Z'
+        assert parser._patterns == {}
+        assert parser.normalize('19/10/2025') == '2025-10-19T00:00:00Z'
+        assert parser.normalize('02/03/2025') == '2025-03-02T00:00:00Z'
\ No newline at end of file
@@ -1,5 +1,6 @@
 import pytest
 from order_pipeline.transformer import Transformer
+from order_pipeline.validator import Validator
 
 
 class TestTransformer:
@@ -76,4 +77,28 @@ class TestTransformer:
         assert transformer._to_numeric('$15.99') == 15.99
         assert transformer._to_numeric('N2000') == 2000.0
         assert transformer._to_numeric('45 dollars') == 45.0
-        assert transformer._to_numeric('5usd') == 5.0
\ No newline at end of file
+        assert transformer._to_numeric('5usd') == 5.0
+    
+    def test_transform_parsed_matches_transform(self, sample_orders_with_edge_cases):
+        """Test reusing validator-parsed numbers gives the same result."""
+        transformer = Transformer()
+        
+        parsed = Validator().iter_validate_parsed(sample_orders_with_edge_cases)
+        result = list(transformer.iter_transform_parsed(parsed))
+        
+        assert result == transformer.transform(sample_orders_with_edge_cases)
+    
+    def test_timestamps_are_normalized(self, sample_orders_with_edge_cases):
+        """Test mixed timestamp formats become ISO 8601 UTC."""
+        orders = sample_orders_with_edge_cases + [
+            dict(sample_orders_with_edge_cases[0], timestamp='whenever')
+        ]
+        
+        result = Transformer().transform(orders)
+        
+        assert [order['timestamp'] for order in result] == [
+            '2025-10-19T08:00:00Z',
+            '2025-10-19T08:05:00Z',
+            '2025-10-19T08:25:00Z',
+            'whenever'
+        ]
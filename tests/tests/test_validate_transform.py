@@ -0,0 +1,34 @@
+import copy
+from order_pipeline.validator import Validator
+from order_pipeline.transformer import Transformer
+from order_pipeline.validate_transform import ValidateTransform
+
+
+class TestValidateTransform:
+    """Tests for the fused ValidateTransform stage."""
+    
+    def test_matches_two_stage_path(self, sample_orders_with_edge_cases):
+        """Test fused output and summary match Validator then Transformer."""
+        orders = sample_orders_with_edge_cases + [
+            {'order_id': 'ORD004', 'item': 'Bad', 'quantity': 0},
+            {'order_id': 'ORD005', 'timestamp': 't', 'item': 'Bad', 'quantity': 1,
+             'price': 'N/A', 'payment_status': 'paid', 'total': 5}
+        ]
+        validator = Validator()
+        expected = Transformer().transform(validator.validate(copy.deepcopy(orders)))
+        
+        stage = ValidateTransform()
+        result = stage.run(copy.deepcopy(orders))
+        
+        assert result == expected
+        assert stage.get_summary() == validator.get_summary()
+        assert stage.validator.invalid_rows == validator.invalid_rows
+    
+    def test_transforms_in_place(self, sample_valid_order):
+        """Test valid orders are transformed without copying."""
+        stage = ValidateTransform()
+        
+        result = stage.run([sample_valid_order])
+        
+        assert result[0] is sample_valid_order
+        assert sample_valid_order['quantity'] == 2.0
\ No newline at end of file
@@ -87,4 +87,15 @@ class TestValidator:
         summary = validator.get_summary()
         
         assert summary['total_rows'] == 3
-        assert summary['valid_rows'] == 3
\ No newline at end of file
+        assert summary['valid_rows'] == 3
+    
+    def test_max_invalid_rows(self):
+        """Test a capped validator keeps the first invalid rows but counts them all."""
+        orders = [{'order_id': str(i), 'quantity': -1} for i in range(5)]
+        validator = Validator(max_invalid_rows=2)
+        validator.validate(orders)
+        validator.merge({'total_rows': 1, 'valid_rows': 0, 'invalid_rows': 1,
+                         'reasons': {'Bad': 1}}, [{'index': 0, 'order': {}, 'reason': 'Bad'}], 5)
+        
+        assert [row['index'] for row in validator.invalid_rows] == [0, 1]
+        assert validator.get_summary()['invalid_rows'] == 6
\ No newline at end of file